@@ -0,0 +1,78 @@
+"""time entry daily rollups"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20241215_000002"
+down_revision: Union[str, None] = "20241201_000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "time_entry_daily_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "user_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "project_id",
+            sa.Integer(),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("total_minutes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("billable_minutes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "billable_amount", sa.Numeric(18, 6), nullable=False, server_default="0"
+        ),
+        sa.Column("entry_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.UniqueConstraint(
+            "user_id", "project_id", "day", name="uq_time_entry_rollups_key"
+        ),
+    )
+    op.create_index(
+        "ix_time_entry_rollups_user_day", "time_entry_daily_rollups", ["user_id", "day"]
+    )
+    op.execute(
+        """
+        INSERT INTO time_entry_daily_rollups
+            (user_id, project_id, day, total_minutes, billable_minutes,
+             billable_amount, entry_count)
+        SELECT
+            user_id,
+            project_id,
+            date(started_at),
+            sum(duration_minutes),
+            coalesce(sum(CASE WHEN is_billable THEN duration_minutes ELSE 0 END), 0),
+            coalesce(
+                sum(
+                    CASE WHEN is_billable
+                    THEN round(duration_minutes * hourly_rate / 60, 6) END
+                ),
+                0
+            ),
+            count(id)
+        FROM time_entries
+        GROUP BY user_id, project_id, date(started_at)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_time_entry_rollups_user_day", table_name="time_entry_daily_rollups")
+    op.drop_table("time_entry_daily_rollups")
@@ -0,0 +1,28 @@
+"""report export content keys"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20250112_000005"
+down_revision: Union[str, None] = "20250105_000004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "report_exports", sa.Column("content_key", sa.String(length=64), nullable=True)
+    )
+    op.create_index(
+        "ix_report_exports_user_content_key",
+        "report_exports",
+        ["user_id", "content_key"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_report_exports_user_content_key", table_name="report_exports")
+    op.drop_column("report_exports", "content_key")
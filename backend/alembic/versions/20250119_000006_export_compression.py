@@ -0,0 +1,22 @@
+"""report export compression"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20250119_000006"
+down_revision: Union[str, None] = "20250112_000005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "report_exports", sa.Column("compression", sa.String(length=8), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("report_exports", "compression")
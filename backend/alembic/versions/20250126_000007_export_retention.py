@@ -0,0 +1,28 @@
+"""report export retention"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20250126_000007"
+down_revision: Union[str, None] = "20250119_000006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("report_exports", sa.Column("size_bytes", sa.BigInteger(), nullable=True))
+    op.add_column(
+        "report_exports", sa.Column("last_accessed_at", sa.DateTime(), nullable=True)
+    )
+    op.create_index(
+        "ix_report_exports_status_user", "report_exports", ["status", "user_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_report_exports_status_user", table_name="report_exports")
+    op.drop_column("report_exports", "last_accessed_at")
+    op.drop_column("report_exports", "size_bytes")
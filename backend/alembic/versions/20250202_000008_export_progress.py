@@ -0,0 +1,36 @@
+"""report export progress"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20250202_000008"
+down_revision: Union[str, None] = "20250126_000007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("report_exports", sa.Column("rows_total", sa.BigInteger(), nullable=True))
+    op.add_column(
+        "report_exports",
+        sa.Column("rows_processed", sa.BigInteger(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "report_exports",
+        sa.Column("bytes_written", sa.BigInteger(), server_default="0", nullable=False),
+    )
+    op.add_column("report_exports", sa.Column("started_at", sa.DateTime(), nullable=True))
+    op.add_column("report_exports", sa.Column("finished_at", sa.DateTime(), nullable=True))
+    op.add_column("report_exports", sa.Column("eta_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("report_exports", "eta_at")
+    op.drop_column("report_exports", "finished_at")
+    op.drop_column("report_exports", "started_at")
+    op.drop_column("report_exports", "bytes_written")
+    op.drop_column("report_exports", "rows_processed")
+    op.drop_column("report_exports", "rows_total")
@@ -0,0 +1,23 @@
+"""time entry keyset pagination index"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "20250209_000009"
+down_revision: Union[str, None] = "20250202_000008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_time_entries_user_started_id",
+        "time_entries",
+        ["user_id", "started_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_time_entries_user_started_id", table_name="time_entries")
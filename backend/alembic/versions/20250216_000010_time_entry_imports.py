@@ -0,0 +1,50 @@
+"""time entry imports"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20250216_000010"
+down_revision: Union[str, None] = "20250209_000009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "time_entry_imports",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "user_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("format", sa.String(length=8), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=True),
+        sa.Column("file_path", sa.String(length=1024), nullable=True),
+        sa.Column("status", sa.String(length=16), nullable=False, server_default="pending"),
+        sa.Column("task_id", sa.String(length=128), nullable=True),
+        sa.Column("rows_processed", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("rows_imported", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("rows_failed", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("batches_completed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("projects_created", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("errors", sa.JSON(), nullable=False, server_default="[]"),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_time_entry_imports_user_id", "time_entry_imports", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_time_entry_imports_user_id", table_name="time_entry_imports")
+    op.drop_table("time_entry_imports")
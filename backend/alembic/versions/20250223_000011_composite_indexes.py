@@ -0,0 +1,37 @@
+"""composite indexes for hot list and report queries"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "20250223_000011"
+down_revision: Union[str, None] = "20250216_000010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_time_entries_user_project_started",
+        "time_entries",
+        ["user_id", "project_id", "started_at"],
+        postgresql_include=["duration_minutes", "is_billable", "hourly_rate"],
+    )
+    op.create_index(
+        "ix_projects_owner_archived", "projects", ["owner_id", "is_archived"]
+    )
+    op.create_index(
+        "ix_reminders_active_user",
+        "reminders",
+        ["user_id"],
+        postgresql_where=sa.text("is_active IS true"),
+        sqlite_where=sa.text("is_active IS 1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reminders_active_user", table_name="reminders")
+    op.drop_index("ix_projects_owner_archived", table_name="projects")
+    op.drop_index("ix_time_entries_user_project_started", table_name="time_entries")
@@ -0,0 +1,34 @@
+"""gist index on time entry periods for overlap checks"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "20250302_000012"
+down_revision: Union[str, None] = "20250223_000011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Kept in sync with PERIOD_SQL in app/repositories/time_entry_repository.py.
+PERIOD_SQL = (
+    "tsrange(started_at, greatest(started_at, coalesce(ended_at, "
+    "started_at + duration_minutes * interval '1 minute')), '[)')"
+)
+
+
+def upgrade() -> None:
+    # Other databases fall back to the (user_id, started_at) btree indexes.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        "CREATE INDEX ix_time_entries_user_period ON time_entries "
+        f"USING gist (user_id, ({PERIOD_SQL}))"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_time_entries_user_period")
@@ -0,0 +1,45 @@
+"""tombstones and updated_at indexes for delta sync"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20250309_000013"
+down_revision: Union[str, None] = "20250302_000012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tombstones",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "user_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("scope", sa.String(length=32), nullable=False),
+        sa.Column("record_id", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_tombstones_user_created", "tombstones", ["user_id", "created_at"])
+    op.create_index("ix_time_entries_user_updated", "time_entries", ["user_id", "updated_at"])
+    op.create_index("ix_projects_owner_updated", "projects", ["owner_id", "updated_at"])
+    op.create_index("ix_reminders_user_updated", "reminders", ["user_id", "updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reminders_user_updated", table_name="reminders")
+    op.drop_index("ix_projects_owner_updated", table_name="projects")
+    op.drop_index("ix_time_entries_user_updated", table_name="time_entries")
+    op.drop_index("ix_tombstones_user_created", table_name="tombstones")
+    op.drop_table("tombstones")
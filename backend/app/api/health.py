@@ -1,4 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import get_current_superuser
+from app.services.report_cache import get_report_cache
 
 router = APIRouter()
 
@@ -7,3 +10,9 @@ router = APIRouter()
 async def ping() -> dict[str, str]:
     """Simple availability endpoint."""
     return {"status": "ok"}
+
+
+@router.get("/report-cache", dependencies=[Depends(get_current_superuser)])
+async def report_cache_stats() -> dict[str, int]:
+    """Hit/miss/eviction counters of this process's report cache."""
+    return get_report_cache().stats()
@@ -1,22 +1,25 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_async_session, get_current_user
 from app.models import User
 from app.schemas.integration import IntegrationCreate, IntegrationRead
 from app.services.integration_service import IntegrationService
+from app.utils.serialization import rows_response, select_fields
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[IntegrationRead])
 async def list_integrations(
+    fields: str | None = Query(default=None),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_async_session),
-) -> list[IntegrationRead]:
+) -> Response:
+    selected = select_fields(IntegrationRead, fields)
     service = IntegrationService(session)
-    tokens = await service.list_tokens(current_user)
-    return [IntegrationRead.model_validate(token) for token in tokens]
+    tokens = await service.list_tokens(current_user, selected)
+    return rows_response(IntegrationRead, selected, tokens)
 
 
 @router.post("/", response_model=IntegrationRead, status_code=status.HTTP_201_CREATED)
@@ -1,22 +1,32 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_async_session, get_current_user
 from app.models import User
 from app.schemas.project import ProjectCreate, ProjectRead, ProjectUpdate
 from app.services.project_service import ProjectService
+from app.utils.http import collection_headers, not_modified
+from app.utils.serialization import rows_response, select_fields
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[ProjectRead])
 async def list_projects(
+    request: Request,
+    fields: str | None = Query(default=None),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_async_session),
-) -> list[ProjectRead]:
+) -> Response:
+    selected = select_fields(ProjectRead, fields)
     service = ProjectService(session)
-    projects = await service.list_for_user(current_user)
-    return [ProjectRead.model_validate(project) for project in projects]
+    headers = collection_headers(
+        request, current_user.id, await service.list_version(current_user)
+    )
+    if cached := not_modified(request, headers):
+        return cached
+    projects = await service.list_for_user(current_user, selected)
+    return rows_response(ProjectRead, selected, projects, headers)
 
 
 @router.post("/", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
@@ -1,22 +1,32 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_async_session, get_current_user
 from app.models import User
 from app.schemas.reminder import ReminderCreate, ReminderRead, ReminderUpdate
 from app.services.reminder_service import ReminderService
+from app.utils.http import collection_headers, not_modified
+from app.utils.serialization import rows_response, select_fields
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[ReminderRead])
 async def list_reminders(
+    request: Request,
+    fields: str | None = Query(default=None),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_async_session),
-) -> list[ReminderRead]:
+) -> Response:
+    selected = select_fields(ReminderRead, fields)
     service = ReminderService(session)
-    reminders = await service.list_for_user(current_user)
-    return [ReminderRead.model_validate(item) for item in reminders]
+    headers = collection_headers(
+        request, current_user.id, await service.list_version(current_user)
+    )
+    if cached := not_modified(request, headers):
+        return cached
+    reminders = await service.list_for_user(current_user, selected)
+    return rows_response(ReminderRead, selected, reminders, headers)
 
 
 @router.post("/", response_model=ReminderRead, status_code=status.HTTP_201_CREATED)
@@ -1,13 +1,46 @@
-from fastapi import APIRouter, Depends, status
+from collections.abc import AsyncIterator
+from datetime import date
+from pathlib import Path
+
+import anyio
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_async_session, get_current_user
-from app.models import User
-from app.schemas.report import ExportRead, ExportRequest, ReportFilters, ReportResponse
+from app.core.config import get_settings
+from app.core.db import SessionLocal
+from app.models import ExportFormat, User
+from app.schemas.report import (
+    ExportRead,
+    ExportRequest,
+    ReportBatchRequest,
+    ReportBatchResponse,
+    ReportFilters,
+    ReportResponse,
+)
+from app.services.exporters import (
+    iter_detailed_csv,
+    iter_detailed_ndjson,
+    iter_summary_csv,
+    iter_summary_ndjson,
+    open_export_binary,
+)
 from app.services.report_service import ReportService
+from app.utils.http import CHUNK_SIZE, accepts_encoding, file_download_response
 
+settings = get_settings()
 router = APIRouter()
 
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.PDF: "application/pdf",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
 
 @router.post("/summary", response_model=ReportResponse)
 async def summarize_reports(
@@ -19,6 +52,17 @@ async def summarize_reports(
     return await service.summarize(current_user, payload)
 
 
+@router.post("/summary:batch", response_model=ReportBatchResponse)
+async def summarize_reports_batch(
+    payload: ReportBatchRequest,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> ReportBatchResponse:
+    service = ReportService(session)
+    results = await service.summarize_many(current_user, payload.reports)
+    return ReportBatchResponse(results=results)
+
+
 @router.post("/export", response_model=ExportRead, status_code=status.HTTP_202_ACCEPTED)
 async def create_export(
     payload: ExportRequest,
@@ -30,6 +74,92 @@ async def create_export(
     return ExportRead.model_validate(export)
 
 
+async def _stream_export_chunks(
+    user: User, payload: ExportRequest
+) -> AsyncIterator[str]:
+    # The request-scoped session is closed before the body is sent, so the
+    # stream runs on its own session.
+    async with SessionLocal() as session:
+        service = ReportService(session)
+        ndjson = payload.format == ExportFormat.NDJSON
+        if payload.detailed:
+            batches = service.stream_entries(user, payload, settings.export_stream_batch_size)
+            encode = iter_detailed_ndjson if ndjson else iter_detailed_csv
+            async for chunk in encode(batches):
+                yield chunk
+        else:
+            report = await service.summarize(user, payload)
+            for chunk in (iter_summary_ndjson if ndjson else iter_summary_csv)(report):
+                yield chunk
+
+
+async def _download_export(
+    export_format: ExportFormat,
+    project_ids: list[int] | None,
+    date_from: date,
+    date_to: date,
+    detailed: bool,
+    current_user: User,
+    session: AsyncSession,
+) -> Response:
+    try:
+        payload = ExportRequest(
+            project_ids=project_ids,
+            date_from=date_from,
+            date_to=date_to,
+            format=export_format,
+            detailed=detailed,
+        )
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from None
+
+    service = ReportService(session)
+    estimated_rows = await service.estimate_export_rows(current_user, payload)
+    if estimated_rows > settings.sync_export_max_rows:
+        export = await service.request_export(current_user, payload)
+        return JSONResponse(
+            ExportRead.model_validate(export).model_dump(mode="json"),
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"Location": f"{settings.api_prefix}/reports/exports/{export.id}"},
+        )
+
+    return StreamingResponse(
+        _stream_export_chunks(current_user, payload),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="report.{export_format.value}"'
+        },
+    )
+
+
+@router.get("/export.csv", responses={202: {"model": ExportRead}})
+async def download_export_csv(
+    project_ids: list[int] | None = Query(default=None),
+    date_from: date = Query(),
+    date_to: date = Query(),
+    detailed: bool = Query(default=False),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    return await _download_export(
+        ExportFormat.CSV, project_ids, date_from, date_to, detailed, current_user, session
+    )
+
+
+@router.get("/export.ndjson", responses={202: {"model": ExportRead}})
+async def download_export_ndjson(
+    project_ids: list[int] | None = Query(default=None),
+    date_from: date = Query(),
+    date_to: date = Query(),
+    detailed: bool = Query(default=False),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    return await _download_export(
+        ExportFormat.NDJSON, project_ids, date_from, date_to, detailed, current_user, session
+    )
+
+
 @router.get("/exports", response_model=list[ExportRead])
 async def list_exports(
     current_user: User = Depends(get_current_user),
@@ -49,3 +179,42 @@ async def get_export(
     service = ReportService(session)
     export = await service.get_export(current_user, export_id)
     return ExportRead.model_validate(export)
+
+
+async def _iter_decoded(path: Path, compression: str) -> AsyncIterator[bytes]:
+    handle = await anyio.to_thread.run_sync(open_export_binary, path, compression)
+    try:
+        while chunk := await anyio.to_thread.run_sync(handle.read, CHUNK_SIZE):
+            yield chunk
+    finally:
+        handle.close()
+
+
+@router.get("/exports/{export_id}/download")
+async def download_stored_export(
+    export_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    service = ReportService(session)
+    export, path = await service.get_export_file(current_user, export_id)
+    export_format = ExportFormat(export.format)
+    media_type = EXPORT_MEDIA_TYPES[export_format]
+    filename = f"report_{export.id}.{export_format.value}"
+
+    compression = export.compression
+    if compression and not accepts_encoding(request.headers.get("accept-encoding"), compression):
+        # Clients that cannot decode the stored codec get the plain body
+        # without range support rather than a file they cannot read.
+        return StreamingResponse(
+            _iter_decoded(path, compression),
+            media_type=media_type,
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "Vary": "Accept-Encoding",
+            },
+        )
+    return file_download_response(
+        request, path, media_type=media_type, filename=filename, content_encoding=compression
+    )
@@ -8,6 +8,7 @@ from app.api import (
     reminders,
     integrations,
     health,
+    sync,
 )
 
 api_router = APIRouter()
@@ -18,8 +19,10 @@ api_router.include_router(projects.router, prefix="/projects", tags=["projects"]
 api_router.include_router(
     time_entries.router, prefix="/time-entries", tags=["time-entries"]
 )
+api_router.include_router(time_entries.bulk_router, tags=["time-entries"])
 api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
 api_router.include_router(reminders.router, prefix="/reminders", tags=["reminders"])
 api_router.include_router(
     integrations.router, prefix="/integrations", tags=["integrations"]
 )
+api_router.include_router(sync.router, prefix="/sync", tags=["sync"])
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, Query
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_async_session, get_current_user
+from app.models import User
+from app.schemas.project import ProjectRead
+from app.schemas.reminder import ReminderRead
+from app.schemas.sync import SyncChanges
+from app.schemas.time_entry import TimeEntryRead
+from app.services.sync_service import SyncService
+from app.utils.serialization import JSONBytesResponse, dump_object, dump_rows, select_fields
+
+router = APIRouter()
+
+
+@router.get("/changes", response_model=SyncChanges)
+async def get_changes(
+    since: str | None = Query(default=None),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> JSONBytesResponse:
+    service = SyncService(session)
+    result = await service.changes(current_user, since)
+    # A full snapshot is the whole account, so each collection is encoded in
+    # one TypeAdapter pass rather than through a model per row.
+    body = dump_object(
+        {
+            "token": to_json(result.token),
+            "full": to_json(result.full),
+            "time_entries": dump_rows(
+                TimeEntryRead, select_fields(TimeEntryRead, None), result.time_entries
+            ),
+            "projects": dump_rows(
+                ProjectRead, select_fields(ProjectRead, None), result.projects
+            ),
+            "reminders": dump_rows(
+                ReminderRead, select_fields(ReminderRead, None), result.reminders
+            ),
+            "deleted": result.deleted.model_dump_json().encode(),
+        }
+    )
+    return JSONBytesResponse(body)
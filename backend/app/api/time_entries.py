@@ -1,54 +1,130 @@
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_async_session, get_current_user
-from app.models import User
-from app.schemas.time_entry import TimeEntryCreate, TimeEntryRead, TimeEntryUpdate
-from app.services.time_entry_service import TimeEntryService
+from app.models import ImportFormat, User
+from app.schemas.time_entry import (
+    OverlapPolicy,
+    TimeEntryBulkRequest,
+    TimeEntryBulkResponse,
+    TimeEntryCreate,
+    TimeEntryImportRead,
+    TimeEntryOverlap,
+    TimeEntryRead,
+    TimeEntryUpdate,
+)
+from app.services.time_entry_import_service import TimeEntryImportService
+from app.services.time_entry_service import OVERLAP_HEADER, TimeEntryService
+from app.utils.http import collection_headers, not_modified
+from app.utils.serialization import rows_response, select_fields
 
 router = APIRouter()
+# Mounted without the /time-entries prefix: routes must start with "/", so the
+# ":bulk" custom method is spelled out in full here.
+bulk_router = APIRouter()
 
 
 @router.get("/", response_model=list[TimeEntryRead])
 async def list_time_entries(
+    request: Request,
     project_ids: list[int] | None = Query(default=None),
     date_from: datetime | None = Query(default=None),
     date_to: datetime | None = Query(default=None),
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: str | None = Query(default=None),
+    fields: str | None = Query(default=None),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_async_session),
-) -> list[TimeEntryRead]:
+) -> Response:
+    selected = select_fields(TimeEntryRead, fields)
     service = TimeEntryService(session)
-    entries = await service.list_for_user(
+    headers = collection_headers(
+        request, current_user.id, await service.list_version(current_user)
+    )
+    if cached := not_modified(request, headers):
+        return cached
+    entries, next_cursor = await service.list_for_user(
         current_user,
+        selected,
         project_ids=project_ids,
         date_from=date_from,
         date_to=date_to,
+        limit=limit,
+        cursor=cursor,
     )
-    return [TimeEntryRead.model_validate(entry) for entry in entries]
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return rows_response(TimeEntryRead, selected, entries, headers)
 
 
 @router.post("/", response_model=TimeEntryRead, status_code=status.HTTP_201_CREATED)
 async def create_time_entry(
+    response: Response,
     payload: TimeEntryCreate,
+    on_overlap: OverlapPolicy = Query(default="allow"),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_async_session),
 ) -> TimeEntryRead:
     service = TimeEntryService(session)
-    entry = await service.create(current_user, payload)
+    entry, overlaps = await service.create(current_user, payload, on_overlap=on_overlap)
+    if overlaps:
+        response.headers[OVERLAP_HEADER] = ",".join(map(str, overlaps))
     return TimeEntryRead.model_validate(entry)
 
 
+@router.get("/overlaps", response_model=list[TimeEntryOverlap])
+async def list_time_entry_overlaps(
+    date_from: datetime | None = Query(default=None),
+    date_to: datetime | None = Query(default=None),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> list[TimeEntryOverlap]:
+    service = TimeEntryService(session)
+    return await service.overlap_report(current_user, date_from, date_to)
+
+
+@router.post(
+    "/imports", response_model=TimeEntryImportRead, status_code=status.HTTP_202_ACCEPTED
+)
+async def create_time_entry_import(
+    file: UploadFile = File(...),
+    format: ImportFormat | None = Query(default=None),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> TimeEntryImportRead:
+    service = TimeEntryImportService(session)
+    record = await service.create_import(current_user, file, format)
+    return TimeEntryImportRead.model_validate(record)
+
+
+@router.get("/imports/{import_id}", response_model=TimeEntryImportRead)
+async def get_time_entry_import(
+    import_id: int,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> TimeEntryImportRead:
+    service = TimeEntryImportService(session)
+    record = await service.get_import(current_user, import_id)
+    return TimeEntryImportRead.model_validate(record)
+
+
 @router.patch("/{entry_id}", response_model=TimeEntryRead)
 async def update_time_entry(
+    response: Response,
     entry_id: int,
     payload: TimeEntryUpdate,
+    on_overlap: OverlapPolicy = Query(default="allow"),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_async_session),
 ) -> TimeEntryRead:
     service = TimeEntryService(session)
-    entry = await service.update(current_user, entry_id, payload)
+    entry, overlaps = await service.update(
+        current_user, entry_id, payload, on_overlap=on_overlap
+    )
+    if overlaps:
+        response.headers[OVERLAP_HEADER] = ",".join(map(str, overlaps))
     return TimeEntryRead.model_validate(entry)
 
 
@@ -60,3 +136,14 @@ async def delete_time_entry(
 ) -> None:
     service = TimeEntryService(session)
     await service.delete(current_user, entry_id)
+
+
+@bulk_router.post("/time-entries:bulk", response_model=TimeEntryBulkResponse)
+async def bulk_time_entries(
+    payload: TimeEntryBulkRequest,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> TimeEntryBulkResponse:
+    service = TimeEntryService(session)
+    results = await service.bulk_apply(current_user, payload.operations)
+    return TimeEntryBulkResponse(results=results)
@@ -14,7 +14,19 @@ celery_app.conf.beat_schedule = {
     "dispatch-reminders": {
         "task": "app.celery.tasks.dispatch_reminders",
         "schedule": 300.0,
-    }
+    },
+    "evict-report-exports": {
+        "task": "app.celery.tasks.evict_report_exports",
+        "schedule": settings.export_cleanup_interval_seconds,
+    },
+    "fail-stale-report-exports": {
+        "task": "app.celery.tasks.fail_stale_report_exports",
+        "schedule": settings.export_cleanup_interval_seconds,
+    },
+    "purge-sync-tombstones": {
+        "task": "app.celery.tasks.purge_sync_tombstones",
+        "schedule": settings.sync_tombstone_purge_interval_seconds,
+    },
 }
 if settings.environment == "test":
     celery_app.conf.task_always_eager = True
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+
+from app.core.db import get_engine, reset_engine_after_fork
+
+T = TypeVar("T")
+
+
+class WorkerRuntime:
+    """One event loop per worker process, shared by every task it runs.
+
+    The loop lives on a daemon thread so prefork, solo and thread pools can all
+    submit to it; the pooled connections of the shared engine stay bound to that
+    loop for the life of the process instead of one ``asyncio.run`` each.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self._pid == os.getpid():
+                return self._loop
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="celery-async-runtime", daemon=True
+            )
+            thread.start()
+            self._loop, self._thread, self._pid = loop, thread, os.getpid()
+            return loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        loop = self.start()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def stop(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or self._pid != os.getpid():
+                return
+            self._loop = self._thread = self._pid = None
+        asyncio.run_coroutine_threadsafe(get_engine().dispose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+runtime = WorkerRuntime()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    return runtime.run(coro)
+
+
+@worker_process_init.connect
+def _start_process_runtime(**_kwargs: Any) -> None:
+    reset_engine_after_fork()
+    runtime.start()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _stop_runtime(**_kwargs: Any) -> None:
+    runtime.stop()
@@ -1,59 +1,27 @@
 from __future__ import annotations
 
-import asyncio
 import logging
-from datetime import date
+from datetime import timedelta
 
 from app.celery.app import celery_app
+from app.celery.runtime import run_async
+from app.core.config import get_settings
 from app.core.db import SessionLocal
-from app.models import ReportExport, User
-from app.models.report import ExportFormat
 from app.repositories.reminder_repository import ReminderRepository
-from app.repositories.report_repository import ReportExportRepository
-from app.schemas.report import ReportFilters
-from app.services.exporters import export_to_csv, export_to_pdf
-from app.services.report_service import ReportService
+from app.repositories.rollup_repository import TimeEntryRollupRepository
+from app.repositories.tombstone_repository import TombstoneRepository
 
 logger = logging.getLogger(__name__)
-
-
-def _export_filename(export: ReportExport) -> str:
-    return f"report_{export.id}.{export.format}"
-
-
-async def _generate_export(export_id: int) -> None:
-    async with SessionLocal() as session:
-        repo = ReportExportRepository(session)
-        export = await repo.get(export_id)
-        if not export:
-            logger.error("Export %s not found", export_id)
-            return
-        user = await session.get(User, export.user_id)
-        if not user:
-            logger.error("User missing for export %s", export.id)
-            export.status = "failed"
-            await session.commit()
-            return
-
-        filters = ReportFilters(
-            project_ids=export.project_ids,
-            date_from=date.fromisoformat(export.date_from),
-            date_to=date.fromisoformat(export.date_to),
-        )
-        service = ReportService(session)
-        report = await service.summarize(user, filters)
-        if export.format == ExportFormat.CSV.value:
-            file_path = export_to_csv(report, _export_filename(export))
-        else:
-            file_path = export_to_pdf(report, _export_filename(export))
-        export.file_path = file_path
-        export.status = "completed"
-        await session.commit()
+settings = get_settings()
 
 
 @celery_app.task(name="app.celery.tasks.generate_report_export")
 def generate_report_export(export_id: int) -> None:
-    asyncio.run(_generate_export(export_id))
+    # Export jobs pull in the service layer (FastAPI, the export writers), so
+    # they are imported on first use rather than at worker startup.
+    from app.services.export_jobs import generate_export
+
+    run_async(generate_export(export_id))
 
 
 async def _enqueue_reminder(reminder_id: int) -> None:
@@ -69,7 +37,7 @@ async def _enqueue_reminder(reminder_id: int) -> None:
 
 @celery_app.task(name="app.celery.tasks.enqueue_reminder")
 def enqueue_reminder(reminder_id: int) -> None:
-    asyncio.run(_enqueue_reminder(reminder_id))
+    run_async(_enqueue_reminder(reminder_id))
 
 
 async def _dispatch_active_reminders() -> None:
@@ -84,4 +52,51 @@ async def _dispatch_active_reminders() -> None:
 
 @celery_app.task(name="app.celery.tasks.dispatch_reminders")
 def dispatch_reminders() -> None:
-    asyncio.run(_dispatch_active_reminders())
+    run_async(_dispatch_active_reminders())
+
+
+async def _rebuild_time_entry_rollups(user_id: int | None) -> None:
+    async with SessionLocal() as session:
+        await TimeEntryRollupRepository(session).rebuild(user_id)
+        await session.commit()
+    logger.info("Rebuilt time entry rollups for %s", user_id or "all users")
+
+
+@celery_app.task(name="app.celery.tasks.rebuild_time_entry_rollups")
+def rebuild_time_entry_rollups(user_id: int | None = None) -> None:
+    run_async(_rebuild_time_entry_rollups(user_id))
+
+
+async def _purge_sync_tombstones() -> None:
+    async with SessionLocal() as session:
+        repo = TombstoneRepository(session)
+        retention = timedelta(days=settings.sync_tombstone_retention_days)
+        purged = await repo.purge_before(await repo.database_now() - retention)
+        await session.commit()
+    logger.info("Purged %s sync tombstones", purged)
+
+
+@celery_app.task(name="app.celery.tasks.purge_sync_tombstones")
+def purge_sync_tombstones() -> None:
+    run_async(_purge_sync_tombstones())
+
+
+@celery_app.task(name="app.celery.tasks.evict_report_exports")
+def evict_report_exports() -> None:
+    from app.services.export_jobs import evict_exports
+
+    run_async(evict_exports())
+
+
+@celery_app.task(name="app.celery.tasks.fail_stale_report_exports")
+def fail_stale_report_exports() -> None:
+    from app.services.export_jobs import fail_stale_exports
+
+    run_async(fail_stale_exports())
+
+
+@celery_app.task(name="app.celery.tasks.import_time_entries")
+def import_time_entries(import_id: int) -> None:
+    from app.services.import_jobs import import_time_entries as run_import
+
+    run_async(run_import(import_id))
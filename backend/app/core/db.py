@@ -1,12 +1,69 @@
 from collections.abc import AsyncGenerator
+from functools import lru_cache
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import get_settings
+from app.utils.dates import local_bucket
 
 settings = get_settings()
-engine = create_async_engine(settings.database_url, future=True, echo=False)
-SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+
+def _register_sqlite_functions(dbapi_connection, _connection_record) -> None:
+    dbapi_connection.create_function("tz_bucket", 3, local_bucket, deterministic=True)
+    # WAL lets export progress updates commit while a streamed read is open.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
+@lru_cache
+def get_engine() -> AsyncEngine:
+    """Create the process-wide engine on first use rather than at import."""
+    engine_options = {}
+    if settings.database_url.startswith("postgresql"):
+        engine_options = {
+            "pool_size": settings.database_pool_size,
+            "max_overflow": settings.database_max_overflow,
+            "pool_recycle": settings.database_pool_recycle_seconds,
+            "pool_pre_ping": True,
+        }
+    engine = create_async_engine(settings.database_url, future=True, echo=False, **engine_options)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", _register_sqlite_functions)
+    return engine
+
+
+def reset_engine_after_fork() -> None:
+    # Connections inherited from the parent across fork must not be reused (or
+    # closed) by the child.
+    if get_engine.cache_info().currsize:
+        get_engine().sync_engine.dispose(close=False)
+
+
+class _LazySessionMaker(async_sessionmaker[AsyncSession]):
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _LazySessionMaker(expire_on_commit=False, class_=AsyncSession)
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps ``from app.core.db import engine`` working without creating the
+    # engine at import time.
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -1,10 +1,23 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from app.api.router import api_router
 from app.core.config import get_settings
+from app.core.db import get_engine
 
 settings = get_settings()
 
-app = FastAPI(title="Dev Timesheets API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # The engine is created at startup rather than when app.core.db is imported.
+    engine = get_engine()
+    yield
+    await engine.dispose()
+
+
+app = FastAPI(title="Dev Timesheets API", version="0.1.0", lifespan=lifespan)
 
 app.include_router(api_router, prefix=settings.api_prefix)
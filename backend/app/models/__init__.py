@@ -1,9 +1,13 @@
 from app.models.base import Base
+from app.models.change_version import ChangeScope, ChangeVersion
 from app.models.integration import IntegrationToken
 from app.models.project import Project
 from app.models.reminder import Reminder
 from app.models.report import ExportFormat, ReportExport
 from app.models.time_entry import TimeEntry
+from app.models.time_entry_import import ImportFormat, TimeEntryImport
+from app.models.time_entry_rollup import TimeEntryDailyRollup
+from app.models.tombstone import Tombstone
 from app.models.user import User
 
 __all__ = [
@@ -11,8 +15,14 @@ __all__ = [
     "User",
     "Project",
     "TimeEntry",
+    "TimeEntryDailyRollup",
+    "TimeEntryImport",
+    "ImportFormat",
     "Reminder",
     "ReportExport",
     "ExportFormat",
     "IntegrationToken",
+    "ChangeVersion",
+    "ChangeScope",
+    "Tombstone",
 ]
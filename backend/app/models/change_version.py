@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from enum import Enum
+
+from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ChangeScope(str, Enum):
+    TIME_ENTRIES = "time_entries"
+    PROJECTS = "projects"
+    REMINDERS = "reminders"
+
+
+class ChangeVersion(Base):
+    __tablename__ = "change_versions"
+    __table_args__ = (
+        UniqueConstraint("user_id", "scope", name="uq_change_versions_user_scope"),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    scope: Mapped[str] = mapped_column(String(32), nullable=False)
+    version: Mapped[int] = mapped_column(default=0, nullable=False)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, String, Boolean
+from sqlalchemy import ForeignKey, Index, String, Boolean, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -8,6 +8,16 @@ from app.models.base import Base
 
 class Reminder(Base):
     __tablename__ = "reminders"
+    __table_args__ = (
+        Index("ix_reminders_user_updated", "user_id", "updated_at"),
+        # Only active reminders are ever listed or scheduled.
+        Index(
+            "ix_reminders_active_user",
+            "user_id",
+            postgresql_where=text("is_active IS true"),
+            sqlite_where=text("is_active IS 1"),
+        ),
+    )
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     label: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -16,3 +26,4 @@ class Reminder(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     user: Mapped["User"] = relationship(back_populates="reminders")
+
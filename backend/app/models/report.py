@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, JSON, String
+from sqlalchemy import BigInteger, Boolean, ForeignKey, Index, JSON, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -15,18 +16,35 @@ if TYPE_CHECKING:
 class ExportFormat(str, Enum):
     CSV = "csv"
     PDF = "pdf"
+    NDJSON = "ndjson"
+    PARQUET = "parquet"
 
 
 class ReportExport(Base):
     __tablename__ = "report_exports"
+    __table_args__ = (
+        Index("ix_report_exports_user_content_key", "user_id", "content_key"),
+        Index("ix_report_exports_status_user", "status", "user_id"),
+    )
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     project_ids: Mapped[list[int] | None] = mapped_column(JSON, nullable=True)
     date_from: Mapped[str] = mapped_column(String(32), nullable=False)
     date_to: Mapped[str] = mapped_column(String(32), nullable=False)
     format: Mapped[str] = mapped_column(String(8), nullable=False)
+    detailed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     status: Mapped[str] = mapped_column(String(16), default="pending", nullable=False)
     file_path: Mapped[str | None] = mapped_column(String(1024), nullable=True)
     task_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    content_key: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    compression: Mapped[str | None] = mapped_column(String(8), nullable=True)
+    size_bytes: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    last_accessed_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    rows_total: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    rows_processed: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    bytes_written: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    eta_at: Mapped[datetime | None] = mapped_column(nullable=True)
 
     user: Mapped["User"] = relationship(back_populates="report_exports")
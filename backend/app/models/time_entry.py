@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, Numeric, String
+from sqlalchemy import Boolean, ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -15,6 +15,18 @@ if TYPE_CHECKING:
 
 class TimeEntry(Base):
     __tablename__ = "time_entries"
+    __table_args__ = (
+        Index("ix_time_entries_user_started_id", "user_id", "started_at", "id"),
+        # Covers the report aggregates, so they can be index-only on PostgreSQL.
+        Index(
+            "ix_time_entries_user_project_started",
+            "user_id",
+            "project_id",
+            "started_at",
+            postgresql_include=["duration_minutes", "is_billable", "hourly_rate"],
+        ),
+        Index("ix_time_entries_user_updated", "user_id", "updated_at"),
+    )
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
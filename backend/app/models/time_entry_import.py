@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import JSON, BigInteger, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class TimeEntryImport(Base):
+    __tablename__ = "time_entry_imports"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    format: Mapped[str] = mapped_column(String(8), nullable=False)
+    filename: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    file_path: Mapped[str | None] = mapped_column(String(1024), nullable=True)
+    status: Mapped[str] = mapped_column(String(16), default="pending", nullable=False)
+    task_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    rows_processed: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    rows_imported: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    rows_failed: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    batches_completed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    projects_created: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    errors: Mapped[list[dict]] = mapped_column(JSON, default=list, nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(nullable=True)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, ForeignKey, Index, Numeric, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class TimeEntryDailyRollup(Base):
+    __tablename__ = "time_entry_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint("user_id", "project_id", "day", name="uq_time_entry_rollups_key"),
+        Index("ix_time_entry_rollups_user_day", "user_id", "day"),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    total_minutes: Mapped[int] = mapped_column(default=0, nullable=False)
+    billable_minutes: Mapped[int] = mapped_column(default=0, nullable=False)
+    billable_amount: Mapped[Decimal] = mapped_column(
+        Numeric(18, 6), default=Decimal("0"), nullable=False
+    )
+    entry_count: Mapped[int] = mapped_column(default=0, nullable=False)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class Tombstone(Base):
+    """Record of a hard delete, kept so sync clients can drop their copy."""
+
+    __tablename__ = "tombstones"
+    __table_args__ = (Index("ix_tombstones_user_created", "user_id", "created_at"),)
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    scope: Mapped[str] = mapped_column(String(32), nullable=False)
+    record_id: Mapped[int] = mapped_column(nullable=False)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Generic, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import RowMapping, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.base import Base
+from app.utils.dates import utc_naive
 
 ModelType = TypeVar("ModelType", bound=Base)
 
@@ -15,6 +18,14 @@ class Repository(Generic[ModelType]):
         self.session = session
         self.model = model
 
+    def dialect_insert(self):
+        # PostgreSQL and SQLite share the ON CONFLICT DO UPDATE upsert syntax.
+        if self.session.bind.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        return insert(self.model)
+
     async def get(self, obj_id: int) -> ModelType | None:
         return await self.session.get(self.model, obj_id)
 
@@ -25,6 +36,29 @@ class Repository(Generic[ModelType]):
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    def columns(self, fields: Sequence[str]) -> list:
+        return [getattr(self.model, field) for field in fields]
+
+    async def list_rows(
+        self, fields: Sequence[str], *criteria, order_by=()
+    ) -> Sequence[RowMapping]:
+        # Read-only projection: plain row mappings, nothing enters the identity map.
+        stmt = select(*self.columns(fields)).where(*criteria).order_by(*order_by)
+        result = await self.session.execute(stmt)
+        return result.mappings().all()
+
+    async def list_rows_changed_since(
+        self, fields: Sequence[str], since: datetime | None, *criteria
+    ) -> Sequence[RowMapping]:
+        if since is not None:
+            criteria = (*criteria, self.model.updated_at >= since)
+        return await self.list_rows(fields, *criteria)
+
+    async def database_now(self) -> datetime:
+        # The clock that stamps server-side created_at/updated_at defaults, as
+        # naive UTC to compare with those columns (asyncpg returns it aware).
+        return utc_naive(await self.session.scalar(select(func.now())))
+
     async def add(self, obj: ModelType) -> ModelType:
         self.session.add(obj)
         await self.session.flush()
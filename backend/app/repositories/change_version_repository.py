@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ChangeScope, ChangeVersion, User
+from app.repositories.base import Repository
+
+
+class ChangeVersionRepository(Repository[ChangeVersion]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, ChangeVersion)
+
+    async def bump(self, user_id: int, *scopes: ChangeScope) -> None:
+        await self.bump_many([user_id], *scopes)
+
+    async def bump_many(self, user_ids: Iterable[int], *scopes: ChangeScope) -> None:
+        rows = [
+            {"user_id": user_id, "scope": scope.value, "version": 1}
+            for user_id in user_ids
+            for scope in scopes
+        ]
+        if not rows:
+            return
+        stmt = self.dialect_insert().values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "scope"],
+            set_={"version": ChangeVersion.version + 1, "updated_at": func.now()},
+        )
+        await self.session.execute(stmt)
+
+    async def bump_all(self, *scopes: ChangeScope) -> None:
+        user_ids = await self.session.scalars(select(User.id))
+        await self.bump_many(user_ids.all(), *scopes)
+
+    async def get_versions(
+        self, user_id: int, *scopes: ChangeScope
+    ) -> dict[ChangeScope, int]:
+        stmt = select(ChangeVersion.scope, ChangeVersion.version).where(
+            ChangeVersion.user_id == user_id,
+            ChangeVersion.scope.in_([scope.value for scope in scopes]),
+        )
+        result = await self.session.execute(stmt)
+        found = dict(result.all())
+        return {scope: found.get(scope.value, 0) for scope in scopes}
+
+    async def get_version(self, user_id: int, scope: ChangeScope) -> int:
+        versions = await self.get_versions(user_id, scope)
+        return versions[scope]
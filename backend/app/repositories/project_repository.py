@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import RowMapping, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Project
@@ -11,12 +14,18 @@ class ProjectRepository(Repository[Project]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Project)
 
-    async def list_by_owner(self, owner_id: int) -> list[Project]:
-        stmt = select(Project).where(
-            Project.owner_id == owner_id, Project.is_archived.is_(False)
+    async def list_rows_by_owner(
+        self, owner_id: int, fields: Sequence[str]
+    ) -> Sequence[RowMapping]:
+        return await self.list_rows(
+            fields, Project.owner_id == owner_id, Project.is_archived.is_(False)
         )
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+
+    async def list_changed_rows(
+        self, owner_id: int, fields: Sequence[str], since: datetime | None
+    ) -> Sequence[RowMapping]:
+        # Archived projects are included so clients see them being archived.
+        return await self.list_rows_changed_since(fields, since, Project.owner_id == owner_id)
 
     async def get_by_ids(self, project_ids: list[int]) -> dict[int, Project]:
         if not project_ids:
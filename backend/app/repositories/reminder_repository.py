@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import RowMapping, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Reminder
@@ -11,12 +14,17 @@ class ReminderRepository(Repository[Reminder]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Reminder)
 
-    async def list_active_by_user(self, user_id: int) -> list[Reminder]:
-        stmt = select(Reminder).where(
-            Reminder.user_id == user_id, Reminder.is_active.is_(True)
+    async def list_active_rows_by_user(
+        self, user_id: int, fields: Sequence[str]
+    ) -> Sequence[RowMapping]:
+        return await self.list_rows(
+            fields, Reminder.user_id == user_id, Reminder.is_active.is_(True)
         )
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+
+    async def list_changed_rows(
+        self, user_id: int, fields: Sequence[str], since: datetime | None
+    ) -> Sequence[RowMapping]:
+        return await self.list_rows_changed_since(fields, since, Reminder.user_id == user_id)
 
     async def list_all_active(self) -> list[Reminder]:
         stmt = select(Reminder).where(Reminder.is_active.is_(True))
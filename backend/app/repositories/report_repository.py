@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from datetime import datetime
+
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import ReportExport
 from app.repositories.base import Repository
 
 
+IN_FLIGHT_STATUSES = ("pending", "processing")
+
+
 class ReportExportRepository(Repository[ReportExport]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, ReportExport)
@@ -15,3 +20,135 @@ class ReportExportRepository(Repository[ReportExport]):
         stmt = select(ReportExport).where(ReportExport.user_id == user_id).order_by(ReportExport.created_at.desc())
         result = await self.session.execute(stmt)
         return result.scalars().all()
+
+    async def list_reusable(
+        self, user_id: int, content_key: str, active_since: datetime
+    ) -> list[ReportExport]:
+        # Completed exports are candidates while their file lasts; pending and
+        # processing ones only while their claim or progress writes (which
+        # bump updated_at) are newer than ``active_since``.
+        stmt = (
+            select(ReportExport)
+            .where(
+                ReportExport.user_id == user_id,
+                ReportExport.content_key == content_key,
+                or_(
+                    ReportExport.status == "completed",
+                    and_(
+                        ReportExport.status.in_(IN_FLIGHT_STATUSES),
+                        ReportExport.updated_at >= active_since,
+                    ),
+                ),
+            )
+            .order_by(ReportExport.created_at.desc(), ReportExport.id.desc())
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def list_completed_before(self, cutoff: datetime) -> list[ReportExport]:
+        stmt = select(ReportExport).where(
+            ReportExport.status == "completed", ReportExport.created_at < cutoff
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def usage_over_quota(self, quota_bytes: int) -> list[tuple[int, int]]:
+        used = func.sum(ReportExport.size_bytes)
+        stmt = (
+            select(ReportExport.user_id, used)
+            .where(ReportExport.status == "completed")
+            .group_by(ReportExport.user_id)
+            .having(used > quota_bytes)
+        )
+        result = await self.session.execute(stmt)
+        return [(user_id, int(total)) for user_id, total in result.all()]
+
+    async def total_usage(self) -> int:
+        stmt = select(func.coalesce(func.sum(ReportExport.size_bytes), 0)).where(
+            ReportExport.status == "completed"
+        )
+        return int(await self.session.scalar(stmt))
+
+    async def list_least_recently_used(self, user_id: int | None = None) -> list[ReportExport]:
+        stmt = (
+            select(ReportExport)
+            .where(ReportExport.status == "completed")
+            .order_by(
+                func.coalesce(ReportExport.last_accessed_at, ReportExport.created_at),
+                ReportExport.id,
+            )
+        )
+        if user_id is not None:
+            stmt = stmt.where(ReportExport.user_id == user_id)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def update_progress(self, export_id: int, **values) -> None:
+        await self.session.execute(
+            update(ReportExport).where(ReportExport.id == export_id).values(**values)
+        )
+
+    async def set_status(self, export_ids: list[int], status: str) -> None:
+        await self.session.execute(
+            update(ReportExport).where(ReportExport.id.in_(export_ids)).values(status=status)
+        )
+
+    async def fail_stale_claims(self, active_since: datetime) -> list[int]:
+        """Fail processing exports with no claim or progress write since ``active_since``."""
+        result = await self.session.execute(
+            update(ReportExport)
+            .where(
+                ReportExport.status == "processing",
+                ReportExport.updated_at < active_since,
+            )
+            .values(status="failed", eta_at=None)
+            .returning(ReportExport.id)
+        )
+        return result.scalars().all()
+
+    async def claim_batch(self, export_id: int, limit: int) -> list[ReportExport]:
+        """Atomically move ``export_id`` and its coalescable siblings to processing.
+
+        Summary exports of the same user whose date ranges overlap the seed's are
+        claimed with it (oldest first, at most ``limit``); detailed exports are
+        claimed alone. Rows another worker already claimed are skipped.
+        """
+        seed = await self.get(export_id)
+        if not seed or seed.status != "pending":
+            return []
+        candidates = select(ReportExport.id).where(ReportExport.id == seed.id)
+        if not seed.detailed:
+            candidates = (
+                select(ReportExport.id)
+                .where(
+                    or_(
+                        ReportExport.id == seed.id,
+                        and_(
+                            ReportExport.user_id == seed.user_id,
+                            ReportExport.status == "pending",
+                            ReportExport.detailed.is_(False),
+                            ReportExport.date_from <= seed.date_to,
+                            ReportExport.date_to >= seed.date_from,
+                        ),
+                    )
+                )
+                .order_by(ReportExport.id != seed.id, ReportExport.created_at, ReportExport.id)
+                .limit(limit)
+            )
+        claimed = await self.session.execute(
+            update(ReportExport)
+            .where(ReportExport.id.in_(candidates.scalar_subquery()))
+            .where(ReportExport.status == "pending")
+            .values(status="processing")
+            .returning(ReportExport.id)
+        )
+        claimed_ids = claimed.scalars().all()
+        if not claimed_ids:
+            return []
+        result = await self.session.execute(
+            select(ReportExport)
+            .where(ReportExport.id.in_(claimed_ids))
+            .order_by(ReportExport.id != seed.id, ReportExport.created_at, ReportExport.id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalars().all()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import Date, case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ChangeScope, TimeEntry, TimeEntryDailyRollup
+from app.repositories.base import Repository
+from app.repositories.change_version_repository import ChangeVersionRepository
+
+AMOUNT_SCALE = 6
+AMOUNT_QUANTUM = Decimal(1).scaleb(-AMOUNT_SCALE)
+
+RollupKey = tuple[int, int, date]
+
+
+@dataclass
+class RollupDelta:
+    total_minutes: int = 0
+    billable_minutes: int = 0
+    billable_amount: Decimal = Decimal("0")
+    entry_count: int = 0
+
+
+def utc_day(value: datetime) -> date:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
+
+
+def entry_amount(duration_minutes: int, is_billable: bool, hourly_rate) -> Decimal:
+    if not is_billable or hourly_rate is None:
+        return Decimal("0")
+    amount = Decimal(duration_minutes) * Decimal(str(hourly_rate)) / 60
+    return amount.quantize(AMOUNT_QUANTUM, rounding=ROUND_HALF_UP)
+
+
+def collect_deltas(
+    entries: Iterable[TimeEntry], sign: int = 1, into: dict[RollupKey, RollupDelta] | None = None
+) -> dict[RollupKey, RollupDelta]:
+    """Fold entries into per (user, project, day) deltas; ``sign=-1`` removes them."""
+    deltas = into if into is not None else {}
+    for entry in entries:
+        key = (entry.user_id, entry.project_id, utc_day(entry.started_at))
+        delta = deltas.setdefault(key, RollupDelta())
+        delta.total_minutes += sign * entry.duration_minutes
+        if entry.is_billable:
+            delta.billable_minutes += sign * entry.duration_minutes
+        delta.billable_amount += sign * entry_amount(
+            entry.duration_minutes, entry.is_billable, entry.hourly_rate
+        )
+        delta.entry_count += sign
+    return deltas
+
+
+class TimeEntryRollupRepository(Repository[TimeEntryDailyRollup]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, TimeEntryDailyRollup)
+
+    def _upsert(self, rows: list[dict]):
+        stmt = self.dialect_insert().values(rows)
+        excluded = stmt.excluded
+        return stmt.on_conflict_do_update(
+            index_elements=["user_id", "project_id", "day"],
+            set_={
+                "total_minutes": TimeEntryDailyRollup.total_minutes + excluded.total_minutes,
+                "billable_minutes": TimeEntryDailyRollup.billable_minutes
+                + excluded.billable_minutes,
+                "billable_amount": TimeEntryDailyRollup.billable_amount
+                + excluded.billable_amount,
+                "entry_count": TimeEntryDailyRollup.entry_count + excluded.entry_count,
+                "updated_at": func.now(),
+            },
+        )
+
+    async def apply_deltas(self, deltas: dict[RollupKey, RollupDelta]) -> None:
+        rows = [
+            {
+                "user_id": user_id,
+                "project_id": project_id,
+                "day": day,
+                "total_minutes": delta.total_minutes,
+                "billable_minutes": delta.billable_minutes,
+                "billable_amount": delta.billable_amount,
+                "entry_count": delta.entry_count,
+            }
+            for (user_id, project_id, day), delta in deltas.items()
+            if any(
+                (
+                    delta.entry_count,
+                    delta.total_minutes,
+                    delta.billable_minutes,
+                    delta.billable_amount,
+                )
+            )
+        ]
+        if not rows:
+            return
+        await self.session.execute(self._upsert(rows))
+        if any(row["entry_count"] < 0 for row in rows):
+            user_ids = {row["user_id"] for row in rows}
+            await self.session.execute(
+                delete(TimeEntryDailyRollup).where(
+                    TimeEntryDailyRollup.user_id.in_(user_ids),
+                    TimeEntryDailyRollup.entry_count <= 0,
+                )
+            )
+
+    async def rebuild(self, user_id: int | None = None) -> None:
+        """Recompute rollups from the entries, for one user or everyone.
+
+        The affected users' time entry versions are bumped as well, so report
+        cache entries and export keys derived from the old rollups go stale.
+        """
+        clear = delete(TimeEntryDailyRollup)
+        source = select(
+            TimeEntry.user_id,
+            TimeEntry.project_id,
+            func.date(TimeEntry.started_at, type_=Date).label("day"),
+            func.sum(TimeEntry.duration_minutes),
+            func.coalesce(
+                func.sum(TimeEntry.duration_minutes).filter(TimeEntry.is_billable.is_(True)), 0
+            ),
+            func.coalesce(
+                func.sum(
+                    case(
+                        (
+                            TimeEntry.is_billable.is_(True),
+                            # Rounded per entry like entry_amount, so a rebuild
+                            # matches the incrementally maintained totals.
+                            func.round(
+                                TimeEntry.duration_minutes * TimeEntry.hourly_rate / 60,
+                                AMOUNT_SCALE,
+                            ),
+                        ),
+                    )
+                ),
+                0,
+            ),
+            func.count(TimeEntry.id),
+        )
+        if user_id is not None:
+            clear = clear.where(TimeEntryDailyRollup.user_id == user_id)
+            source = source.where(TimeEntry.user_id == user_id)
+        source = source.group_by(
+            TimeEntry.user_id, TimeEntry.project_id, func.date(TimeEntry.started_at)
+        )
+        await self.session.execute(clear)
+        await self.session.execute(
+            insert(TimeEntryDailyRollup).from_select(
+                [
+                    "user_id",
+                    "project_id",
+                    "day",
+                    "total_minutes",
+                    "billable_minutes",
+                    "billable_amount",
+                    "entry_count",
+                ],
+                source,
+            )
+        )
+        versions = ChangeVersionRepository(self.session)
+        if user_id is None:
+            await versions.bump_all(ChangeScope.TIME_ENTRIES)
+        else:
+            await versions.bump(user_id, ChangeScope.TIME_ENTRIES)
+
+    async def count_entries(
+        self, *, user_id: int, project_ids: list[int] | None, day_from: date, day_to: date
+    ) -> int:
+        stmt = select(func.coalesce(func.sum(TimeEntryDailyRollup.entry_count), 0)).where(
+            TimeEntryDailyRollup.user_id == user_id,
+            TimeEntryDailyRollup.day >= day_from,
+            TimeEntryDailyRollup.day <= day_to,
+        )
+        if project_ids:
+            stmt = stmt.where(TimeEntryDailyRollup.project_id.in_(project_ids))
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import TimeEntryImport
+from app.repositories.base import Repository
+
+
+class TimeEntryImportRepository(Repository[TimeEntryImport]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, TimeEntryImport)
@@ -1,12 +1,47 @@
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import AsyncIterator, Sequence
+from datetime import date, datetime, time, timedelta
 
-from sqlalchemy import Select, select
+from sqlalchemy import (
+    Date,
+    Numeric,
+    Row,
+    RowMapping,
+    Select,
+    Subquery,
+    cast,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+    tuple_,
+    type_coerce,
+    union_all,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import TimeEntry
+from app.models import Project, TimeEntry, TimeEntryDailyRollup
 from app.repositories.base import Repository
+from app.utils.dates import is_utc_zone
+
+AMOUNT_TYPE = Numeric(18, 6)
+BULK_INSERT_COLUMNS = (
+    "user_id",
+    "project_id",
+    "description",
+    "started_at",
+    "ended_at",
+    "duration_minutes",
+    "is_billable",
+    "hourly_rate",
+)
+# Must match the expression of the GiST index ix_time_entries_user_period.
+PERIOD_SQL = (
+    "tsrange(started_at, greatest(started_at, coalesce(ended_at, "
+    "started_at + duration_minutes * interval '1 minute')), '[)')"
+)
 
 
 class TimeEntryRepository(Repository[TimeEntry]):
@@ -51,3 +86,375 @@ class TimeEntryRepository(Repository[TimeEntry]):
         )
         result = await self.session.execute(stmt.order_by(TimeEntry.started_at.desc()))
         return result.scalars().all()
+
+    async def get_owned(self, user_id: int, entry_ids: list[int]) -> dict[int, TimeEntry]:
+        if not entry_ids:
+            return {}
+        stmt = select(TimeEntry).where(
+            TimeEntry.user_id == user_id, TimeEntry.id.in_(entry_ids)
+        )
+        result = await self.session.execute(stmt)
+        return {entry.id: entry for entry in result.scalars()}
+
+    async def add_many(self, rows: list[dict]) -> list[TimeEntry]:
+        # One multi-row INSERT ... RETURNING, in the order of ``rows``.
+        if not rows:
+            return []
+        result = await self.session.scalars(
+            insert(TimeEntry).returning(TimeEntry, sort_by_parameter_order=True), rows
+        )
+        return result.all()
+
+    async def bulk_insert(self, rows: list[dict]) -> None:
+        """Insert without RETURNING: COPY on PostgreSQL, executemany elsewhere."""
+        if not rows:
+            return
+        if self.session.bind.dialect.name == "postgresql":
+            connection = await self.session.connection()
+            raw = await connection.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                TimeEntry.__tablename__,
+                records=[tuple(row[column] for column in BULK_INSERT_COLUMNS) for row in rows],
+                columns=BULK_INSERT_COLUMNS,
+            )
+        else:
+            await self.session.execute(insert(TimeEntry), rows)
+
+    async def delete_many(self, entry_ids: list[int]) -> None:
+        if entry_ids:
+            await self.session.execute(
+                delete(TimeEntry).where(TimeEntry.id.in_(entry_ids)),
+                execution_options={"synchronize_session": False},
+            )
+
+    async def list_page(
+        self,
+        fields: Sequence[str],
+        *,
+        user_id: int,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        project_ids: list[int] | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> Sequence[RowMapping]:
+        # Keyset pagination: seeks past the last (started_at, id) seen on the
+        # (user_id, started_at, id) index, so deep pages cost the same as the first.
+        # Only ``fields`` are selected and rows come back as plain mappings.
+        stmt = self._apply_filters(
+            select(*self.columns(fields)),
+            user_id=user_id,
+            project_ids=project_ids,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(TimeEntry.started_at, TimeEntry.id) < tuple_(*after))
+        stmt = stmt.order_by(TimeEntry.started_at.desc(), TimeEntry.id.desc()).limit(limit)
+        result = await self.session.execute(stmt)
+        return result.mappings().all()
+
+    async def list_changed_rows(
+        self, user_id: int, fields: Sequence[str], since: datetime | None
+    ) -> Sequence[RowMapping]:
+        return await self.list_rows_changed_since(fields, since, TimeEntry.user_id == user_id)
+
+    def _intervals_query(
+        self,
+        *,
+        user_id: int,
+        start: datetime | None,
+        end: datetime | None,
+        lookback: timedelta,
+    ) -> Select:
+        # On PostgreSQL the GiST index answers "overlaps [start, end)" exactly.
+        # Elsewhere entries are found by start time on the (user_id, started_at)
+        # index, reaching back ``lookback`` for ones that began before ``start``;
+        # callers still compare the exact end of each candidate.
+        stmt = select(
+            TimeEntry.id, TimeEntry.started_at, TimeEntry.ended_at, TimeEntry.duration_minutes
+        ).where(TimeEntry.user_id == user_id)
+        if self.session.bind.dialect.name == "postgresql":
+            return stmt.where(
+                text(
+                    f"{PERIOD_SQL} && tsrange(CAST(:period_start AS timestamp), "
+                    "CAST(:period_end AS timestamp), '[)')"
+                ).bindparams(period_start=start, period_end=end)
+            )
+        if start is not None:
+            stmt = stmt.where(TimeEntry.started_at >= start - lookback)
+        if end is not None:
+            stmt = stmt.where(TimeEntry.started_at < end)
+        return stmt
+
+    async def overlap_candidates(
+        self,
+        *,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        lookback: timedelta,
+        exclude_id: int | None = None,
+    ) -> Sequence[Row]:
+        stmt = self._intervals_query(user_id=user_id, start=start, end=end, lookback=lookback)
+        if exclude_id is not None:
+            stmt = stmt.where(TimeEntry.id != exclude_id)
+        result = await self.session.execute(stmt.order_by(TimeEntry.started_at, TimeEntry.id))
+        return result.all()
+
+    async def stream_intervals(
+        self,
+        *,
+        user_id: int,
+        start: datetime | None,
+        end: datetime | None,
+        lookback: timedelta,
+        batch_size: int,
+    ) -> AsyncIterator[Sequence[Row]]:
+        stmt = (
+            self._intervals_query(user_id=user_id, start=start, end=end, lookback=lookback)
+            .order_by(TimeEntry.started_at, TimeEntry.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        async for partition in result.partitions():
+            yield partition
+
+    def _raw_totals(
+        self, *, user_id: int, project_ids: list[int] | None, start: datetime, end: datetime
+    ) -> Select:
+        stmt = select(
+            TimeEntry.project_id.label("project_id"),
+            func.sum(TimeEntry.duration_minutes).label("total_minutes"),
+            func.coalesce(
+                func.sum(TimeEntry.duration_minutes).filter(TimeEntry.is_billable.is_(True)),
+                0,
+            ).label("billable_minutes"),
+            (
+                func.sum(TimeEntry.duration_minutes * TimeEntry.hourly_rate).filter(
+                    TimeEntry.is_billable.is_(True)
+                )
+                / 60
+            ).label("billable_amount"),
+        ).where(
+            TimeEntry.user_id == user_id,
+            TimeEntry.started_at >= start,
+            TimeEntry.started_at < end,
+        )
+        if project_ids:
+            stmt = stmt.where(TimeEntry.project_id.in_(project_ids))
+        return stmt.group_by(TimeEntry.project_id)
+
+    def _rollup_totals(
+        self, *, user_id: int, project_ids: list[int] | None, day_from: date, day_to: date
+    ) -> Select:
+        stmt = select(
+            TimeEntryDailyRollup.project_id.label("project_id"),
+            func.sum(TimeEntryDailyRollup.total_minutes).label("total_minutes"),
+            func.sum(TimeEntryDailyRollup.billable_minutes).label("billable_minutes"),
+            func.sum(TimeEntryDailyRollup.billable_amount).label("billable_amount"),
+        ).where(
+            TimeEntryDailyRollup.user_id == user_id,
+            TimeEntryDailyRollup.day >= day_from,
+            TimeEntryDailyRollup.day < day_to,
+        )
+        if project_ids:
+            stmt = stmt.where(TimeEntryDailyRollup.project_id.in_(project_ids))
+        return stmt.group_by(TimeEntryDailyRollup.project_id)
+
+    def _window_totals(
+        self, *, user_id: int, project_ids: list[int] | None, start: datetime, end: datetime
+    ) -> Subquery:
+        # Whole UTC days inside [start, end) come from the daily rollups; only the
+        # partial days at either edge are summed from raw time entries.
+        first_day = start.date() if start.time() == time.min else start.date() + timedelta(days=1)
+        last_day = end.date()
+        if first_day >= last_day:
+            return self._raw_totals(
+                user_id=user_id, project_ids=project_ids, start=start, end=end
+            ).subquery()
+
+        legs = [
+            self._rollup_totals(
+                user_id=user_id, project_ids=project_ids, day_from=first_day, day_to=last_day
+            )
+        ]
+        head_end = datetime.combine(first_day, time.min)
+        if start < head_end:
+            legs.append(
+                self._raw_totals(
+                    user_id=user_id, project_ids=project_ids, start=start, end=head_end
+                )
+            )
+        tail_start = datetime.combine(last_day, time.min)
+        if tail_start < end:
+            legs.append(
+                self._raw_totals(
+                    user_id=user_id, project_ids=project_ids, start=tail_start, end=end
+                )
+            )
+        if len(legs) == 1:
+            return legs[0].subquery()
+        return union_all(*legs).subquery()
+
+    async def aggregate_by_project(
+        self,
+        *,
+        user_id: int,
+        project_ids: list[int] | None = None,
+        start: datetime,
+        end: datetime,
+    ) -> list[Row]:
+        # With explicit project_ids the projects table drives the query, so every
+        # requested project comes back (with its owner_id) even without entries.
+        totals = self._window_totals(
+            user_id=user_id, project_ids=project_ids, start=start, end=end
+        )
+        stmt = select(
+            Project.id.label("project_id"),
+            Project.name.label("project_name"),
+            Project.owner_id.label("owner_id"),
+            func.coalesce(func.sum(totals.c.total_minutes), 0).label("total_minutes"),
+            func.coalesce(func.sum(totals.c.billable_minutes), 0).label(
+                "total_billable_minutes"
+            ),
+            type_coerce(func.coalesce(func.sum(totals.c.billable_amount), 0), AMOUNT_TYPE).label(
+                "billable_amount"
+            ),
+        )
+        if project_ids:
+            stmt = stmt.select_from(Project).outerjoin(
+                totals, totals.c.project_id == Project.id
+            ).where(Project.id.in_(project_ids))
+        else:
+            stmt = stmt.select_from(totals).join(Project, Project.id == totals.c.project_id)
+
+        stmt = stmt.group_by(Project.id, Project.name, Project.owner_id).order_by(Project.id)
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    def _local_bucket(self, granularity: str, zone_name: str):
+        if self.session.bind.dialect.name == "postgresql":
+            local = func.timezone(zone_name, func.timezone("UTC", TimeEntry.started_at))
+            return cast(func.date_trunc(granularity, local), Date)
+        # SQLite has no time zone support; app.core.db registers tz_bucket instead.
+        return func.tz_bucket(TimeEntry.started_at, zone_name, granularity, type_=Date)
+
+    async def aggregate_series(
+        self,
+        *,
+        user_id: int,
+        project_ids: list[int] | None = None,
+        start: datetime,
+        end: datetime,
+        granularity: str,
+        zone_name: str,
+    ) -> list[Row]:
+        entries = select(
+            self._local_bucket(granularity, zone_name).label("bucket"),
+            TimeEntry.project_id,
+            TimeEntry.duration_minutes,
+            TimeEntry.is_billable,
+            TimeEntry.hourly_rate,
+        ).where(
+            TimeEntry.user_id == user_id,
+            TimeEntry.started_at >= start,
+            TimeEntry.started_at < end,
+        )
+        if project_ids:
+            entries = entries.where(TimeEntry.project_id.in_(project_ids))
+        entries = entries.subquery()
+        billable = entries.c.is_billable.is_(True)
+
+        stmt = select(
+            entries.c.bucket,
+            entries.c.project_id,
+            func.sum(entries.c.duration_minutes).label("total_minutes"),
+            func.coalesce(
+                func.sum(entries.c.duration_minutes).filter(billable), 0
+            ).label("total_billable_minutes"),
+            type_coerce(
+                func.coalesce(
+                    func.sum(entries.c.duration_minutes * entries.c.hourly_rate).filter(billable)
+                    / 60,
+                    0,
+                ),
+                AMOUNT_TYPE,
+            ).label("billable_amount"),
+        ).group_by(entries.c.bucket, entries.c.project_id)
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def aggregate_daily(
+        self,
+        *,
+        user_id: int,
+        project_ids: list[int] | None = None,
+        start: datetime,
+        end: datetime,
+        zone_name: str,
+    ) -> list[Row]:
+        # For UTC users local days are rollup days, so this is a plain rollup
+        # read; other zones bucket raw entries by local day in SQL.
+        if not is_utc_zone(zone_name):
+            return await self.aggregate_series(
+                user_id=user_id,
+                project_ids=project_ids,
+                start=start,
+                end=end,
+                granularity="day",
+                zone_name=zone_name,
+            )
+
+        stmt = select(
+            TimeEntryDailyRollup.day.label("bucket"),
+            TimeEntryDailyRollup.project_id,
+            TimeEntryDailyRollup.total_minutes,
+            TimeEntryDailyRollup.billable_minutes.label("total_billable_minutes"),
+            TimeEntryDailyRollup.billable_amount,
+        ).where(
+            TimeEntryDailyRollup.user_id == user_id,
+            TimeEntryDailyRollup.day >= start.date(),
+            TimeEntryDailyRollup.day < end.date(),
+        )
+        if project_ids:
+            stmt = stmt.where(TimeEntryDailyRollup.project_id.in_(project_ids))
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def stream_detailed(
+        self,
+        *,
+        user_id: int,
+        project_ids: list[int] | None = None,
+        start: datetime,
+        end: datetime,
+        batch_size: int,
+    ) -> AsyncIterator[Sequence[Row]]:
+        # Server-side cursor (yield_per) keeps only one batch of plain rows in memory.
+        stmt = (
+            select(
+                TimeEntry.id,
+                TimeEntry.project_id,
+                Project.name.label("project_name"),
+                TimeEntry.description,
+                TimeEntry.started_at,
+                TimeEntry.ended_at,
+                TimeEntry.duration_minutes,
+                TimeEntry.is_billable,
+                TimeEntry.hourly_rate,
+            )
+            .join(Project, Project.id == TimeEntry.project_id)
+            .where(
+                TimeEntry.user_id == user_id,
+                TimeEntry.started_at >= start,
+                TimeEntry.started_at < end,
+            )
+            .order_by(TimeEntry.started_at, TimeEntry.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if project_ids:
+            stmt = stmt.where(TimeEntry.project_id.in_(project_ids))
+        result = await self.session.stream(stmt)
+        async for partition in result.partitions():
+            yield partition
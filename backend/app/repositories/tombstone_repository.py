@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import Row, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ChangeScope, Tombstone
+from app.repositories.base import Repository
+
+
+class TombstoneRepository(Repository[Tombstone]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, Tombstone)
+
+    async def record(self, user_id: int, scope: ChangeScope, record_ids: Sequence[int]) -> None:
+        if record_ids:
+            await self.session.execute(
+                insert(Tombstone),
+                [
+                    {"user_id": user_id, "scope": scope.value, "record_id": record_id}
+                    for record_id in record_ids
+                ],
+            )
+
+    async def list_since(self, user_id: int, since: datetime) -> Sequence[Row]:
+        stmt = select(Tombstone.scope, Tombstone.record_id).where(
+            Tombstone.user_id == user_id, Tombstone.created_at >= since
+        )
+        result = await self.session.execute(stmt.order_by(Tombstone.id))
+        return result.all()
+
+    async def purge_before(self, cutoff: datetime) -> int:
+        result = await self.session.execute(
+            delete(Tombstone).where(Tombstone.created_at < cutoff)
+        )
+        return result.rowcount
@@ -1,14 +1,23 @@
-from datetime import date
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
 
 from pydantic import BaseModel, Field, model_validator
 
 from app.models.report import ExportFormat
 
 
+class ReportGranularity(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
 class ReportFilters(BaseModel):
     project_ids: list[int] | None = None
     date_from: date
     date_to: date
+    granularity: ReportGranularity | None = None
 
     @model_validator(mode="after")
     def validate_date_range(self) -> "ReportFilters":
@@ -22,23 +31,54 @@ class ReportSummary(BaseModel):
     project_name: str
     total_minutes: int
     total_billable_minutes: int
+    billable_amount: Decimal = Decimal("0.00")
+
+
+class ReportSeries(BaseModel):
+    """Bucketed totals as parallel arrays: ``total_minutes[p][b]`` is the total
+    for ``project_ids[p]`` in the bucket starting on ``buckets[b]``."""
+
+    granularity: ReportGranularity
+    buckets: list[date]
+    project_ids: list[int]
+    total_minutes: list[list[int]]
+    total_billable_minutes: list[list[int]]
 
 
 class ReportResponse(BaseModel):
     summary: list[ReportSummary]
     total_minutes: int
     total_billable_minutes: int
+    total_billable_amount: Decimal = Decimal("0.00")
+    series: ReportSeries | None = None
+
+
+class ReportBatchRequest(BaseModel):
+    reports: list[ReportFilters] = Field(min_length=1, max_length=20)
+
+
+class ReportBatchResponse(BaseModel):
+    results: list[ReportResponse]
 
 
 class ExportRequest(ReportFilters):
     format: ExportFormat = Field(default=ExportFormat.CSV)
+    detailed: bool = False
 
 
 class ExportRead(BaseModel):
     id: int
     format: ExportFormat
+    detailed: bool = False
     status: str
     file_path: str | None = None
+    compression: str | None = None
+    rows_total: int | None = None
+    rows_processed: int = 0
+    bytes_written: int = 0
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    eta_at: datetime | None = None
 
     class Config:
         from_attributes = True
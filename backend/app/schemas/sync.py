@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+from app.schemas.project import ProjectRead
+from app.schemas.reminder import ReminderRead
+from app.schemas.time_entry import TimeEntryRead
+
+
+class SyncDeleted(BaseModel):
+    time_entries: list[int] = []
+    reminders: list[int] = []
+
+
+class SyncChanges(BaseModel):
+    token: str
+    full: bool
+    time_entries: list[TimeEntryRead]
+    projects: list[ProjectRead]
+    reminders: list[ReminderRead]
+    deleted: SyncDeleted
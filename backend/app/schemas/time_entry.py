@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field
 
@@ -33,3 +34,75 @@ class TimeEntryRead(TimeEntryBase):
 
     class Config:
         from_attributes = True
+
+
+class TimeEntryBulkCreate(BaseModel):
+    op: Literal["create"]
+    data: TimeEntryCreate
+
+
+class TimeEntryBulkUpdate(BaseModel):
+    op: Literal["update"]
+    id: int
+    data: TimeEntryUpdate
+
+
+class TimeEntryBulkDelete(BaseModel):
+    op: Literal["delete"]
+    id: int
+
+
+TimeEntryBulkOperation = Annotated[
+    TimeEntryBulkCreate | TimeEntryBulkUpdate | TimeEntryBulkDelete,
+    Field(discriminator="op"),
+]
+
+
+class TimeEntryBulkRequest(BaseModel):
+    operations: list[TimeEntryBulkOperation] = Field(min_length=1, max_length=500)
+
+
+class TimeEntryBulkResult(BaseModel):
+    index: int
+    op: Literal["create", "update", "delete"]
+    status: int
+    id: int | None = None
+    entry: TimeEntryRead | None = None
+    detail: str | None = None
+
+
+class TimeEntryBulkResponse(BaseModel):
+    results: list[TimeEntryBulkResult]
+
+
+OverlapPolicy = Literal["allow", "reject", "flag"]
+
+
+class TimeEntryOverlap(BaseModel):
+    entry_id: int
+    other_entry_id: int
+    overlap_start: datetime
+    overlap_end: datetime
+
+
+class TimeEntryImportError(BaseModel):
+    line: int
+    error: str
+
+
+class TimeEntryImportRead(BaseModel):
+    id: int
+    format: str
+    filename: str | None = None
+    status: str
+    rows_processed: int = 0
+    rows_imported: int = 0
+    rows_failed: int = 0
+    batches_completed: int = 0
+    projects_created: int = 0
+    errors: list[TimeEntryImportError] = Field(default_factory=list)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
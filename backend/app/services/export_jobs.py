@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from app.core.config import get_settings
+from app.core.db import SessionLocal
+from app.models import ReportExport, User
+from app.models.report import ExportFormat
+from app.repositories.report_repository import ReportExportRepository
+from app.schemas.report import ExportRequest, ReportFilters, ReportResponse
+from app.services.export_progress import ExportProgress
+from app.services.export_retention import ExportRetentionService
+from app.services.exporters import (
+    export_chunks,
+    export_compression,
+    export_detailed_parquet,
+    export_detailed_pdf,
+    export_file_path,
+    export_stream,
+    export_summary_parquet,
+    export_to_csv,
+    export_to_pdf,
+    iter_detailed_csv,
+    iter_detailed_ndjson,
+    iter_summary_ndjson,
+    sharded_filename,
+)
+from app.services.report_service import ReportService
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def _export_filename(export: ReportExport) -> str:
+    return sharded_filename(f"report_{export.id}.{export.format}")
+
+
+def _export_filters(export: ReportExport) -> ReportFilters:
+    return ReportFilters(
+        project_ids=export.project_ids,
+        date_from=date.fromisoformat(export.date_from),
+        date_to=date.fromisoformat(export.date_to),
+    )
+
+
+def _complete_export(
+    export: ReportExport,
+    file_path: str,
+    compression: str | None,
+    rows: int,
+    started_at: datetime,
+) -> None:
+    export.compression = compression
+    export.size_bytes = Path(file_path).stat().st_size
+    export.file_path = file_path
+    export.rows_total = export.rows_processed = rows
+    export.bytes_written = export.size_bytes
+    export.started_at = started_at
+    export.finished_at = datetime.utcnow()
+    export.eta_at = None
+    export.status = "completed"
+
+
+async def _generate_detailed_export(
+    service: ReportService, user: User, export: ReportExport
+) -> None:
+    filters = ExportRequest(
+        **_export_filters(export).model_dump(), format=export.format, detailed=True
+    )
+    filename = _export_filename(export)
+    compression = export_compression(export.format, settings.export_compression)
+    progress = ExportProgress(
+        export.id,
+        export_file_path(filename, compression),
+        rows_total=await service.estimate_export_rows(user, filters) or None,
+        interval=settings.export_progress_interval_seconds,
+    )
+    await progress.start()
+    batches = progress.track(
+        service.stream_entries(user, filters, settings.export_stream_batch_size)
+    )
+    if export.format == ExportFormat.PDF.value:
+        file_path = await export_detailed_pdf(batches, filename)
+    elif export.format == ExportFormat.PARQUET.value:
+        file_path = await export_detailed_parquet(batches, filename)
+    elif export.format == ExportFormat.NDJSON.value:
+        file_path = await export_stream(iter_detailed_ndjson(batches), filename, compression)
+    else:
+        file_path = await export_stream(iter_detailed_csv(batches), filename, compression)
+    _complete_export(export, file_path, compression, progress.rows_processed, progress.started_at)
+
+
+def _render_summary_export(
+    export: ReportExport, report: ReportResponse
+) -> tuple[str, str | None]:
+    filename = _export_filename(export)
+    compression = export_compression(export.format, settings.export_compression)
+    if export.format == ExportFormat.CSV.value:
+        file_path = export_to_csv(report, filename, compression)
+    elif export.format == ExportFormat.NDJSON.value:
+        file_path = export_chunks(iter_summary_ndjson(report), filename, compression)
+    elif export.format == ExportFormat.PARQUET.value:
+        file_path = export_summary_parquet(report, filename)
+    else:
+        file_path = export_to_pdf(report, filename)
+    return file_path, compression
+
+
+async def generate_export(export_id: int) -> None:
+    async with SessionLocal() as session:
+        repo = ReportExportRepository(session)
+        # Claims this export plus other pending summary exports of the same
+        # user with overlapping ranges; exports already claimed by another
+        # task come back empty.
+        exports = await repo.claim_batch(export_id, settings.export_coalesce_max_batch)
+        await session.commit()
+        if not exports:
+            logger.info("Export %s already claimed or missing", export_id)
+            return
+        user = await session.get(User, exports[0].user_id)
+        if not user:
+            logger.error("User missing for exports %s", [export.id for export in exports])
+            for export in exports:
+                export.status = "failed"
+            await session.commit()
+            return
+
+        export_ids = [export.id for export in exports]
+        service = ReportService(session)
+        started_at = datetime.utcnow()
+        try:
+            if exports[0].detailed:
+                await _generate_detailed_export(service, user, exports[0])
+            else:
+                reports = await service.summarize_many(
+                    user, [_export_filters(export) for export in exports]
+                )
+                for export, report in zip(exports, reports):
+                    file_path, compression = _render_summary_export(export, report)
+                    _complete_export(
+                        export, file_path, compression, len(report.summary), started_at
+                    )
+        except Exception:
+            await session.rollback()
+            await repo.set_status(export_ids, "failed")
+            await session.commit()
+            raise
+        await session.commit()
+        if len(export_ids) > 1:
+            logger.info("Coalesced exports %s into one pass", export_ids)
+
+
+async def fail_stale_exports() -> None:
+    # A worker that died mid-export leaves its claim in processing forever;
+    # once it stops heartbeating the export is failed so it is not reused.
+    async with SessionLocal() as session:
+        repo = ReportExportRepository(session)
+        timeout = timedelta(seconds=settings.export_heartbeat_timeout_seconds)
+        failed = await repo.fail_stale_claims(await repo.database_now() - timeout)
+        await session.commit()
+    if failed:
+        logger.warning("Failed stale report exports %s", failed)
+
+
+async def evict_exports() -> None:
+    async with SessionLocal() as session:
+        result = await ExportRetentionService(session).evict()
+    logger.info(
+        "Expired %s report exports, freed %s bytes", result.expired, result.freed_bytes
+    )
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from app.core.db import SessionLocal
+from app.repositories.report_repository import ReportExportRepository
+
+
+class ExportProgress:
+    """Record rows, bytes and an ETA on a running export.
+
+    Updates go through a short-lived session of their own so the export's
+    streaming session (and its server-side cursor) is never committed, and
+    are throttled to one write per ``interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        export_id: int,
+        path: Path,
+        *,
+        rows_total: int | None = None,
+        interval: float = 1.0,
+    ):
+        self.export_id = export_id
+        self.path = path
+        self.rows_total = rows_total
+        self.rows_processed = 0
+        self.interval = interval
+        self.started_at = datetime.utcnow()
+        self._started = time.monotonic()
+        self._last_write = 0.0
+
+    async def start(self) -> None:
+        await self._write(started_at=self.started_at, rows_total=self.rows_total)
+        self._last_write = time.monotonic()
+
+    async def track(
+        self, batches: AsyncIterator[Sequence[Any]]
+    ) -> AsyncIterator[Sequence[Any]]:
+        async for batch in batches:
+            yield batch
+            self.rows_processed += len(batch)
+            if time.monotonic() - self._last_write >= self.interval:
+                await self.flush()
+
+    async def flush(self) -> None:
+        self._last_write = time.monotonic()
+        await self._write(**self.snapshot())
+
+    def snapshot(self) -> dict[str, Any]:
+        values: dict[str, Any] = {
+            "rows_processed": self.rows_processed,
+            "bytes_written": self.path.stat().st_size if self.path.exists() else 0,
+            "eta_at": None,
+        }
+        # The row estimate comes from daily rollups and can overshoot, so the
+        # ETA is only a hint and the total is raised once it is exceeded.
+        if self.rows_total is not None and self.rows_processed > self.rows_total:
+            self.rows_total = self.rows_processed
+            values["rows_total"] = self.rows_total
+        elapsed = time.monotonic() - self._started
+        if self.rows_total and self.rows_processed and elapsed > 0:
+            rate = self.rows_processed / elapsed
+            remaining = (self.rows_total - self.rows_processed) / rate
+            values["eta_at"] = datetime.utcnow() + timedelta(seconds=remaining)
+        return values
+
+    async def _write(self, **values: Any) -> None:
+        async with SessionLocal() as session:
+            await ReportExportRepository(session).update_progress(self.export_id, **values)
+            await session.commit()
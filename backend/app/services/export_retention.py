@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models import ReportExport
+from app.repositories.report_repository import ReportExportRepository
+
+settings = get_settings()
+
+
+@dataclass
+class EvictionResult:
+    expired: int = 0
+    freed_bytes: int = 0
+
+
+class ExportRetentionService:
+    """Expire stored exports past their TTL or beyond the byte quotas.
+
+    Quotas evict the least recently downloaded exports first (falling back to
+    creation time for exports never downloaded).
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.exports = ReportExportRepository(session)
+
+    async def evict(self, now: datetime | None = None) -> EvictionResult:
+        now = now or datetime.utcnow()
+        result = EvictionResult()
+        expired_paths: list[str] = []
+
+        cutoff = now - timedelta(hours=settings.export_ttl_hours)
+        for export in await self.exports.list_completed_before(cutoff):
+            self._expire(export, result, expired_paths)
+        await self.session.flush()
+
+        quota = settings.export_user_quota_bytes
+        for user_id, used in await self.exports.usage_over_quota(quota):
+            for export in await self.exports.list_least_recently_used(user_id):
+                if used <= quota:
+                    break
+                used -= self._expire(export, result, expired_paths)
+        await self.session.flush()
+
+        used = await self.exports.total_usage()
+        if used > settings.export_total_quota_bytes:
+            for export in await self.exports.list_least_recently_used():
+                if used <= settings.export_total_quota_bytes:
+                    break
+                used -= self._expire(export, result, expired_paths)
+
+        await self.session.commit()
+        # Files go only once the rows no longer point at them, so a failed
+        # commit never leaves a completed export without its file.
+        for file_path in expired_paths:
+            Path(file_path).unlink(missing_ok=True)
+        return result
+
+    @staticmethod
+    def _expire(
+        export: ReportExport, result: EvictionResult, expired_paths: list[str]
+    ) -> int:
+        """Mark ``export`` expired; its file is queued in ``expired_paths``."""
+        size = export.size_bytes or 0
+        if export.file_path:
+            expired_paths.append(export.file_path)
+        export.status = "expired"
+        export.file_path = None
+        result.expired += 1
+        result.freed_bytes += size
+        return size
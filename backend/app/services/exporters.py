@@ -1,50 +1,354 @@
 from __future__ import annotations
 
+import asyncio
+import csv
+import gzip
+import hashlib
+import io
+import json
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from pathlib import Path
-
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
+from typing import IO, Any
 
 from app.schemas.report import ReportResponse
 
+# Directories are created on first write; reportlab (via pdf_renderer) and
+# pyarrow are imported only by the writers that need them.
 EXPORT_DIR = Path("storage/exports")
-EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
+SUMMARY_HEADER = [
+    "project_id",
+    "project_name",
+    "total_minutes",
+    "total_billable_minutes",
+    "billable_amount",
+]
+TOTAL_FIELDS = {"total_minutes", "total_billable_minutes", "total_billable_amount"}
+DETAIL_HEADER = [
+    "entry_id",
+    "project_id",
+    "project_name",
+    "description",
+    "started_at",
+    "ended_at",
+    "duration_minutes",
+    "is_billable",
+    "hourly_rate",
+]
 
-def export_to_csv(report: ReportResponse, filename: str) -> str:
-    path = EXPORT_DIR / filename
-    lines = ["project_id,project_name,total_minutes,total_billable_minutes"]
-    for row in report.summary:
-        lines.append(
-            f"{row.project_id},{row.project_name},{row.total_minutes},{row.total_billable_minutes}"
-        )
-    lines.append(f"TOTAL,,{report.total_minutes},{report.total_billable_minutes}")
-    path.write_text("\n".join(lines), encoding="utf-8")
-    return str(path)
+# Formats that are not already compressed internally get the configured codec.
+COMPRESSIBLE_FORMATS = {"csv", "ndjson"}
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
 
+PDF_DETAIL_HEADER = [
+    "Project",
+    "Description",
+    "Started",
+    "Minutes",
+    "Billable",
+    "Rate",
+]
+POINTS_PER_INCH = 72  # reportlab.lib.units.inch
+PDF_DETAIL_WIDTHS = [w * POINTS_PER_INCH for w in (2.2, 3.6, 1.6, 0.8, 0.8, 1.0)]
 
-def export_to_pdf(report: ReportResponse, filename: str) -> str:
+
+def sharded_filename(filename: str) -> str:
+    """Spread exports over 256 * 256 subdirectories keyed by a name hash."""
+    digest = hashlib.sha1(filename.encode("utf-8")).hexdigest()
+    return f"{digest[:2]}/{digest[2:4]}/{filename}"
+
+
+def _export_path(filename: str) -> Path:
     path = EXPORT_DIR / filename
-    doc = SimpleDocTemplate(str(path), pagesize=letter)
-    styles = getSampleStyleSheet()
-    elements = [Paragraph("Time Report", styles["Heading1"])]
-    data = [["Project", "Total Minutes", "Billable Minutes"]]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _detail_values(row: Any) -> list[Any]:
+    return [
+        row.id,
+        row.project_id,
+        row.project_name,
+        row.description or "",
+        row.started_at.isoformat(),
+        row.ended_at.isoformat() if row.ended_at else "",
+        row.duration_minutes,
+        "true" if row.is_billable else "false",
+        "" if row.hourly_rate is None else row.hourly_rate,
+    ]
+
+
+def _pdf_detail_values(row: Any) -> list[Any]:
+    return [
+        row.project_name,
+        row.description or "",
+        row.started_at.strftime("%Y-%m-%d %H:%M"),
+        row.duration_minutes,
+        "yes" if row.is_billable else "no",
+        "" if row.hourly_rate is None else row.hourly_rate,
+    ]
+
+
+def _detail_record(row: Any) -> dict[str, Any]:
+    return {
+        "entry_id": row.id,
+        "project_id": row.project_id,
+        "project_name": row.project_name,
+        "description": row.description,
+        "started_at": row.started_at.isoformat(),
+        "ended_at": row.ended_at.isoformat() if row.ended_at else None,
+        "duration_minutes": row.duration_minutes,
+        "is_billable": row.is_billable,
+        "hourly_rate": None if row.hourly_rate is None else str(row.hourly_rate),
+    }
+
+
+def iter_summary_csv(report: ReportResponse) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(SUMMARY_HEADER)
     for row in report.summary:
-        data.append([row.project_name, row.total_minutes, row.total_billable_minutes])
-    data.append(["Total", report.total_minutes, report.total_billable_minutes])
-    table = Table(data)
-    table.setStyle(
-        TableStyle(
+        writer.writerow(
             [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("GRID", (0, 0), (-1, -1), 1, colors.black),
+                row.project_id,
+                row.project_name,
+                row.total_minutes,
+                row.total_billable_minutes,
+                row.billable_amount,
             ]
         )
+    writer.writerow(
+        [
+            "TOTAL",
+            "",
+            report.total_minutes,
+            report.total_billable_minutes,
+            report.total_billable_amount,
+        ]
+    )
+    yield buffer.getvalue()
+
+
+def iter_summary_ndjson(report: ReportResponse) -> Iterator[str]:
+    for row in report.summary:
+        yield row.model_dump_json() + "\n"
+    yield report.model_dump_json(include=TOTAL_FIELDS) + "\n"
+
+
+async def iter_detailed_csv(batches: AsyncIterator[Sequence[Any]]) -> AsyncIterator[str]:
+    """Encode streamed entry batches as CSV, one text chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(DETAIL_HEADER)
+    async for batch in batches:
+        writer.writerows(_detail_values(row) for row in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+async def iter_detailed_ndjson(batches: AsyncIterator[Sequence[Any]]) -> AsyncIterator[str]:
+    async for batch in batches:
+        yield "".join(json.dumps(_detail_record(row)) + "\n" for row in batch)
+
+
+def export_compression(export_format: str, configured: str) -> str | None:
+    if export_format not in COMPRESSIBLE_FORMATS or configured == "none":
+        return None
+    return configured
+
+
+def compressed_filename(filename: str, compression: str | None) -> str:
+    return filename + COMPRESSION_SUFFIXES.get(compression or "", "")
+
+
+def export_file_path(filename: str, compression: str | None = None) -> Path:
+    return EXPORT_DIR / compressed_filename(filename, compression)
+
+
+def open_export_text(path: Path, compression: str | None) -> IO[str]:
+    if compression == "gzip":
+        return gzip.open(path, "wt", compresslevel=6, encoding="utf-8", newline="")
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.open(path, "wt", encoding="utf-8", newline="")
+    return path.open("w", encoding="utf-8", newline="")
+
+
+def open_export_binary(path: Path, compression: str | None) -> IO[bytes]:
+    """Open a stored export for reading its decoded bytes."""
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.open(path, "rb")
+    return path.open("rb")
+
+
+def export_to_csv(
+    report: ReportResponse, filename: str, compression: str | None = None
+) -> str:
+    return export_chunks(iter_summary_csv(report), filename, compression)
+
+
+def export_chunks(
+    chunks: Iterable[str], filename: str, compression: str | None = None
+) -> str:
+    path = _export_path(compressed_filename(filename, compression))
+    with open_export_text(path, compression) as handle:
+        for chunk in chunks:
+            handle.write(chunk)
+    return str(path)
+
+
+async def export_stream(
+    chunks: AsyncIterator[str], filename: str, compression: str | None = None
+) -> str:
+    path = _export_path(compressed_filename(filename, compression))
+    with open_export_text(path, compression) as handle:
+        async for chunk in chunks:
+            handle.write(chunk)
+    return str(path)
+
+
+def _summary_parquet_schema():
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("project_id", pa.int64()),
+            ("project_name", pa.string()),
+            ("total_minutes", pa.int64()),
+            ("total_billable_minutes", pa.int64()),
+            ("billable_amount", pa.decimal128(18, 2)),
+        ]
+    )
+
+
+def _detail_parquet_schema():
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("entry_id", pa.int64()),
+            ("project_id", pa.int64()),
+            ("project_name", pa.string()),
+            ("description", pa.string()),
+            ("started_at", pa.timestamp("us", tz="UTC")),
+            ("ended_at", pa.timestamp("us", tz="UTC")),
+            ("duration_minutes", pa.int32()),
+            ("is_billable", pa.bool_()),
+            ("hourly_rate", pa.decimal128(12, 2)),
+        ]
+    )
+
+
+def _detail_columns(batch: Sequence[Any]) -> dict[str, list[Any]]:
+    return {
+        "entry_id": [row.id for row in batch],
+        "project_id": [row.project_id for row in batch],
+        "project_name": [row.project_name for row in batch],
+        "description": [row.description for row in batch],
+        "started_at": [row.started_at for row in batch],
+        "ended_at": [row.ended_at for row in batch],
+        "duration_minutes": [row.duration_minutes for row in batch],
+        "is_billable": [row.is_billable for row in batch],
+        "hourly_rate": [row.hourly_rate for row in batch],
+    }
+
+
+def export_summary_parquet(report: ReportResponse, filename: str) -> str:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = _export_path(filename)
+    schema = _summary_parquet_schema().with_metadata(
+        {
+            "total_minutes": str(report.total_minutes),
+            "total_billable_minutes": str(report.total_billable_minutes),
+            "total_billable_amount": str(report.total_billable_amount),
+        }
+    )
+    table = pa.Table.from_pylist(
+        [row.model_dump(include=set(SUMMARY_HEADER)) for row in report.summary],
+        schema=schema,
+    )
+    pq.write_table(table, str(path), compression="zstd")
+    return str(path)
+
+
+async def export_detailed_parquet(
+    batches: AsyncIterator[Sequence[Any]], filename: str
+) -> str:
+    """Write streamed entry batches as Parquet, one row group per batch."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = _export_path(filename)
+    schema = _detail_parquet_schema()
+    with pq.ParquetWriter(str(path), schema, compression="zstd") as writer:
+        async for batch in batches:
+            writer.write_batch(pa.RecordBatch.from_pydict(_detail_columns(batch), schema=schema))
+    return str(path)
+
+
+def _sync_rows(
+    batches: AsyncIterator[Sequence[Any]], loop: asyncio.AbstractEventLoop
+) -> Iterator[Any]:
+    # Runs on the render thread: pull one batch at a time from the event loop.
+    iterator = aiter(batches)
+    while True:
+        try:
+            batch = asyncio.run_coroutine_threadsafe(anext(iterator), loop).result()
+        except StopAsyncIteration:
+            return
+        yield from batch
+
+
+def export_to_pdf(report: ReportResponse, filename: str) -> str:
+    from app.services.pdf_renderer import render_table_pdf
+
+    path = _export_path(filename)
+    rows = [
+        [row.project_name, row.total_minutes, row.total_billable_minutes, row.billable_amount]
+        for row in report.summary
+    ]
+    rows.append(
+        [
+            "Total",
+            report.total_minutes,
+            report.total_billable_minutes,
+            report.total_billable_amount,
+        ]
+    )
+    render_table_pdf(
+        str(path),
+        "Time Report",
+        ["Project", "Total Minutes", "Billable Minutes", "Billable Amount"],
+        rows,
+    )
+    return str(path)
+
+
+async def export_detailed_pdf(
+    batches: AsyncIterator[Sequence[Any]], filename: str
+) -> str:
+    from app.services.pdf_renderer import render_table_pdf
+
+    path = _export_path(filename)
+    loop = asyncio.get_running_loop()
+    rows = (_pdf_detail_values(row) for row in _sync_rows(batches, loop))
+    await asyncio.to_thread(
+        render_table_pdf,
+        str(path),
+        "Time Entries",
+        PDF_DETAIL_HEADER,
+        rows,
+        col_widths=PDF_DETAIL_WIDTHS,
+        wide=True,
     )
-    elements.append(table)
-    doc.build(elements)
     return str(path)
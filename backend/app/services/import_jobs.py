@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import csv
+import json
+import logging
+from collections.abc import Iterator
+from datetime import datetime
+from decimal import Decimal
+from itertools import islice
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.db import SessionLocal
+from app.models import ChangeScope, ImportFormat, Project, TimeEntryImport, User
+from app.repositories.change_version_repository import ChangeVersionRepository
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.rollup_repository import TimeEntryRollupRepository, collect_deltas
+from app.repositories.time_entry_import_repository import TimeEntryImportRepository
+from app.repositories.time_entry_repository import TimeEntryRepository
+from app.schemas.time_entry import TimeEntryCreate
+from app.utils.dates import utc_naive
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Columns that identify a row in the source tool rather than describe the entry.
+IGNORED_COLUMNS = {"id", "entry_id", "user_id"}
+
+ParsedRow = tuple[int, dict[str, Any] | None, str | None]
+
+
+def iter_import_rows(path: Path, import_format: str) -> Iterator[ParsedRow]:
+    """Yield ``(line, row, error)`` one row at a time, never loading the file."""
+    with path.open(newline="", encoding="utf-8-sig") as handle:
+        if import_format == ImportFormat.CSV.value:
+            reader = csv.DictReader(handle)
+            for row in reader:
+                yield reader.line_num, row, None
+            return
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield line_number, None, "Invalid JSON"
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, "Expected a JSON object"
+                continue
+            yield line_number, row, None
+
+
+def _normalize_row(raw: dict[str, Any]) -> dict[str, Any]:
+    row = {}
+    for key, value in raw.items():
+        if key is None:
+            continue
+        name = key.strip().lower()
+        if name in IGNORED_COLUMNS:
+            continue
+        row[name] = None if isinstance(value, str) and not value.strip() else value
+    return row
+
+
+def _format_errors(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+class TimeEntryImporter:
+    """Import one uploaded file in batches, each committed with its progress.
+
+    Projects are resolved through a per-import cache of the user's projects by
+    id and (case-insensitive) name; unknown names are created once.
+    """
+
+    def __init__(self, session: AsyncSession, record: TimeEntryImport, user: User):
+        self.session = session
+        self.record = record
+        self.user = user
+        self.entries = TimeEntryRepository(session)
+        self.projects = ProjectRepository(session)
+        self.rollups = TimeEntryRollupRepository(session)
+        self.versions = ChangeVersionRepository(session)
+        self._project_ids: set[int] = set()
+        self._project_names: dict[str, int] = {}
+
+    async def run(self) -> None:
+        for project in await self.projects.list(owner_id=self.user.id):
+            self._project_ids.add(project.id)
+            self._project_names.setdefault(project.name.strip().lower(), project.id)
+
+        rows = iter_import_rows(Path(self.record.file_path), self.record.format)
+        while batch := list(islice(rows, settings.import_batch_size)):
+            await self._import_batch(batch)
+
+    async def _import_batch(self, batch: list[ParsedRow]) -> None:
+        inserts: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+        projects_created = 0
+        for line, raw, error in batch:
+            if error is None:
+                row = _normalize_row(raw)
+                project_id, project_name, error = self._project_reference(row)
+            if error is None:
+                try:
+                    # Rows naming a new project are validated against a
+                    # placeholder id, so rejected rows never create one.
+                    entry = TimeEntryCreate.model_validate({**row, "project_id": project_id or 0})
+                except ValidationError as exc:
+                    error = _format_errors(exc)
+            if error is not None:
+                errors.append({"line": line, "error": error})
+                continue
+            if project_name is not None:
+                project_id, created = await self._project_for_name(project_name)
+                projects_created += created
+            values = {**entry.model_dump(), "project_id": project_id}
+            values["started_at"] = utc_naive(values["started_at"])
+            values["ended_at"] = utc_naive(values["ended_at"])
+            if values["hourly_rate"] is not None:
+                values["hourly_rate"] = Decimal(str(values["hourly_rate"]))
+            inserts.append({"user_id": self.user.id, **values})
+
+        await self.entries.bulk_insert(inserts)
+        await self.rollups.apply_deltas(
+            collect_deltas(SimpleNamespace(**values) for values in inserts)
+        )
+        scopes = [ChangeScope.TIME_ENTRIES] if inserts else []
+        if projects_created:
+            scopes.append(ChangeScope.PROJECTS)
+        if scopes:
+            await self.versions.bump(self.user.id, *scopes)
+
+        record = self.record
+        record.rows_processed += len(batch)
+        record.rows_imported += len(inserts)
+        record.rows_failed += len(errors)
+        record.projects_created += projects_created
+        record.batches_completed += 1
+        room = settings.import_max_recorded_errors - len(record.errors)
+        if errors and room > 0:
+            record.errors = [*record.errors, *errors[:room]]
+        await self.session.commit()
+
+    def _project_reference(
+        self, row: dict[str, Any]
+    ) -> tuple[int | None, str | None, str | None]:
+        """Pop the row's project columns as ``(project_id, project_name, error)``.
+
+        Named projects are looked up (or created) only after the row validates.
+        """
+        name = row.pop("project_name", None) or row.pop("project", None)
+        project_id = row.pop("project_id", None)
+        if name is not None:
+            return None, name, None
+        if project_id is None:
+            return None, None, "project_id or project_name is required"
+        try:
+            project_id = int(project_id)
+        except (TypeError, ValueError):
+            return None, None, "project_id must be an integer"
+        if project_id not in self._project_ids:
+            return None, None, "Project not found"
+        return project_id, None, None
+
+    async def _project_for_name(self, name: Any) -> tuple[int, int]:
+        """Return the id of the project called ``name`` and whether it was created."""
+        key = str(name).strip().lower()
+        if key in self._project_names:
+            return self._project_names[key], 0
+        project = Project(name=str(name).strip()[:255], owner_id=self.user.id)
+        await self.projects.add(project)
+        self._project_ids.add(project.id)
+        self._project_names[key] = project.id
+        return project.id, 1
+
+
+async def import_time_entries(import_id: int) -> None:
+    async with SessionLocal() as session:
+        repo = TimeEntryImportRepository(session)
+        record = await repo.get(import_id)
+        if not record or record.status != "pending":
+            logger.info("Import %s missing or already started", import_id)
+            return
+        # The upload is only needed until this run finishes either way.
+        upload = Path(record.file_path)
+        try:
+            user = await session.get(User, record.user_id)
+            if not user:
+                record.status = "failed"
+                await session.commit()
+                return
+            record.status = "processing"
+            record.started_at = datetime.utcnow()
+            await session.commit()
+
+            try:
+                await TimeEntryImporter(session, record, user).run()
+            except Exception:
+                await session.rollback()
+                record = await repo.get(import_id)
+                record.status = "failed"
+                record.finished_at = datetime.utcnow()
+                await session.commit()
+                raise
+            record.status = "completed"
+            record.finished_at = datetime.utcnow()
+            await session.commit()
+        finally:
+            upload.unlink(missing_ok=True)
+        logger.info(
+            "Import %s: %s rows imported, %s failed",
+            import_id,
+            record.rows_imported,
+            record.rows_failed,
+        )
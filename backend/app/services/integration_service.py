@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import IntegrationToken, User
@@ -27,5 +30,5 @@ class IntegrationService:
         await self.session.refresh(token)
         return token
 
-    async def list_tokens(self, user: User) -> list[IntegrationToken]:
-        return await self.integrations.list(user_id=user.id)
+    async def list_tokens(self, user: User, fields: Sequence[str]) -> Sequence[RowMapping]:
+        return await self.integrations.list_rows(fields, IntegrationToken.user_id == user.id)
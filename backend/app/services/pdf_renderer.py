@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import landscape, letter
+from reportlab.lib.units import inch
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Table, TableStyle
+
+FONT = "Helvetica"
+FONT_SIZE = 8
+LINE_HEIGHT = 10
+ROW_HEIGHT = 14  # one line of text plus the cell padding
+CELL_PADDING = 6  # TableStyle's default left/right padding
+MAX_CELL_LINES = 6
+MARGIN = 0.5 * inch
+TITLE_BAND = 0.5 * inch
+
+# Built once and shared by the table on every page.
+TABLE_STYLE = TableStyle(
+    [
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), FONT_SIZE),
+        ("LEADING", (0, 0), (-1, -1), LINE_HEIGHT),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f2f2f2")]),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+    ]
+)
+
+
+def _fitting_prefix(text: str, width: float) -> int:
+    used = 0.0
+    for index, char in enumerate(text):
+        used += stringWidth(char, FONT, FONT_SIZE)
+        if used > width:
+            return max(index, 1)
+    return len(text)
+
+
+def cell_lines(value: Any, width: float) -> list[str]:
+    """Wrap a cell's text to ``width`` points, breaking words that do not fit.
+
+    Text longer than ``MAX_CELL_LINES`` lines is cut there and its last line
+    ends in an ellipsis, so a shortened value is always visibly marked.
+    """
+    text = "" if value is None else str(value)
+    if stringWidth(text, FONT, FONT_SIZE) <= width:
+        return [text]
+    lines: list[str] = []
+    for line in simpleSplit(text, FONT, FONT_SIZE, width):
+        while len(lines) <= MAX_CELL_LINES and line:
+            cut = _fitting_prefix(line, width)
+            lines.append(line[:cut])
+            line = line[cut:].lstrip()
+    if len(lines) <= MAX_CELL_LINES:
+        return lines
+    last = lines[MAX_CELL_LINES - 1]
+    last = last[: _fitting_prefix(last, width - stringWidth(" …", FONT, FONT_SIZE))]
+    return [*lines[: MAX_CELL_LINES - 1], last.rstrip() + " …"]
+
+
+def render_table_pdf(
+    path: str,
+    title: str,
+    header: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    *,
+    col_widths: Sequence[float] | None = None,
+    wide: bool = False,
+) -> None:
+    """Render ``rows`` as a paginated table, one ``Table`` drawn per page.
+
+    Rows are consumed lazily and each page's table is dropped once drawn, so
+    cell objects never outlive their page. reportlab still keeps every page's
+    compressed content stream until ``save``, so memory grows with the page
+    count, by far less than the rows themselves (see
+    ``benchmarks/bench_pdf_export.py``).
+    """
+    pagesize = landscape(letter) if wide else letter
+    canvas = Canvas(path, pagesize=pagesize, pageCompression=1)
+    canvas.setTitle(title)
+    width = pagesize[0] - 2 * MARGIN
+    top = pagesize[1] - MARGIN - TITLE_BAND
+    available = top - MARGIN - ROW_HEIGHT
+    widths = list(col_widths or [width / len(header)] * len(header))
+    text_widths = [max(column - 2 * CELL_PADDING, FONT_SIZE) for column in widths]
+
+    def draw_page(cells: list[list[str]], heights: list[float]) -> None:
+        canvas.setFont("Helvetica-Bold", 14)
+        canvas.drawString(MARGIN, pagesize[1] - MARGIN - 14, title)
+        canvas.setFont(FONT, FONT_SIZE)
+        canvas.drawRightString(
+            pagesize[0] - MARGIN, 0.3 * inch, f"Page {canvas.getPageNumber()}"
+        )
+        table = Table(
+            [list(header), *cells], colWidths=widths, rowHeights=[ROW_HEIGHT, *heights]
+        )
+        table.setStyle(TABLE_STYLE)
+        _, height = table.wrapOn(canvas, width, top - MARGIN)
+        table.drawOn(canvas, MARGIN, top - height)
+        canvas.showPage()
+
+    def wrapped(source: Iterable[Sequence[Any]]) -> Iterator[tuple[list[str], float]]:
+        for row in source:
+            lines = [cell_lines(value, limit) for value, limit in zip(row, text_widths)]
+            depth = max(len(cell) for cell in lines)
+            yield ["\n".join(cell) for cell in lines], ROW_HEIGHT + (depth - 1) * LINE_HEIGHT
+
+    cells: list[list[str]] = []
+    heights: list[float] = []
+    used = 0.0
+    for row, height in wrapped(rows):
+        if cells and used + height > available:
+            draw_page(cells, heights)
+            cells, heights, used = [], [], 0.0
+        cells.append(row)
+        heights.append(height)
+        used += height
+    draw_page(cells, heights)
+    canvas.save()
@@ -1,7 +1,11 @@
+from collections.abc import Sequence
+
 from fastapi import HTTPException, status
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Project, User
+from app.models import ChangeScope, Project, User
+from app.repositories.change_version_repository import ChangeVersionRepository
 from app.repositories.project_repository import ProjectRepository
 from app.schemas.project import ProjectCreate, ProjectUpdate
 
@@ -10,9 +14,13 @@ class ProjectService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.projects = ProjectRepository(session)
+        self.versions = ChangeVersionRepository(session)
+
+    async def list_for_user(self, user: User, fields: Sequence[str]) -> Sequence[RowMapping]:
+        return await self.projects.list_rows_by_owner(user.id, fields)
 
-    async def list_for_user(self, user: User) -> list[Project]:
-        return await self.projects.list_by_owner(user.id)
+    async def list_version(self, user: User) -> int:
+        return await self.versions.get_version(user.id, ChangeScope.PROJECTS)
 
     async def create(self, user: User, data: ProjectCreate) -> Project:
         project = Project(
@@ -22,6 +30,7 @@ class ProjectService:
             owner_id=user.id,
         )
         await self.projects.add(project)
+        await self.versions.bump(user.id, ChangeScope.PROJECTS)
         await self.session.commit()
         await self.session.refresh(project)
         return project
@@ -30,6 +39,7 @@ class ProjectService:
         project = await self._get_owned_project(user, project_id)
         for field, value in data.model_dump(exclude_unset=True).items():
             setattr(project, field, value)
+        await self.versions.bump(user.id, ChangeScope.PROJECTS)
         await self.session.commit()
         await self.session.refresh(project)
         return project
@@ -37,6 +47,7 @@ class ProjectService:
     async def archive(self, user: User, project_id: int) -> Project:
         project = await self._get_owned_project(user, project_id)
         project.is_archived = True
+        await self.versions.bump(user.id, ChangeScope.PROJECTS)
         await self.session.commit()
         await self.session.refresh(project)
         return project
@@ -1,7 +1,12 @@
+from collections.abc import Sequence
+
 from fastapi import HTTPException, status
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models import Reminder, User
+from app.models import ChangeScope, Reminder, User
+from app.repositories.change_version_repository import ChangeVersionRepository
 from app.repositories.reminder_repository import ReminderRepository
+from app.repositories.tombstone_repository import TombstoneRepository
 from app.schemas.reminder import ReminderCreate, ReminderUpdate
 
 
@@ -9,13 +14,19 @@ class ReminderService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.reminders = ReminderRepository(session)
+        self.versions = ChangeVersionRepository(session)
+        self.tombstones = TombstoneRepository(session)
+
+    async def list_for_user(self, user: User, fields: Sequence[str]) -> Sequence[RowMapping]:
+        return await self.reminders.list_active_rows_by_user(user.id, fields)
 
-    async def list_for_user(self, user: User) -> list[Reminder]:
-        return await self.reminders.list_active_by_user(user.id)
+    async def list_version(self, user: User) -> int:
+        return await self.versions.get_version(user.id, ChangeScope.REMINDERS)
 
     async def create(self, user: User, payload: ReminderCreate) -> Reminder:
         reminder = Reminder(user_id=user.id, **payload.model_dump())
         await self.reminders.add(reminder)
+        await self.versions.bump(user.id, ChangeScope.REMINDERS)
         await self.session.commit()
         await self.session.refresh(reminder)
         self._schedule_task(reminder)
@@ -27,6 +38,7 @@ class ReminderService:
         reminder = await self._get_owned(user, reminder_id)
         for field, value in payload.model_dump(exclude_unset=True).items():
             setattr(reminder, field, value)
+        await self.versions.bump(user.id, ChangeScope.REMINDERS)
         await self.session.commit()
         await self.session.refresh(reminder)
         self._schedule_task(reminder)
@@ -35,6 +47,8 @@ class ReminderService:
     async def delete(self, user: User, reminder_id: int) -> None:
         reminder = await self._get_owned(user, reminder_id)
         await self.reminders.delete(reminder)
+        await self.tombstones.record(user.id, ChangeScope.REMINDERS, [reminder.id])
+        await self.versions.bump(user.id, ChangeScope.REMINDERS)
         await self.session.commit()
 
     async def _get_owned(self, user: User, reminder_id: int) -> Reminder:
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+from app.core.config import get_settings
+from app.schemas.report import ReportFilters
+
+logger = logging.getLogger(__name__)
+
+
+def report_cache_key(
+    user_id: int, versions: tuple[int, ...], filters: ReportFilters, zone_name: str = "UTC"
+) -> str:
+    normalized = filters.model_copy(
+        update={
+            "project_ids": sorted(set(filters.project_ids)) if filters.project_ids else None
+        }
+    )
+    digest = hashlib.sha256(normalized.model_dump_json().encode()).hexdigest()
+    version_part = ".".join(str(version) for version in versions)
+    return f"report:{user_id}:{zone_name}:{version_part}:{digest}"
+
+
+class ReportCache:
+    """Two-tier cache for serialized report responses.
+
+    Entries live in an in-process LRU with a TTL and, when enabled, in Redis
+    under the same key. Keys embed the user's change versions, so writes make
+    old entries unreachable instead of having to delete them.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: int,
+        redis_url: str | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis_url = redis_url
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._redis: Any = None
+        self._redis_loop: asyncio.AbstractEventLoop | None = None
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _redis_client(self) -> Any:
+        if not self.redis_url:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            from redis import asyncio as aioredis
+
+            self._redis = aioredis.from_url(self.redis_url)
+            self._redis_loop = loop
+        return self._redis
+
+    def _get_local(self, key: str) -> str | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, payload = item
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def _set_local(self, key: str, payload: str) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get(self, key: str) -> str | None:
+        payload = self._get_local(key)
+        if payload is not None:
+            self.hits += 1
+            return payload
+
+        redis = self._redis_client()
+        if redis is not None:
+            try:
+                cached = await redis.get(key)
+            except Exception:  # pragma: no cover - depends on redis availability
+                logger.warning("Report cache redis lookup failed", exc_info=True)
+                cached = None
+            if cached is not None:
+                payload = cached.decode() if isinstance(cached, bytes) else cached
+                self._set_local(key, payload)
+                self.redis_hits += 1
+                return payload
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, payload: str) -> None:
+        self._set_local(key, payload)
+        redis = self._redis_client()
+        if redis is not None:
+            try:
+                await redis.set(key, payload, ex=self.ttl_seconds)
+            except Exception:  # pragma: no cover - depends on redis availability
+                logger.warning("Report cache redis write failed", exc_info=True)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+@lru_cache
+def get_report_cache() -> ReportCache:
+    settings = get_settings()
+    return ReportCache(
+        max_entries=settings.report_cache_max_entries,
+        ttl_seconds=settings.report_cache_ttl_seconds,
+        redis_url=settings.redis_url if settings.report_cache_use_redis else None,
+    )
@@ -1,18 +1,34 @@
-from collections import defaultdict
-from datetime import datetime, time
+import hashlib
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+from typing import Any
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models import ReportExport, User
+
+from app.core.config import get_settings
+from app.models import ChangeScope, ReportExport, User
+from app.repositories.change_version_repository import ChangeVersionRepository
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.report_repository import ReportExportRepository
+from app.repositories.rollup_repository import TimeEntryRollupRepository
 from app.repositories.time_entry_repository import TimeEntryRepository
 from app.schemas.report import (
     ExportRequest,
     ReportFilters,
     ReportResponse,
+    ReportSeries,
     ReportSummary,
 )
+from app.services.report_cache import get_report_cache, report_cache_key
+from app.utils.dates import bucket_range, bucket_start, local_day_window, user_zone
+
+settings = get_settings()
+
+CENTS = Decimal("0.01")
 
 
 class ReportService:
@@ -21,58 +37,309 @@ class ReportService:
         self.entries = TimeEntryRepository(session)
         self.projects = ProjectRepository(session)
         self.exports = ReportExportRepository(session)
+        self.versions = ChangeVersionRepository(session)
+        self.rollups = TimeEntryRollupRepository(session)
 
     async def summarize(self, user: User, filters: ReportFilters) -> ReportResponse:
-        await self._validate_project_scope(user, filters.project_ids)
-        date_from_dt = datetime.combine(filters.date_from, time.min)
-        date_to_dt = datetime.combine(filters.date_to, time.max)
-        entries = await self.entries.list_filtered(
+        if not settings.report_cache_enabled:
+            return await self._summarize(user, filters)
+
+        versions = await self.versions.get_versions(
+            user.id, ChangeScope.TIME_ENTRIES, ChangeScope.PROJECTS
+        )
+        key = report_cache_key(
+            user.id, tuple(versions.values()), filters, user_zone(user.timezone).key
+        )
+        cache = get_report_cache()
+        cached = await cache.get(key)
+        if cached is not None:
+            return ReportResponse.model_validate_json(cached)
+
+        report = await self._summarize(user, filters)
+        await cache.set(key, report.model_dump_json())
+        return report
+
+    async def summarize_many(
+        self, user: User, filters_list: list[ReportFilters]
+    ) -> list[ReportResponse]:
+        results: list[ReportResponse | None] = [None] * len(filters_list)
+        keys: list[str | None] = [None] * len(filters_list)
+        cache = get_report_cache() if settings.report_cache_enabled else None
+        if cache is not None:
+            versions = await self.versions.get_versions(
+                user.id, ChangeScope.TIME_ENTRIES, ChangeScope.PROJECTS
+            )
+            zone_name = user_zone(user.timezone).key
+            for index, filters in enumerate(filters_list):
+                keys[index] = report_cache_key(
+                    user.id, tuple(versions.values()), filters, zone_name
+                )
+                cached = await cache.get(keys[index])
+                if cached is not None:
+                    results[index] = ReportResponse.model_validate_json(cached)
+
+        pending = [index for index, report in enumerate(results) if report is None]
+        if pending:
+            reports = await self._summarize_batch(user, [filters_list[i] for i in pending])
+            for index, report in zip(pending, reports):
+                results[index] = report
+                if cache is not None:
+                    await cache.set(keys[index], report.model_dump_json())
+        return results
+
+    async def _summarize_batch(
+        self, user: User, filters_list: list[ReportFilters]
+    ) -> list[ReportResponse]:
+        # One daily grid over the union of all ranges feeds every report.
+        zone = user_zone(user.timezone)
+        requested = sorted({pid for filters in filters_list for pid in filters.project_ids or []})
+        unfiltered = any(not filters.project_ids for filters in filters_list)
+        start, end = local_day_window(
+            min(filters.date_from for filters in filters_list),
+            max(filters.date_to for filters in filters_list),
+            zone,
+        )
+        rows = await self.entries.aggregate_daily(
             user_id=user.id,
-            project_ids=filters.project_ids,
-            date_from=date_from_dt,
-            date_to=date_to_dt,
+            project_ids=None if unfiltered else requested,
+            start=start,
+            end=end,
+            zone_name=zone.key,
         )
-        project_map = await self.projects.get_by_ids(
-            list({entry.project_id for entry in entries})
+        projects = await self.projects.get_by_ids(
+            sorted(set(requested) | {row.project_id for row in rows})
         )
+        if requested:
+            self._check_project_scope(
+                user,
+                requested,
+                {pid: project.owner_id for pid, project in projects.items() if pid in requested},
+            )
+        return [self._report_from_days(filters, rows, projects) for filters in filters_list]
 
-        summary = defaultdict(lambda: {"total_minutes": 0, "total_billable_minutes": 0})
-        for entry in entries:
-            bucket = summary[entry.project_id]
-            bucket["total_minutes"] += entry.duration_minutes
-            if entry.is_billable:
-                bucket["total_billable_minutes"] += entry.duration_minutes
+    @staticmethod
+    def _report_from_days(
+        filters: ReportFilters, rows: list[Any], projects: dict[int, Any]
+    ) -> ReportResponse:
+        wanted = set(filters.project_ids) if filters.project_ids else None
+        selected = [
+            row
+            for row in rows
+            if filters.date_from <= row.bucket <= filters.date_to
+            and (wanted is None or row.project_id in wanted)
+        ]
+        totals: dict[int, list] = {}
+        for row in selected:
+            bucket = totals.setdefault(row.project_id, [0, 0, Decimal("0")])
+            bucket[0] += row.total_minutes
+            bucket[1] += row.total_billable_minutes
+            bucket[2] += Decimal(row.billable_amount)
 
         summary_list = [
             ReportSummary(
                 project_id=project_id,
-                project_name=(
-                    project_map.get(project_id).name
-                    if project_map.get(project_id)
-                    else "Unknown"
+                project_name=projects[project_id].name if project_id in projects else "Unknown",
+                total_minutes=minutes,
+                total_billable_minutes=billable,
+                billable_amount=amount.quantize(CENTS, rounding=ROUND_HALF_UP),
+            )
+            for project_id, (minutes, billable, amount) in sorted(totals.items())
+            if minutes
+        ]
+
+        series = None
+        if filters.granularity:
+            granularity = filters.granularity.value
+            buckets = bucket_range(filters.date_from, filters.date_to, granularity)
+            bucket_index = {bucket: index for index, bucket in enumerate(buckets)}
+            project_index = {item.project_id: index for index, item in enumerate(summary_list)}
+            series_totals = [[0] * len(buckets) for _ in summary_list]
+            series_billable = [[0] * len(buckets) for _ in summary_list]
+            for row in selected:
+                project = project_index.get(row.project_id)
+                if project is None:
+                    continue
+                bucket = bucket_index[bucket_start(row.bucket, granularity)]
+                series_totals[project][bucket] += row.total_minutes
+                series_billable[project][bucket] += row.total_billable_minutes
+            series = ReportSeries(
+                granularity=filters.granularity,
+                buckets=buckets,
+                project_ids=list(project_index),
+                total_minutes=series_totals,
+                total_billable_minutes=series_billable,
+            )
+
+        return ReportResponse(
+            summary=summary_list,
+            total_minutes=sum(item.total_minutes for item in summary_list),
+            total_billable_minutes=sum(item.total_billable_minutes for item in summary_list),
+            total_billable_amount=sum(
+                (item.billable_amount for item in summary_list), Decimal("0.00")
+            ),
+            series=series,
+        )
+
+    async def _summarize(self, user: User, filters: ReportFilters) -> ReportResponse:
+        start, end = local_day_window(
+            filters.date_from, filters.date_to, user_zone(user.timezone)
+        )
+        rows = await self.entries.aggregate_by_project(
+            user_id=user.id,
+            project_ids=filters.project_ids,
+            start=start,
+            end=end,
+        )
+        if filters.project_ids:
+            self._check_project_scope(
+                user, filters.project_ids, {row.project_id: row.owner_id for row in rows}
+            )
+
+        summary_list = [
+            ReportSummary(
+                project_id=row.project_id,
+                project_name=row.project_name,
+                total_minutes=row.total_minutes,
+                total_billable_minutes=row.total_billable_minutes,
+                billable_amount=Decimal(row.billable_amount).quantize(
+                    CENTS, rounding=ROUND_HALF_UP
                 ),
-                total_minutes=values["total_minutes"],
-                total_billable_minutes=values["total_billable_minutes"],
             )
-            for project_id, values in summary.items()
+            for row in rows
+            if row.total_minutes
         ]
 
+        series = None
+        if filters.granularity:
+            series = await self._series(
+                user, filters, start, end, [item.project_id for item in summary_list]
+            )
+
         total_minutes = sum(item.total_minutes for item in summary_list)
         total_billable = sum(item.total_billable_minutes for item in summary_list)
+        total_amount = sum((item.billable_amount for item in summary_list), Decimal("0.00"))
         return ReportResponse(
             summary=summary_list,
             total_minutes=total_minutes,
             total_billable_minutes=total_billable,
+            total_billable_amount=total_amount,
+            series=series,
+        )
+
+    async def _series(
+        self,
+        user: User,
+        filters: ReportFilters,
+        start: datetime,
+        end: datetime,
+        project_ids: list[int],
+    ) -> ReportSeries:
+        granularity = filters.granularity.value
+        buckets = bucket_range(filters.date_from, filters.date_to, granularity)
+        bucket_index = {bucket: index for index, bucket in enumerate(buckets)}
+        project_index = {project_id: index for index, project_id in enumerate(project_ids)}
+        totals = [[0] * len(buckets) for _ in project_ids]
+        billable = [[0] * len(buckets) for _ in project_ids]
+
+        rows = await self.entries.aggregate_series(
+            user_id=user.id,
+            project_ids=filters.project_ids,
+            start=start,
+            end=end,
+            granularity=granularity,
+            zone_name=user_zone(user.timezone).key,
+        )
+        for row in rows:
+            project = project_index.get(row.project_id)
+            bucket = bucket_index.get(row.bucket)
+            if project is None or bucket is None:
+                continue
+            totals[project][bucket] = row.total_minutes
+            billable[project][bucket] = row.total_billable_minutes
+
+        return ReportSeries(
+            granularity=filters.granularity,
+            buckets=buckets,
+            project_ids=project_ids,
+            total_minutes=totals,
+            total_billable_minutes=billable,
+        )
+
+    def stream_entries(
+        self, user: User, filters: ReportFilters, batch_size: int
+    ) -> AsyncIterator[Sequence[Any]]:
+        start, end = local_day_window(
+            filters.date_from, filters.date_to, user_zone(user.timezone)
+        )
+        return self.entries.stream_detailed(
+            user_id=user.id,
+            project_ids=filters.project_ids,
+            start=start,
+            end=end,
+            batch_size=batch_size,
+        )
+
+    async def estimate_export_rows(self, user: User, payload: ExportRequest) -> int:
+        await self._validate_project_scope(user, payload.project_ids)
+        if not payload.detailed:
+            return 0
+        start, end = local_day_window(
+            payload.date_from, payload.date_to, user_zone(user.timezone)
+        )
+        return await self.rollups.count_entries(
+            user_id=user.id,
+            project_ids=payload.project_ids,
+            day_from=start.date(),
+            # ``end`` is exclusive; a window ending at UTC midnight stops the day before.
+            day_to=(end - timedelta(microseconds=1)).date(),
+        )
+
+    async def export_content_key(self, user: User, payload: ExportRequest) -> str:
+        versions = await self.versions.get_versions(
+            user.id, ChangeScope.TIME_ENTRIES, ChangeScope.PROJECTS
         )
+        content = {
+            "project_ids": sorted(set(payload.project_ids)) if payload.project_ids else None,
+            "date_from": payload.date_from.isoformat(),
+            "date_to": payload.date_to.isoformat(),
+            "format": payload.format.value,
+            "detailed": payload.detailed,
+            "timezone": user_zone(user.timezone).key,
+            "versions": list(versions.values()),
+        }
+        encoded = json.dumps(content, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    async def find_reusable(self, user_id: int, content_key: str) -> ReportExport | None:
+        """Return an export a new request with ``content_key`` can attach to.
+
+        Exports in flight without a heartbeat for ``export_heartbeat_timeout_seconds``
+        are treated as lost, and completed ones only count while their file exists.
+        """
+        timeout = timedelta(seconds=settings.export_heartbeat_timeout_seconds)
+        active_since = await self.exports.database_now() - timeout
+        for export in await self.exports.list_reusable(user_id, content_key, active_since):
+            if export.status != "completed" or (
+                export.file_path and Path(export.file_path).exists()
+            ):
+                return export
+        return None
 
     async def request_export(self, user: User, payload: ExportRequest) -> ReportExport:
         await self._validate_project_scope(user, payload.project_ids)
+        content_key = await self.export_content_key(user, payload)
+        existing = await self.find_reusable(user.id, content_key)
+        if existing:
+            return existing
+
         export = ReportExport(
             user_id=user.id,
             project_ids=payload.project_ids,
             date_from=payload.date_from.isoformat(),
             date_to=payload.date_to.isoformat(),
             format=payload.format.value,
+            detailed=payload.detailed,
+            content_key=content_key,
             status="pending",
         )
         await self.exports.add(export)
@@ -82,8 +349,12 @@ class ReportService:
         from app.celery.app import celery_app
 
         try:
+            # A short countdown lets summary exports requested together be
+            # claimed by one task and rendered from a single aggregation.
             task = celery_app.send_task(
-                "app.celery.tasks.generate_report_export", args=[export.id]
+                "app.celery.tasks.generate_report_export",
+                args=[export.id],
+                countdown=None if export.detailed else settings.export_coalesce_delay_seconds,
             )
             export.task_id = task.id
         except Exception as exc:  # pragma: no cover - depends on broker state
@@ -104,17 +375,26 @@ class ReportService:
         if not project_ids:
             return
         projects = await self.projects.get_by_ids(project_ids)
-        missing = set(project_ids) - set(projects.keys())
+        self._check_project_scope(
+            user,
+            project_ids,
+            {project.id: project.owner_id for project in projects.values()},
+        )
+
+    @staticmethod
+    def _check_project_scope(
+        user: User, project_ids: list[int], owners: dict[int, int]
+    ) -> None:
+        missing = set(project_ids) - set(owners.keys())
         if missing:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
             )
-        for project in projects.values():
-            if project.owner_id != user.id:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Forbidden project access",
-                )
+        if any(owner_id != user.id for owner_id in owners.values()):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Forbidden project access",
+            )
 
     async def list_exports(self, user: User) -> list[ReportExport]:
         return await self.exports.list_by_user(user.id)
@@ -126,3 +406,23 @@ class ReportService:
                 status_code=status.HTTP_404_NOT_FOUND, detail="Export not found"
             )
         return export
+
+    async def get_export_file(self, user: User, export_id: int) -> tuple[ReportExport, Path]:
+        export = await self.get_export(user, export_id)
+        if export.status == "expired":
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE, detail="Export has expired"
+            )
+        if export.status != "completed" or not export.file_path:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Export is not ready"
+            )
+        path = Path(export.file_path)
+        if not path.is_file():
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE, detail="Export file is no longer available"
+            )
+        # Quota eviction is least-recently-downloaded first.
+        export.last_accessed_at = datetime.utcnow()
+        await self.session.commit()
+        return export, path
@@ -0,0 +1,88 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+
+from fastapi import HTTPException, status
+from sqlalchemy import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models import ChangeScope, User
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.reminder_repository import ReminderRepository
+from app.repositories.time_entry_repository import TimeEntryRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.schemas.project import ProjectRead
+from app.schemas.reminder import ReminderRead
+from app.schemas.sync import SyncDeleted
+from app.schemas.time_entry import TimeEntryRead
+from app.utils.dates import utc_naive
+from app.utils.pagination import decode_sync_token, encode_sync_token
+from app.utils.serialization import select_fields
+
+
+@dataclass
+class SyncResult:
+    token: str
+    full: bool
+    time_entries: Sequence[RowMapping]
+    projects: Sequence[RowMapping]
+    reminders: Sequence[RowMapping]
+    deleted: SyncDeleted
+
+
+class SyncService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.entries = TimeEntryRepository(session)
+        self.projects = ProjectRepository(session)
+        self.reminders = ReminderRepository(session)
+        self.tombstones = TombstoneRepository(session)
+
+    async def changes(self, user: User, token: str | None = None) -> SyncResult:
+        """Entries, projects and reminders written since ``token`` was issued.
+
+        The new token is the database clock read before any rows. Each delta
+        reaches ``sync_grace_seconds`` further back so writes committed just
+        after the previous read are not missed; clients apply deletions first,
+        then upsert. Without a token, or with one older than the tombstone
+        retention, the full state is returned with ``full`` set.
+        """
+        settings = get_settings()
+        try:
+            since = utc_naive(decode_sync_token(token)) if token else None
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid sync token"
+            ) from None
+
+        now = await self.tombstones.database_now()
+        retention = timedelta(days=settings.sync_tombstone_retention_days)
+        full = since is None or since < now - retention
+        after = None if full else since - timedelta(seconds=settings.sync_grace_seconds)
+
+        deleted = SyncDeleted()
+        if after is not None:
+            for scope, record_id in await self.tombstones.list_since(user.id, after):
+                if scope == ChangeScope.TIME_ENTRIES.value:
+                    deleted.time_entries.append(record_id)
+                elif scope == ChangeScope.REMINDERS.value:
+                    deleted.reminders.append(record_id)
+
+        entries = await self.entries.list_changed_rows(
+            user.id, select_fields(TimeEntryRead, None), after
+        )
+        projects = await self.projects.list_changed_rows(
+            user.id, select_fields(ProjectRead, None), after
+        )
+        reminders = await self.reminders.list_changed_rows(
+            user.id, select_fields(ReminderRead, None), after
+        )
+        return SyncResult(
+            token=encode_sync_token(now),
+            full=full,
+            time_entries=entries,
+            projects=projects,
+            reminders=reminders,
+            deleted=deleted,
+        )
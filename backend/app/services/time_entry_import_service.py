@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import anyio
+from fastapi import HTTPException, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ImportFormat, TimeEntryImport, User
+from app.repositories.time_entry_import_repository import TimeEntryImportRepository
+from app.services.exporters import sharded_filename
+
+IMPORT_DIR = Path("storage/imports")
+IMPORT_SUFFIXES = {
+    ".csv": ImportFormat.CSV,
+    ".ndjson": ImportFormat.NDJSON,
+    ".jsonl": ImportFormat.NDJSON,
+}
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _save_upload(upload: UploadFile, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    upload.file.seek(0)
+    with path.open("wb") as handle:
+        shutil.copyfileobj(upload.file, handle, COPY_CHUNK_SIZE)
+
+
+class TimeEntryImportService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.imports = TimeEntryImportRepository(session)
+
+    async def create_import(
+        self, user: User, upload: UploadFile, import_format: ImportFormat | None = None
+    ) -> TimeEntryImport:
+        if import_format is None:
+            import_format = IMPORT_SUFFIXES.get(Path(upload.filename or "").suffix.lower())
+        if import_format is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Unsupported import format; upload a .csv or .ndjson file",
+            )
+
+        record = TimeEntryImport(
+            user_id=user.id,
+            format=import_format.value,
+            filename=(upload.filename or "")[:255] or None,
+            status="pending",
+            errors=[],
+        )
+        await self.imports.add(record)
+        path = IMPORT_DIR / sharded_filename(f"import_{record.id}.{import_format.value}")
+        await anyio.to_thread.run_sync(_save_upload, upload, path)
+        record.file_path = str(path)
+        await self.session.commit()
+
+        from app.celery.app import celery_app
+
+        try:
+            task = celery_app.send_task(
+                "app.celery.tasks.import_time_entries", args=[record.id]
+            )
+            record.task_id = task.id
+        except Exception as exc:  # pragma: no cover - depends on broker state
+            record.status = "failed"
+            await self.session.commit()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Unable to queue import task",
+            ) from exc
+
+        await self.session.commit()
+        await self.session.refresh(record)
+        return record
+
+    async def get_import(self, user: User, import_id: int) -> TimeEntryImport:
+        record = await self.imports.get(import_id)
+        if not record or record.user_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Import not found"
+            )
+        return record
@@ -1,12 +1,34 @@
-from datetime import datetime
+import heapq
+from collections.abc import Sequence
+from datetime import datetime, timedelta
 
 from fastapi import HTTPException, status
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import TimeEntry, User
+from app.core.config import get_settings
+from app.models import ChangeScope, TimeEntry, User
+from app.repositories.change_version_repository import ChangeVersionRepository
 from app.repositories.project_repository import ProjectRepository
+from app.repositories.rollup_repository import TimeEntryRollupRepository, collect_deltas
 from app.repositories.time_entry_repository import TimeEntryRepository
-from app.schemas.time_entry import TimeEntryCreate, TimeEntryUpdate
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.schemas.time_entry import (
+    OverlapPolicy,
+    TimeEntryBulkCreate,
+    TimeEntryBulkDelete,
+    TimeEntryBulkOperation,
+    TimeEntryBulkResult,
+    TimeEntryCreate,
+    TimeEntryOverlap,
+    TimeEntryRead,
+    TimeEntryUpdate,
+)
+from app.utils.dates import entry_end, utc_naive
+from app.utils.pagination import decode_cursor, encode_cursor
+
+OVERLAP_HEADER = "X-Overlapping-Entries"
+OVERLAP_BATCH_SIZE = 5000
 
 
 class TimeEntryService:
@@ -14,48 +36,282 @@ class TimeEntryService:
         self.session = session
         self.entries = TimeEntryRepository(session)
         self.projects = ProjectRepository(session)
+        self.rollups = TimeEntryRollupRepository(session)
+        self.versions = ChangeVersionRepository(session)
+        self.tombstones = TombstoneRepository(session)
 
     async def list_for_user(
         self,
         user: User,
+        fields: Sequence[str],
         *,
         project_ids: list[int] | None = None,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
-    ) -> list[TimeEntry]:
-        return await self.entries.list_filtered(
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> tuple[Sequence[RowMapping], str | None]:
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            ) from None
+        # The cursor needs (started_at, id) even when the fieldset leaves them out.
+        columns = dict.fromkeys([*fields, "started_at", "id"])
+        entries = await self.entries.list_page(
+            list(columns),
             user_id=user.id,
+            limit=limit + 1,
+            after=after,
             project_ids=project_ids,
             date_from=date_from,
             date_to=date_to,
         )
+        if len(entries) <= limit:
+            return entries, None
+        entries = entries[:limit]
+        last = entries[-1]
+        return entries, encode_cursor(last["started_at"], last["id"])
+
+    async def list_version(self, user: User) -> int:
+        return await self.versions.get_version(user.id, ChangeScope.TIME_ENTRIES)
 
-    async def create(self, user: User, data: TimeEntryCreate) -> TimeEntry:
+    async def create(
+        self, user: User, data: TimeEntryCreate, *, on_overlap: OverlapPolicy = "allow"
+    ) -> tuple[TimeEntry, list[int]]:
         await self._ensure_project_access(user, data.project_id)
+        overlaps = await self._check_overlaps(
+            user, data.started_at, data.ended_at, data.duration_minutes, on_overlap
+        )
         entry = TimeEntry(user_id=user.id, **data.model_dump())
         await self.entries.add(entry)
+        await self.rollups.apply_deltas(collect_deltas([entry]))
+        await self.versions.bump(user.id, ChangeScope.TIME_ENTRIES)
         await self.session.commit()
         await self.session.refresh(entry)
-        return entry
+        return entry, overlaps
 
     async def update(
-        self, user: User, entry_id: int, data: TimeEntryUpdate
-    ) -> TimeEntry:
+        self,
+        user: User,
+        entry_id: int,
+        data: TimeEntryUpdate,
+        *,
+        on_overlap: OverlapPolicy = "allow",
+    ) -> tuple[TimeEntry, list[int]]:
         entry = await self._get_owned_entry(user, entry_id)
         payload = data.model_dump(exclude_unset=True)
         if "project_id" in payload:
             await self._ensure_project_access(user, payload["project_id"])
+        overlaps = await self._check_overlaps(
+            user,
+            payload.get("started_at", entry.started_at),
+            payload.get("ended_at", entry.ended_at),
+            payload.get("duration_minutes", entry.duration_minutes),
+            on_overlap,
+            exclude_id=entry.id,
+        )
+        deltas = collect_deltas([entry], sign=-1)
         for field, value in payload.items():
             setattr(entry, field, value)
+        await self.rollups.apply_deltas(collect_deltas([entry], into=deltas))
+        await self.versions.bump(user.id, ChangeScope.TIME_ENTRIES)
         await self.session.commit()
         await self.session.refresh(entry)
-        return entry
+        return entry, overlaps
+
+    async def find_overlaps(
+        self,
+        user: User,
+        started_at: datetime,
+        ended_at: datetime | None,
+        duration_minutes: int,
+        *,
+        exclude_id: int | None = None,
+    ) -> list[int]:
+        start = utc_naive(started_at)
+        end = entry_end(started_at, ended_at, duration_minutes)
+        if end <= start:
+            return []
+        candidates = await self.entries.overlap_candidates(
+            user_id=user.id,
+            start=start,
+            end=end,
+            lookback=timedelta(hours=get_settings().overlap_lookback_hours),
+            exclude_id=exclude_id,
+        )
+        return [
+            row.id
+            for row in candidates
+            if max(start, utc_naive(row.started_at))
+            < min(end, entry_end(row.started_at, row.ended_at, row.duration_minutes))
+        ]
+
+    async def overlap_report(
+        self, user: User, date_from: datetime | None = None, date_to: datetime | None = None
+    ) -> list[TimeEntryOverlap]:
+        """List every pair of the user's entries whose overlap falls in the range.
+
+        Entries are swept in start order while a heap keeps the ones still
+        running, so the cost is O(n log n) plus the number of pairs reported.
+        """
+        date_from, date_to = utc_naive(date_from), utc_naive(date_to)
+        running: list[tuple[datetime, int]] = []
+        overlaps: list[TimeEntryOverlap] = []
+        batches = self.entries.stream_intervals(
+            user_id=user.id,
+            start=date_from,
+            end=date_to,
+            lookback=timedelta(hours=get_settings().overlap_lookback_hours),
+            batch_size=OVERLAP_BATCH_SIZE,
+        )
+        async for batch in batches:
+            for row in batch:
+                start = utc_naive(row.started_at)
+                end = entry_end(row.started_at, row.ended_at, row.duration_minutes)
+                while running and running[0][0] <= start:
+                    heapq.heappop(running)
+                if end <= start:
+                    continue
+                # Everything still running started no later than this entry.
+                for other_end, other_id in running:
+                    overlap_end = min(end, other_end)
+                    if (date_from is None or overlap_end > date_from) and (
+                        date_to is None or start < date_to
+                    ):
+                        overlaps.append(
+                            TimeEntryOverlap(
+                                entry_id=other_id,
+                                other_entry_id=row.id,
+                                overlap_start=start,
+                                overlap_end=overlap_end,
+                            )
+                        )
+                heapq.heappush(running, (end, row.id))
+        return overlaps
 
     async def delete(self, user: User, entry_id: int) -> None:
         entry = await self._get_owned_entry(user, entry_id)
+        await self.rollups.apply_deltas(collect_deltas([entry], sign=-1))
         await self.entries.delete(entry)
+        await self.tombstones.record(user.id, ChangeScope.TIME_ENTRIES, [entry.id])
+        await self.versions.bump(user.id, ChangeScope.TIME_ENTRIES)
         await self.session.commit()
 
+    async def bulk_apply(
+        self, user: User, operations: list[TimeEntryBulkOperation]
+    ) -> list[TimeEntryBulkResult]:
+        """Apply mixed create/update/delete operations in one transaction.
+
+        Projects and entries are looked up with one query each; operations that
+        fail those checks get an error result and the rest are still applied.
+        """
+        project_ids = {op.data.project_id for op in operations if op.op == "create"}
+        project_ids |= {
+            op.data.project_id
+            for op in operations
+            if op.op == "update" and op.data.project_id is not None
+        }
+        projects = await self.projects.get_by_ids(list(project_ids))
+        owned_projects = {pid for pid, project in projects.items() if project.owner_id == user.id}
+        entry_ids = [op.id for op in operations if not isinstance(op, TimeEntryBulkCreate)]
+        entries = await self.entries.get_owned(user.id, entry_ids)
+
+        results: list[TimeEntryBulkResult | None] = [None] * len(operations)
+        creates: list[tuple[int, dict]] = []
+        updates: list[tuple[int, TimeEntry]] = []
+        deletes: list[tuple[int, TimeEntry]] = []
+        deltas = {}
+        seen_ids: set[int] = set()
+        for index, op in enumerate(operations):
+            error = None
+            if isinstance(op, TimeEntryBulkCreate):
+                if op.data.project_id not in owned_projects:
+                    error = (status.HTTP_404_NOT_FOUND, "Project not found")
+                else:
+                    creates.append((index, {"user_id": user.id, **op.data.model_dump()}))
+            elif op.id not in entries:
+                error = (status.HTTP_404_NOT_FOUND, "Time entry not found")
+            elif op.id in seen_ids:
+                error = (status.HTTP_409_CONFLICT, "Time entry referenced more than once")
+            elif isinstance(op, TimeEntryBulkDelete):
+                seen_ids.add(op.id)
+                deletes.append((index, entries[op.id]))
+            else:
+                payload = op.data.model_dump(exclude_unset=True)
+                if "project_id" in payload and payload["project_id"] not in owned_projects:
+                    error = (status.HTTP_404_NOT_FOUND, "Project not found")
+                else:
+                    seen_ids.add(op.id)
+                    entry = entries[op.id]
+                    collect_deltas([entry], sign=-1, into=deltas)
+                    for field, value in payload.items():
+                        setattr(entry, field, value)
+                    updates.append((index, entry))
+            if error:
+                results[index] = TimeEntryBulkResult(
+                    index=index, op=op.op, status=error[0], detail=error[1]
+                )
+
+        if creates or updates or deletes:
+            created = await self.entries.add_many([row for _, row in creates])
+            collect_deltas([entry for _, entry in deletes], sign=-1, into=deltas)
+            await self.entries.delete_many([entry.id for _, entry in deletes])
+            await self.tombstones.record(
+                user.id, ChangeScope.TIME_ENTRIES, [entry.id for _, entry in deletes]
+            )
+            collect_deltas(created, into=deltas)
+            collect_deltas([entry for _, entry in updates], into=deltas)
+            await self.rollups.apply_deltas(deltas)
+            await self.versions.bump(user.id, ChangeScope.TIME_ENTRIES)
+            await self.session.commit()
+
+            for (index, _), entry in zip(creates, created):
+                results[index] = TimeEntryBulkResult(
+                    index=index,
+                    op="create",
+                    status=status.HTTP_201_CREATED,
+                    id=entry.id,
+                    entry=TimeEntryRead.model_validate(entry),
+                )
+            for index, entry in updates:
+                results[index] = TimeEntryBulkResult(
+                    index=index,
+                    op="update",
+                    status=status.HTTP_200_OK,
+                    id=entry.id,
+                    entry=TimeEntryRead.model_validate(entry),
+                )
+            for index, entry in deletes:
+                results[index] = TimeEntryBulkResult(
+                    index=index, op="delete", status=status.HTTP_204_NO_CONTENT, id=entry.id
+                )
+        return results
+
+    async def _check_overlaps(
+        self,
+        user: User,
+        started_at: datetime,
+        ended_at: datetime | None,
+        duration_minutes: int,
+        on_overlap: OverlapPolicy,
+        *,
+        exclude_id: int | None = None,
+    ) -> list[int]:
+        if on_overlap == "allow":
+            return []
+        overlaps = await self.find_overlaps(
+            user, started_at, ended_at, duration_minutes, exclude_id=exclude_id
+        )
+        if overlaps and on_overlap == "reject":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Time entry overlaps existing entries",
+                headers={OVERLAP_HEADER: ",".join(map(str, overlaps))},
+            )
+        return overlaps
+
     async def _get_owned_entry(self, user: User, entry_id: int) -> TimeEntry:
         entry = await self.entries.get(entry_id)
         if not entry or entry.user_id != user.id:
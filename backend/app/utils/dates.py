@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+UTC_ZONE_NAMES = frozenset(
+    {"UTC", "Etc/UTC", "Etc/UCT", "UCT", "GMT", "Etc/GMT", "Zulu", "Etc/Zulu", "Universal"}
+)
+
+
+def is_utc_zone(name: str) -> bool:
+    return name in UTC_ZONE_NAMES
+
+
+def utc_naive(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def entry_end(started_at: datetime, ended_at: datetime | None, duration_minutes: int) -> datetime:
+    """Exclusive end of a time entry's ``[started_at, end)`` interval."""
+    end = ended_at or started_at + timedelta(minutes=duration_minutes)
+    return max(utc_naive(started_at), utc_naive(end))
+
+
+def user_zone(name: str | None) -> ZoneInfo:
+    try:
+        return ZoneInfo(name or "UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo("UTC")
+
+
+def local_midnight_utc(day: date, zone: ZoneInfo) -> datetime:
+    """Naive UTC instant of local midnight, matching how ``started_at`` is stored."""
+    local = datetime.combine(day, time.min, tzinfo=zone)
+    return local.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def local_day_window(date_from: date, date_to: date, zone: ZoneInfo) -> tuple[datetime, datetime]:
+    return (
+        local_midnight_utc(date_from, zone),
+        local_midnight_utc(date_to + timedelta(days=1), zone),
+    )
+
+
+def bucket_start(day: date, granularity: str) -> date:
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def bucket_range(date_from: date, date_to: date, granularity: str) -> list[date]:
+    buckets = []
+    current = bucket_start(date_from, granularity)
+    while current <= date_to:
+        buckets.append(current)
+        if granularity == "week":
+            current += timedelta(days=7)
+        elif granularity == "month":
+            current = (current + timedelta(days=32)).replace(day=1)
+        else:
+            current += timedelta(days=1)
+    return buckets
+
+
+def local_bucket(value: str | None, zone_name: str, granularity: str) -> str | None:
+    # Registered as the ``tz_bucket`` SQL function on SQLite connections; mirrors
+    # date_trunc(granularity, started_at AT TIME ZONE 'UTC' AT TIME ZONE zone).
+    if value is None:
+        return None
+    started_at = datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+    local_day = started_at.astimezone(user_zone(zone_name)).date()
+    return bucket_start(local_day, granularity).isoformat()
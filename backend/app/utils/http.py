@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from collections.abc import AsyncIterator
+from email.utils import formatdate
+from pathlib import Path
+from urllib.parse import urlencode
+
+import anyio
+from fastapi import HTTPException, Request, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+CHUNK_SIZE = 64 * 1024
+
+
+def accepts_encoding(header: str | None, coding: str) -> bool:
+    for item in (header or "").split(","):
+        name, _, params = item.strip().partition(";")
+        if name.strip().lower() not in (coding, "*"):
+            continue
+        quality = params.strip().removeprefix("q=")
+        return not params or quality.strip() not in ("0", "0.0", "0.00", "0.000")
+    return False
+
+
+def file_etag(stat: os.stat_result) -> str:
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def collection_headers(request: Request, user_id: int, version: int) -> dict[str, str]:
+    """Strong validator for a per-user collection at a change ``version``.
+
+    The normalized query string is part of the tag because filters, fieldsets
+    and cursors select different bodies from the same version.
+    """
+    query = urlencode(sorted(request.query_params.multi_items()))
+    digest = hashlib.sha256(f"{user_id}?{query}".encode()).hexdigest()[:16]
+    return {
+        "ETag": f'"{version:x}-{digest}"',
+        "Cache-Control": "private, no-cache",
+        "Vary": "Authorization",
+    }
+
+
+def not_modified(request: Request, headers: dict[str, str]) -> Response | None:
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def parse_byte_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Return the inclusive (start, end) of a single ``bytes=`` range.
+
+    ``None`` means the header is absent or unsupported (multiple ranges, other
+    units) and the whole file should be served; unsatisfiable ranges raise 416.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if not first:
+            length = int(last)
+            start, end = max(size - length, 0), size - 1
+            if length <= 0:
+                raise ValueError
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+async def _read_range(path: Path, start: int, end: int) -> AsyncIterator[bytes]:
+    remaining = end - start + 1
+    async with await anyio.open_file(path, "rb") as handle:
+        await handle.seek(start)
+        while remaining > 0:
+            chunk = await handle.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def file_download_response(
+    request: Request,
+    path: Path,
+    *,
+    media_type: str,
+    filename: str,
+    content_encoding: str | None = None,
+) -> Response:
+    """Serve a stored file with ETag, conditional GET and single-range support.
+
+    Full bodies go through ``FileResponse`` so servers implementing the
+    ``http.response.pathsend`` extension can hand the file to the kernel.
+    """
+    stat = path.stat()
+    etag = file_etag(stat)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    }
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+        headers["Vary"] = "Accept-Encoding"
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if_range = request.headers.get("if-range")
+    byte_range = None
+    if if_range is None or if_range.strip() == etag:
+        byte_range = parse_byte_range(request.headers.get("range"), stat.st_size)
+    if byte_range is None:
+        return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        _read_range(path, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers,
+    )
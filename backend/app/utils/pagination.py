@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+
+
+def _encode(value) -> str:
+    payload = json.dumps(value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode(token: str):
+    padded = token + "=" * (-len(token) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def encode_cursor(started_at: datetime, entry_id: int) -> str:
+    return _encode([started_at.isoformat(), entry_id])
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of ``encode_cursor``; raises ``ValueError`` for malformed input."""
+    try:
+        started_at, entry_id = _decode(cursor)
+        return datetime.fromisoformat(started_at), int(entry_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def encode_sync_token(high_water_mark: datetime) -> str:
+    return _encode({"at": high_water_mark.isoformat()})
+
+
+def decode_sync_token(token: str) -> datetime:
+    """Inverse of ``encode_sync_token``; raises ``ValueError`` for malformed input."""
+    try:
+        return datetime.fromisoformat(_decode(token)["at"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid sync token") from exc
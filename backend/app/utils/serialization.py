@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+
+from fastapi import HTTPException, status
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+from typing_extensions import TypedDict
+
+
+class JSONBytesResponse(Response):
+    """A JSON response whose body has already been encoded."""
+
+    media_type = "application/json"
+
+
+def select_fields(
+    schema: type[BaseModel], fields: str | None, *, required: Sequence[str] = ("id",)
+) -> tuple[str, ...]:
+    """Resolve a ``fields=a,b`` sparse fieldset against ``schema``.
+
+    Fields come back in schema order and always include ``required``; unknown
+    names are a 400.
+    """
+    available = tuple(schema.model_fields)
+    if not fields:
+        return available
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(available)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    requested.update(name for name in required if name in available)
+    return tuple(name for name in available if name in requested)
+
+
+@lru_cache(maxsize=256)
+def rows_adapter(schema: type[BaseModel], fields: tuple[str, ...]) -> TypeAdapter:
+    # A TypedDict over the selected fields validates mapping rows directly, so
+    # no model instance is built per row and sparse fieldsets need no defaults.
+    row_type = TypedDict(  # type: ignore[misc]
+        f"{schema.__name__}Row",
+        {name: schema.model_fields[name].annotation for name in fields},
+    )
+    return TypeAdapter(list[row_type])
+
+
+def dump_rows(
+    schema: type[BaseModel], fields: tuple[str, ...], rows: Sequence[Mapping]
+) -> bytes:
+    adapter = rows_adapter(schema, fields)
+    return adapter.dump_json(adapter.validate_python(rows))
+
+
+def dump_object(members: Mapping[str, bytes]) -> bytes:
+    """Join already-encoded JSON values into one object without re-encoding them."""
+    return b"{" + b",".join(to_json(key) + b":" + value for key, value in members.items()) + b"}"
+
+
+def rows_response(
+    schema: type[BaseModel],
+    fields: tuple[str, ...],
+    rows: Sequence[Mapping],
+    headers: Mapping[str, str] | None = None,
+) -> JSONBytesResponse:
+    return JSONBytesResponse(dump_rows(schema, fields, rows), headers=headers)
@@ -0,0 +1,81 @@
+"""Throughput of per-item POST /time-entries vs one POST /time-entries:bulk.
+
+Usage (from ``backend/``)::
+
+    DATABASE_URL=sqlite+aiosqlite:///./bench.db python -m benchmarks.bench_bulk_time_entries [--entries 200]
+
+Requests go through the ASGI app in-process, so the numbers measure the
+service and database work rather than network round trips. The schema in
+``DATABASE_URL`` is dropped and recreated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from httpx import AsyncClient
+
+from app.core.db import get_engine
+from app.main import app
+from app.models import Base
+
+
+async def _headers(client: AsyncClient) -> dict[str, str]:
+    credentials = {"email": "bench@example.com", "password": "password123"}
+    await client.post("/api/auth/register", json={**credentials, "full_name": "Bench"})
+    login = await client.post("/api/auth/login", json=credentials)
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+def _entries(project_id: int, count: int) -> list[dict]:
+    started = datetime(2024, 1, 1, 9, 0)
+    return [
+        {
+            "project_id": project_id,
+            "description": f"Entry {index}",
+            "started_at": (started + timedelta(minutes=30 * index)).isoformat(),
+            "duration_minutes": 25,
+            "hourly_rate": 80,
+        }
+        for index in range(count)
+    ]
+
+
+async def main(count: int) -> None:
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        headers = await _headers(client)
+        project = await client.post("/api/projects/", headers=headers, json={"name": "Bench"})
+        entries = _entries(project.json()["id"], count)
+
+        started = time.perf_counter()
+        for entry in entries:
+            response = await client.post("/api/time-entries/", headers=headers, json=entry)
+            response.raise_for_status()
+        per_item = time.perf_counter() - started
+
+        operations = [{"op": "create", "data": entry} for entry in entries]
+        started = time.perf_counter()
+        response = await client.post(
+            "/api/time-entries:bulk", headers=headers, json={"operations": operations}
+        )
+        response.raise_for_status()
+        bulk = time.perf_counter() - started
+
+    print(f"{get_engine().dialect.name}, {count} entries")
+    print(f"{'endpoint':<10} {'seconds':>9} {'entries/s':>10}")
+    print(f"{'per-item':<10} {per_item:>9.3f} {count / per_item:>10.0f}")
+    print(f"{'bulk':<10} {bulk:>9.3f} {count / bulk:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.entries))
@@ -0,0 +1,97 @@
+"""Database queries and latency of repeated list GETs with and without ETags.
+
+Usage (from ``backend/``)::
+
+    DATABASE_URL=sqlite+aiosqlite:///./bench.db python -m benchmarks.bench_conditional_get [--requests 200]
+
+Simulates the SPA refetching its collections on window focus when nothing has
+changed: ``full`` requests always download the body, ``conditional`` ones send
+the previous ``ETag`` in ``If-None-Match``. Requests go through the ASGI app
+in-process. The schema in ``DATABASE_URL`` is dropped and recreated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.core.db import get_engine
+from app.main import app
+from app.models import Base
+
+COLLECTIONS = ("/api/time-entries/", "/api/projects/", "/api/reminders/")
+
+
+async def _headers(client: AsyncClient) -> dict[str, str]:
+    credentials = {"email": "bench@example.com", "password": "password123"}
+    await client.post("/api/auth/register", json={**credentials, "full_name": "Bench"})
+    login = await client.post("/api/auth/login", json=credentials)
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+async def main(count: int, entries: int) -> None:
+    engine = get_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    queries = 0
+
+    def _count(*_args) -> None:
+        nonlocal queries
+        queries += 1
+
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        headers = await _headers(client)
+        project = await client.post("/api/projects/", headers=headers, json={"name": "Bench"})
+        operations = [
+            {
+                "op": "create",
+                "data": {
+                    "project_id": project.json()["id"],
+                    "started_at": f"2024-01-01T{index % 24:02d}:00:00",
+                    "duration_minutes": 30,
+                },
+            }
+            for index in range(entries)
+        ]
+        await client.post(
+            "/api/time-entries:bulk", headers=headers, json={"operations": operations}
+        )
+        etags = {}
+        for path in COLLECTIONS:
+            etags[path] = (await client.get(path, headers=headers)).headers["ETag"]
+
+        event.listen(engine.sync_engine, "before_cursor_execute", _count)
+        print(f"{engine.dialect.name}, {count} rounds over {len(COLLECTIONS)} collections")
+        print(f"{'mode':<12} {'queries/req':>12} {'ms/req':>8} {'bytes/req':>10}")
+        for mode in ("full", "conditional"):
+            queries, received = 0, 0
+            started = time.perf_counter()
+            for _ in range(count):
+                for path in COLLECTIONS:
+                    request_headers = dict(headers)
+                    if mode == "conditional":
+                        request_headers["If-None-Match"] = etags[path]
+                    response = await client.get(path, headers=request_headers)
+                    assert response.status_code == (304 if mode == "conditional" else 200)
+                    received += len(response.content)
+            elapsed = time.perf_counter() - started
+            total = count * len(COLLECTIONS)
+            print(
+                f"{mode:<12} {queries / total:>12.2f} {elapsed / total * 1e3:>8.2f}"
+                f" {received / total:>10.0f}"
+            )
+        event.remove(engine.sync_engine, "before_cursor_execute", _count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--entries", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.entries))
@@ -0,0 +1,66 @@
+"""Cold import time of the API and worker entry points, checked against a budget.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_import_time [--runs 5] [--budget app.main=1100]
+
+Each module is imported in a fresh ``python -X importtime`` process and the
+median cumulative time is compared with its budget (milliseconds). The exit
+status is 1 when any module is over budget, so the script can gate CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# About 25% above the medians measured when they were set (app.main ~870-910 ms,
+# of which FastAPI alone is ~430 ms; app.celery.app ~175 ms; app.celery.tasks
+# ~400 ms), so ordinary machine noise does not fail the check.
+BUDGETS_MS = {
+    "app.main": 1100,
+    "app.celery.app": 250,
+    "app.celery.tasks": 500,
+}
+
+
+def import_time_ms(module: str) -> float:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in completed.stderr.splitlines():
+        fields = [field.strip() for field in line.removeprefix("import time:").split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"no importtime record for {module}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", action="append", default=[], metavar="MODULE=MS")
+    args = parser.parse_args()
+
+    budgets = dict(BUDGETS_MS)
+    for item in args.budget:
+        module, _, limit = item.partition("=")
+        budgets[module] = float(limit)
+
+    over_budget = False
+    print(f"{'module':<20} {'median ms':>10} {'budget ms':>10}")
+    for module, budget in budgets.items():
+        import_time_ms(module)  # warm the bytecode cache
+        median = statistics.median(import_time_ms(module) for _ in range(args.runs))
+        status = "ok" if median <= budget else "OVER"
+        over_budget |= median > budget
+        print(f"{module:<20} {median:>10.1f} {budget:>10.0f}  {status}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Per-row cost of the list read path: ORM entities vs projected rows.
+
+Usage (from ``backend/``)::
+
+    DATABASE_URL=sqlite+aiosqlite:///./bench.db python -m benchmarks.bench_list_serialization [--rows 10000]
+
+``orm`` is the previous path: full ``TimeEntry`` entities loaded into the
+session, ``TimeEntryRead.model_validate`` per row, then FastAPI's response
+model validation and ``jsonable_encoder``/``JSONResponse`` rendering.
+``rows`` selects only the schema's columns and serializes the page with one
+``TypeAdapter`` call. The schema in ``DATABASE_URL`` is dropped and recreated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app.core.db import SessionLocal, get_engine
+from app.models import Base, Project, TimeEntry, User
+from app.repositories.time_entry_repository import TimeEntryRepository
+from app.schemas.time_entry import TimeEntryRead
+from app.utils.serialization import dump_rows, select_fields
+
+
+async def _seed(count: int) -> int:
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with SessionLocal() as session:
+        user = User(email="bench@example.com", hashed_password="x", full_name="Bench")
+        session.add(user)
+        await session.flush()
+        project = Project(owner_id=user.id, name="Bench")
+        session.add(project)
+        await session.flush()
+        started = datetime(2024, 1, 1, 9, 0)
+        await TimeEntryRepository(session).bulk_insert(
+            [
+                {
+                    "user_id": user.id,
+                    "project_id": project.id,
+                    "description": f"Entry {index}",
+                    "started_at": started + timedelta(minutes=30 * index),
+                    "ended_at": started + timedelta(minutes=30 * index + 25),
+                    "duration_minutes": 25,
+                    "is_billable": True,
+                    "hourly_rate": 80,
+                }
+                for index in range(count)
+            ]
+        )
+        await session.commit()
+        return user.id
+
+
+async def _orm(user_id: int, count: int) -> tuple[float, float]:
+    response_adapter = TypeAdapter(list[TimeEntryRead])
+    async with SessionLocal() as session:
+        started = time.perf_counter()
+        stmt = (
+            select(TimeEntry)
+            .where(TimeEntry.user_id == user_id)
+            .order_by(TimeEntry.started_at.desc(), TimeEntry.id.desc())
+            .limit(count)
+        )
+        entries = (await session.execute(stmt)).scalars().all()
+        loaded = time.perf_counter()
+        items = [TimeEntryRead.model_validate(entry) for entry in entries]
+        validated = response_adapter.validate_python(items, from_attributes=True)
+        JSONResponse(jsonable_encoder(validated)).body
+        return loaded - started, time.perf_counter() - loaded
+
+
+async def _rows(user_id: int, count: int) -> tuple[float, float]:
+    fields = select_fields(TimeEntryRead, None)
+    async with SessionLocal() as session:
+        started = time.perf_counter()
+        rows = await TimeEntryRepository(session).list_page(
+            fields, user_id=user_id, limit=count
+        )
+        loaded = time.perf_counter()
+        dump_rows(TimeEntryRead, fields, rows)
+        return loaded - started, time.perf_counter() - loaded
+
+
+async def main(count: int, repeat: int) -> None:
+    user_id = await _seed(count)
+    print(f"{get_engine().dialect.name}, {count} rows, best of {repeat}")
+    print(f"{'path':<6} {'query ms':>9} {'serialize ms':>13} {'us/row':>8}")
+    for name, run in (("orm", _orm), ("rows", _rows)):
+        await run(user_id, count)  # warm up caches and the connection pool
+        query, serialize = min(
+            [await run(user_id, count) for _ in range(repeat)], key=sum
+        )
+        per_row = (query + serialize) / count * 1e6
+        print(f"{name:<6} {query * 1e3:>9.1f} {serialize * 1e3:>13.1f} {per_row:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,85 @@
+"""Latency of the per-write overlap check and the overlap sweep report.
+
+Usage (from ``backend/``)::
+
+    DATABASE_URL=sqlite+aiosqlite:///./bench.db python -m benchmarks.bench_overlaps [--entries 50000]
+
+Seeds one user with ``--entries`` back-to-back entries, one in every 50
+overlapping its predecessor. The schema in ``DATABASE_URL`` is dropped and
+recreated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from app.core.db import SessionLocal, get_engine
+from app.models import Base, Project, User
+from app.repositories.time_entry_repository import TimeEntryRepository
+from app.services.time_entry_service import TimeEntryService
+
+START = datetime(2020, 1, 1)
+
+
+async def _seed(count: int) -> None:
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with SessionLocal() as session:
+        user = User(email="bench@example.com", hashed_password="x")
+        session.add(user)
+        await session.flush()
+        project = Project(owner_id=user.id, name="Bench")
+        session.add(project)
+        await session.flush()
+        rows = []
+        for index in range(count):
+            started = START + timedelta(hours=index)
+            if index % 50 == 1:
+                started -= timedelta(minutes=30)
+            rows.append(
+                {
+                    "user_id": user.id,
+                    "project_id": project.id,
+                    "description": None,
+                    "started_at": started,
+                    "ended_at": None,
+                    "duration_minutes": 45,
+                    "is_billable": True,
+                    "hourly_rate": None,
+                }
+            )
+        await TimeEntryRepository(session).bulk_insert(rows)
+        await session.commit()
+
+
+async def main(count: int, checks: int) -> None:
+    await _seed(count)
+    async with SessionLocal() as session:
+        user = await session.get(User, 1)
+        service = TimeEntryService(session)
+        started = time.perf_counter()
+        for index in range(checks):
+            await service.find_overlaps(
+                user, START + timedelta(hours=index * (count // checks), minutes=30), None, 60
+            )
+        per_check = (time.perf_counter() - started) / checks
+
+        started = time.perf_counter()
+        overlaps = await service.overlap_report(user)
+        report = time.perf_counter() - started
+
+    print(f"{get_engine().dialect.name}, {count} entries")
+    print(f"overlap check: {per_check * 1e3:.2f} ms (mean of {checks})")
+    print(f"sweep report:  {report * 1e3:.0f} ms, {len(overlaps)} overlapping pairs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=50_000)
+    parser.add_argument("--checks", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.entries, args.checks))
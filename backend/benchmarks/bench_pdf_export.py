@@ -0,0 +1,125 @@
+"""Time and peak memory of detailed PDF rendering for growing row counts.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_pdf_export [--sizes 1000,10000,100000] [--legacy]
+
+Every render runs in a fresh process so its peak RSS is its own; ``baseline``
+is the RSS of that process before rendering. ``--legacy`` also renders the
+same rows the old way (one ``Table`` holding every row, built in a single
+``doc.build``) for sizes up to 10k rows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import resource
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from multiprocessing import get_context
+from pathlib import Path
+from types import SimpleNamespace
+
+from app.services import exporters
+
+LEGACY_MAX_ROWS = 10_000
+
+
+def _rows(count: int):
+    started = datetime(2024, 1, 1, 9, 0)
+    for index in range(count):
+        yield SimpleNamespace(
+            id=index,
+            project_id=index % 12,
+            project_name=f"Project {index % 12}",
+            description=f"Worked on ticket #{index}",
+            started_at=started + timedelta(minutes=15 * index),
+            ended_at=None,
+            duration_minutes=15 + index % 120,
+            is_billable=index % 4 != 0,
+            hourly_rate=Decimal("85.00"),
+        )
+
+
+async def _batches(count: int, batch_size: int = 2000):
+    batch = []
+    for row in _rows(count):
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _render_streamed(count: int, filename: str) -> None:
+    asyncio.run(exporters.export_detailed_pdf(_batches(count), filename))
+
+
+def _render_legacy(count: int, filename: str) -> None:
+    from reportlab.lib.pagesizes import landscape, letter
+    from reportlab.platypus import SimpleDocTemplate, Table
+
+    doc = SimpleDocTemplate(str(exporters.EXPORT_DIR / filename), pagesize=landscape(letter))
+    data = [exporters.PDF_DETAIL_HEADER]
+    data.extend(exporters._pdf_detail_values(row) for row in _rows(count))
+    table = Table(data, repeatRows=1)
+    doc.build([table])
+
+
+RENDERERS = {"streamed": _render_streamed, "legacy": _render_legacy}
+
+
+def _peak_rss_mib() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+
+def _measure(
+    export_dir: str, name: str, count: int
+) -> tuple[float, float, float, float, int]:
+    exporters.EXPORT_DIR = Path(export_dir)
+    filename = f"{name}_{count}.pdf"
+    baseline = _peak_rss_mib()
+    tracemalloc.start()
+    started = time.perf_counter()
+    RENDERERS[name](count, filename)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = (exporters.EXPORT_DIR / filename).stat().st_size
+    return elapsed, peak / 1024 / 1024, baseline, _peak_rss_mib(), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--legacy", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(
+            f"{'renderer':<10} {'rows':>8} {'seconds':>9} {'py MiB':>8}"
+            f" {'baseline':>9} {'peak RSS':>9} {'file KiB':>9}"
+        )
+        for count in (int(size) for size in args.sizes.split(",")):
+            names = ["streamed"]
+            if args.legacy and count <= LEGACY_MAX_ROWS:
+                names.append("legacy")
+            for name in names:
+                with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+                    elapsed, traced, baseline, rss, size = pool.submit(
+                        _measure, tmp, name, count
+                    ).result()
+                print(
+                    f"{name:<10} {count:>8} {elapsed:>9.2f} {traced:>8.1f}"
+                    f" {baseline:>9.1f} {rss:>9.1f} {size / 1024:>9.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
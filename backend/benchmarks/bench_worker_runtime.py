@@ -0,0 +1,65 @@
+"""Per-task overhead of a fresh event loop per task vs the shared worker runtime.
+
+Usage (from ``backend/``, against ``DATABASE_URL``)::
+
+    python -m benchmarks.bench_worker_runtime [--tasks 200]
+
+``per-task loop`` mirrors the old ``asyncio.run`` per task; it disposes the
+engine after every task, since pooled connections cannot outlive their loop.
+``runtime`` submits every task to ``app.celery.runtime``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+
+from app.celery.runtime import runtime
+from app.core.db import SessionLocal, get_engine
+
+
+async def _task() -> None:
+    async with SessionLocal() as session:
+        await session.execute(text("SELECT 1"))
+
+
+async def _task_with_fresh_pool() -> None:
+    try:
+        await _task()
+    finally:
+        await get_engine().dispose()
+
+
+def _per_task_loop(count: int) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        asyncio.run(_task_with_fresh_pool())
+    return time.perf_counter() - started
+
+
+def _shared_runtime(count: int) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        runtime.run(_task())
+    elapsed = time.perf_counter() - started
+    runtime.stop()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{get_engine().dialect.name}, {args.tasks} tasks")
+    print(f"{'mode':<15} {'total s':>9} {'per task ms':>12}")
+    for name, run in (("per-task loop", _per_task_loop), ("runtime", _shared_runtime)):
+        elapsed = run(args.tasks)
+        print(f"{name:<15} {elapsed:>9.3f} {elapsed / args.tasks * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,29 @@
 import pytest
 
+from app.core.db import SessionLocal
+from app.repositories.user_repository import UserRepository
+from tests.helpers import auth_headers
+
 
 @pytest.mark.anyio
 async def test_health_ping(test_client):
     response = await test_client.get("/api/health/ping")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.anyio
+async def test_report_cache_stats_require_a_superuser(test_client):
+    assert (await test_client.get("/api/health/report-cache")).status_code == 401
+
+    headers = await auth_headers(test_client, "cache-stats@example.com")
+    response = await test_client.get("/api/health/report-cache", headers=headers)
+    assert response.status_code == 403
+
+    async with SessionLocal() as session:
+        user = await UserRepository(session).get_by_email("cache-stats@example.com")
+        user.is_superuser = True
+        await session.commit()
+    response = await test_client.get("/api/health/report-cache", headers=headers)
+    assert response.status_code == 200
+    assert "hits" in response.json()
@@ -36,3 +36,268 @@ async def test_project_and_time_entry_flow(test_client):
     assert len(body) == 1
     assert body[0]["project_id"] == project_id
     assert body[0]["duration_minutes"] == 60
+
+
+@pytest.mark.anyio
+async def test_time_entries_are_paginated_by_cursor(test_client):
+    headers = await auth_headers(test_client, "pages@example.com")
+    project = await test_client.post("/api/projects/", headers=headers, json={"name": "Pages"})
+    project_id = project.json()["id"]
+    # Pairs of entries share a start time so ties are broken by id.
+    for index in range(7):
+        await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project_id,
+                "started_at": f"2024-01-0{1 + index // 2}T09:00:00",
+                "duration_minutes": 10 + index,
+            },
+        )
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        response = await test_client.get("/api/time-entries/", headers=headers, params=params)
+        assert response.status_code == 200
+        seen.extend(response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert pages == 3
+    assert len({entry["id"] for entry in seen}) == 7
+    keys = [(entry["started_at"], entry["id"]) for entry in seen]
+    assert keys == sorted(keys, reverse=True)
+
+    response = await test_client.get(
+        "/api/time-entries/", headers=headers, params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_collection_etags_track_change_versions(test_client):
+    headers = await auth_headers(test_client, "etags@example.com")
+    project = await test_client.post("/api/projects/", headers=headers, json={"name": "Tags"})
+    entry = {"project_id": project.json()["id"], "started_at": "2024-03-01T09:00:00"}
+    await test_client.post(
+        "/api/time-entries/", headers=headers, json={**entry, "duration_minutes": 30}
+    )
+
+    first = await test_client.get("/api/time-entries/", headers=headers)
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    cached = await test_client.get(
+        "/api/time-entries/", headers={**headers, "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    filtered = await test_client.get(
+        "/api/time-entries/",
+        headers={**headers, "If-None-Match": etag},
+        params={"fields": "duration_minutes"},
+    )
+    assert filtered.status_code == 200
+    assert filtered.headers["ETag"] != etag
+
+    # Writes to another collection leave the time entry tag valid.
+    await test_client.post("/api/projects/", headers=headers, json={"name": "Other"})
+    cached = await test_client.get(
+        "/api/time-entries/", headers={**headers, "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+
+    await test_client.post(
+        "/api/time-entries/", headers=headers, json={**entry, "duration_minutes": 45}
+    )
+    changed = await test_client.get(
+        "/api/time-entries/", headers={**headers, "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert len(changed.json()) == 2
+    assert changed.headers["ETag"] != etag
+
+    projects = await test_client.get("/api/projects/", headers=headers)
+    cached = await test_client.get(
+        "/api/projects/", headers={**headers, "If-None-Match": projects.headers["ETag"]}
+    )
+    assert cached.status_code == 304
+
+
+@pytest.mark.anyio
+async def test_list_endpoints_return_sparse_fieldsets(test_client):
+    headers = await auth_headers(test_client, "fields@example.com")
+    project = await test_client.post(
+        "/api/projects/", headers=headers, json={"name": "Fields", "color": "#123456"}
+    )
+    project_id = project.json()["id"]
+    for index in range(3):
+        await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project_id,
+                "started_at": f"2024-02-0{index + 1}T09:00:00",
+                "duration_minutes": 15,
+                "hourly_rate": 42.5,
+            },
+        )
+
+    full = await test_client.get("/api/time-entries/", headers=headers)
+    assert full.json()[0]["hourly_rate"] == 42.5
+    assert full.json()[0]["started_at"] == "2024-02-03T09:00:00"
+
+    response = await test_client.get(
+        "/api/time-entries/",
+        headers=headers,
+        params={"fields": "duration_minutes", "limit": 2},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert [set(entry) for entry in response.json()] == [{"id", "duration_minutes"}] * 2
+    assert response.headers.get("X-Next-Cursor")
+
+    projects = await test_client.get(
+        "/api/projects/", headers=headers, params={"fields": "name,color"}
+    )
+    assert projects.json() == [{"name": "Fields", "color": "#123456", "id": project_id}]
+
+    response = await test_client.get(
+        "/api/projects/", headers=headers, params={"fields": "name,owner_id"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_bulk_time_entry_operations_report_per_item_results(test_client):
+    headers = await auth_headers(test_client, "bulk@example.com")
+    other_headers = await auth_headers(test_client, "bulk-other@example.com")
+    project = await test_client.post("/api/projects/", headers=headers, json={"name": "Bulk"})
+    project_id = project.json()["id"]
+    foreign = await test_client.post(
+        "/api/projects/", headers=other_headers, json={"name": "Not mine"}
+    )
+    existing = []
+    for minutes in (15, 30):
+        response = await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project_id,
+                "started_at": "2024-01-02T09:00:00",
+                "duration_minutes": minutes,
+            },
+        )
+        existing.append(response.json()["id"])
+
+    entry = {"project_id": project_id, "started_at": "2024-01-03T09:00:00"}
+    response = await test_client.post(
+        "/api/time-entries:bulk",
+        headers=headers,
+        json={
+            "operations": [
+                {"op": "create", "data": {**entry, "duration_minutes": 45}},
+                {"op": "create", "data": {**entry, "duration_minutes": 60}},
+                {
+                    "op": "create",
+                    "data": {**entry, "project_id": foreign.json()["id"], "duration_minutes": 5},
+                },
+                {"op": "update", "id": existing[0], "data": {"duration_minutes": 20}},
+                {"op": "delete", "id": existing[1]},
+                {"op": "delete", "id": existing[1]},
+                {"op": "delete", "id": 999999},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["status"] for item in results] == [201, 201, 404, 200, 204, 409, 404]
+    assert results[0]["entry"]["duration_minutes"] == 45
+    assert results[3]["entry"]["duration_minutes"] == 20
+
+    listing = await test_client.get("/api/time-entries/", headers=headers)
+    assert sorted(item["duration_minutes"] for item in listing.json()) == [20, 45, 60]
+
+    summary = await test_client.post(
+        "/api/reports/summary",
+        headers=headers,
+        json={"date_from": "2024-01-01", "date_to": "2024-01-31"},
+    )
+    assert summary.json()["total_minutes"] == 125
+
+
+@pytest.mark.anyio
+async def test_overlapping_entries_can_be_rejected_flagged_and_reported(test_client):
+    headers = await auth_headers(test_client, "overlaps@example.com")
+    project = await test_client.post("/api/projects/", headers=headers, json={"name": "Twice"})
+    base = {"project_id": project.json()["id"]}
+
+    first = await test_client.post(
+        "/api/time-entries/",
+        headers=headers,
+        params={"on_overlap": "reject"},
+        json={
+            **base,
+            "started_at": "2024-04-01T09:00:00",
+            "ended_at": "2024-04-01T10:00:00",
+            "duration_minutes": 60,
+        },
+    )
+    assert first.status_code == 201
+    first_id = first.json()["id"]
+    second = {**base, "started_at": "2024-04-01T09:30:00", "duration_minutes": 60}
+
+    rejected = await test_client.post(
+        "/api/time-entries/", headers=headers, params={"on_overlap": "reject"}, json=second
+    )
+    assert rejected.status_code == 409
+    assert rejected.headers["X-Overlapping-Entries"] == str(first_id)
+
+    flagged = await test_client.post(
+        "/api/time-entries/", headers=headers, params={"on_overlap": "flag"}, json=second
+    )
+    assert flagged.status_code == 201
+    assert flagged.headers["X-Overlapping-Entries"] == str(first_id)
+    second_id = flagged.json()["id"]
+
+    # Back-to-back entries share an endpoint but do not overlap.
+    adjacent = await test_client.post(
+        "/api/time-entries/",
+        headers=headers,
+        params={"on_overlap": "reject"},
+        json={**base, "started_at": "2024-04-01T10:30:00", "duration_minutes": 30},
+    )
+    assert adjacent.status_code == 201
+    assert "X-Overlapping-Entries" not in adjacent.headers
+    adjacent_id = adjacent.json()["id"]
+
+    moved = await test_client.patch(
+        f"/api/time-entries/{adjacent_id}",
+        headers=headers,
+        params={"on_overlap": "reject"},
+        json={"started_at": "2024-04-01T09:45:00"},
+    )
+    assert moved.status_code == 409
+    assert moved.headers["X-Overlapping-Entries"] == f"{first_id},{second_id}"
+
+    report = await test_client.get("/api/time-entries/overlaps", headers=headers)
+    assert report.status_code == 200
+    assert report.json() == [
+        {
+            "entry_id": first_id,
+            "other_entry_id": second_id,
+            "overlap_start": "2024-04-01T09:30:00",
+            "overlap_end": "2024-04-01T10:00:00",
+        }
+    ]
+    later = await test_client.get(
+        "/api/time-entries/overlaps",
+        headers=headers,
+        params={"date_from": "2024-04-01T10:00:00"},
+    )
+    assert later.json() == []
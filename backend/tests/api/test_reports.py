@@ -1,8 +1,19 @@
+import csv
+import io
+import json
 from datetime import date, datetime, timedelta
 
 import pytest
+from sqlalchemy import update
 
-from tests.helpers import auth_headers
+from app.core.config import get_settings
+from app.core.db import SessionLocal
+from app.models import ReportExport
+from app.repositories.user_repository import UserRepository
+from app.schemas.report import ExportRequest
+from app.services import exporters
+from app.services.report_service import ReportService
+from tests.helpers import auth_headers, login_user
 
 
 @pytest.mark.anyio
@@ -58,3 +69,461 @@ async def test_report_summary_and_export(test_client):
     )
     assert export.status_code == 202
     assert export.json()["status"] in {"pending", "completed"}
+
+
+@pytest.mark.anyio
+async def test_report_summary_groups_projects_and_checks_scope(test_client):
+    headers = await auth_headers(test_client, "grouping@example.com")
+    other_headers = await auth_headers(test_client, "grouping-other@example.com")
+
+    project_ids = []
+    for name in ("Alpha", "Beta"):
+        response = await test_client.post(
+            "/api/projects/", headers=headers, json={"name": name}
+        )
+        project_ids.append(response.json()["id"])
+    foreign = await test_client.post(
+        "/api/projects/", headers=other_headers, json={"name": "Foreign"}
+    )
+
+    now = datetime.utcnow()
+    for project_id, minutes, billable in (
+        (project_ids[0], 30, True),
+        (project_ids[0], 15, False),
+        (project_ids[1], 60, True),
+    ):
+        await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project_id,
+                "started_at": now.isoformat(),
+                "duration_minutes": minutes,
+                "is_billable": billable,
+            },
+        )
+
+    date_range = {
+        "date_from": (date.today() - timedelta(days=1)).isoformat(),
+        "date_to": (date.today() + timedelta(days=1)).isoformat(),
+    }
+    summary = await test_client.post(
+        "/api/reports/summary", headers=headers, json=date_range
+    )
+    assert summary.status_code == 200
+    payload = summary.json()
+    assert payload["total_minutes"] == 105
+    assert payload["total_billable_minutes"] == 90
+    by_project = {row["project_id"]: row for row in payload["summary"]}
+    assert by_project[project_ids[0]]["project_name"] == "Alpha"
+    assert by_project[project_ids[0]]["total_minutes"] == 45
+    assert by_project[project_ids[0]]["total_billable_minutes"] == 30
+    assert by_project[project_ids[1]]["total_minutes"] == 60
+
+    forbidden = await test_client.post(
+        "/api/reports/summary",
+        headers=headers,
+        json={**date_range, "project_ids": [project_ids[0], foreign.json()["id"]]},
+    )
+    assert forbidden.status_code == 403
+
+    missing = await test_client.post(
+        "/api/reports/summary",
+        headers=headers,
+        json={**date_range, "project_ids": [999999]},
+    )
+    assert missing.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_report_summary_cache_is_invalidated_by_writes(test_client):
+    headers = await auth_headers(test_client, "cache@example.com")
+    async with SessionLocal() as session:
+        # Cache statistics are only served to superusers.
+        user = await UserRepository(session).get_by_email("cache@example.com")
+        user.is_superuser = True
+        await session.commit()
+    project = await test_client.post(
+        "/api/projects/", headers=headers, json={"name": "Cached"}
+    )
+    project_id = project.json()["id"]
+    entry = {
+        "project_id": project_id,
+        "started_at": datetime.utcnow().isoformat(),
+        "duration_minutes": 20,
+    }
+    filters = {
+        "date_from": (date.today() - timedelta(days=1)).isoformat(),
+        "date_to": (date.today() + timedelta(days=1)).isoformat(),
+    }
+    await test_client.post("/api/time-entries/", headers=headers, json=entry)
+
+    first = await test_client.post("/api/reports/summary", headers=headers, json=filters)
+    hits_before = (
+        await test_client.get("/api/health/report-cache", headers=headers)
+    ).json()["hits"]
+    second = await test_client.post("/api/reports/summary", headers=headers, json=filters)
+    stats = (await test_client.get("/api/health/report-cache", headers=headers)).json()
+    assert second.json() == first.json()
+    assert stats["hits"] == hits_before + 1
+
+    await test_client.post("/api/time-entries/", headers=headers, json=entry)
+    third = await test_client.post("/api/reports/summary", headers=headers, json=filters)
+    assert third.json()["total_minutes"] == 40
+
+    await test_client.patch(
+        f"/api/projects/{project_id}", headers=headers, json={"name": "Renamed"}
+    )
+    fourth = await test_client.post("/api/reports/summary", headers=headers, json=filters)
+    assert fourth.json()["summary"][0]["project_name"] == "Renamed"
+
+
+@pytest.mark.anyio
+async def test_report_series_buckets_in_user_timezone(test_client):
+    await test_client.post(
+        "/api/auth/register",
+        json={
+            "email": "series@example.com",
+            "password": "password123",
+            "timezone": "America/New_York",
+        },
+    )
+    token = await login_user(test_client, "series@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    project = await test_client.post(
+        "/api/projects/", headers=headers, json={"name": "Series"}
+    )
+    project_id = project.json()["id"]
+
+    # 03:00 UTC on March 5th is still March 4th in New York.
+    for started_at, minutes in (
+        ("2024-03-05T03:00:00", 30),
+        ("2024-03-05T15:00:00", 45),
+        ("2024-03-12T15:00:00", 60),
+    ):
+        await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={"project_id": project_id, "started_at": started_at, "duration_minutes": minutes},
+        )
+
+    daily = await test_client.post(
+        "/api/reports/summary",
+        headers=headers,
+        json={"date_from": "2024-03-04", "date_to": "2024-03-05", "granularity": "day"},
+    )
+    body = daily.json()
+    assert body["total_minutes"] == 75
+    assert body["series"] == {
+        "granularity": "day",
+        "buckets": ["2024-03-04", "2024-03-05"],
+        "project_ids": [project_id],
+        "total_minutes": [[30, 45]],
+        "total_billable_minutes": [[30, 45]],
+    }
+
+    weekly = await test_client.post(
+        "/api/reports/summary",
+        headers=headers,
+        json={"date_from": "2024-03-01", "date_to": "2024-03-14", "granularity": "week"},
+    )
+    series = weekly.json()["series"]
+    assert series["buckets"] == ["2024-02-26", "2024-03-04", "2024-03-11"]
+    assert series["total_minutes"] == [[0, 75, 60]]
+
+
+@pytest.mark.anyio
+async def test_report_summary_includes_billable_amounts(test_client):
+    headers = await auth_headers(test_client, "amounts@example.com")
+    project = await test_client.post(
+        "/api/projects/", headers=headers, json={"name": "Invoiced"}
+    )
+    project_id = project.json()["id"]
+
+    for started_at, minutes, billable, rate in (
+        ("2024-05-01T09:00:00", 90, True, 50),
+        ("2024-05-02T09:00:00", 20, True, 33.33),
+        ("2024-05-02T23:30:00", 60, False, 80),
+        ("2024-05-03T09:00:00", 30, True, None),
+    ):
+        await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project_id,
+                "started_at": started_at,
+                "duration_minutes": minutes,
+                "is_billable": billable,
+                "hourly_rate": rate,
+            },
+        )
+
+    summary = await test_client.post(
+        "/api/reports/summary",
+        headers=headers,
+        json={"date_from": "2024-05-01", "date_to": "2024-05-31"},
+    )
+    payload = summary.json()
+    # 90 min at 50.00 plus 20 min at 33.33; non-billable and unrated time is excluded.
+    assert payload["summary"][0]["billable_amount"] == "86.11"
+    assert payload["total_billable_amount"] == "86.11"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("timezone", ["UTC", "Asia/Tokyo"])
+async def test_report_batch_matches_individual_summaries(test_client, timezone):
+    email = f"batch-{timezone.replace('/', '-').lower()}@example.com"
+    await test_client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "password123", "timezone": timezone},
+    )
+    headers = {"Authorization": f"Bearer {await login_user(test_client, email)}"}
+    project_ids = []
+    for name in ("Batch A", "Batch B"):
+        response = await test_client.post(
+            "/api/projects/", headers=headers, json={"name": name}
+        )
+        project_ids.append(response.json()["id"])
+
+    start = datetime(2024, 6, 1, 20, 0)
+    for day in range(20):
+        await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project_ids[day % 2],
+                "started_at": (start + timedelta(days=day)).isoformat(),
+                "duration_minutes": 15 + day,
+                "is_billable": day % 3 != 0,
+                "hourly_rate": 60,
+            },
+        )
+
+    reports = [
+        {"date_from": "2024-06-01", "date_to": "2024-06-30", "granularity": "week"},
+        {"date_from": "2024-06-03", "date_to": "2024-06-09"},
+        {"date_from": "2024-06-10", "date_to": "2024-06-16", "project_ids": [project_ids[1]]},
+        {"date_from": "2024-06-01", "date_to": "2024-06-05", "granularity": "day"},
+    ]
+    batch = await test_client.post(
+        "/api/reports/summary:batch", headers=headers, json={"reports": reports}
+    )
+    assert batch.status_code == 200
+    results = batch.json()["results"]
+    assert len(results) == len(reports)
+
+    for filters, result in zip(reports, results):
+        single = await test_client.post("/api/reports/summary", headers=headers, json=filters)
+        assert result == single.json()
+
+
+@pytest.mark.anyio
+async def test_streaming_export_downloads(test_client):
+    headers = await auth_headers(test_client, "download@example.com")
+    project = await test_client.post(
+        "/api/projects/", headers=headers, json={"name": "Streamed, Inc"}
+    )
+    project_id = project.json()["id"]
+    for hour in (9, 10, 11):
+        await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project_id,
+                "started_at": f"2024-04-02T{hour:02d}:00:00",
+                "duration_minutes": 30,
+            },
+        )
+    params = {"date_from": "2024-04-01", "date_to": "2024-04-07"}
+
+    detailed = await test_client.get(
+        "/api/reports/export.csv", headers=headers, params={**params, "detailed": True}
+    )
+    assert detailed.status_code == 200
+    assert detailed.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(detailed.text)))
+    assert len(rows) == 4
+    assert rows[1][2] == "Streamed, Inc"
+
+    summary = await test_client.get(
+        "/api/reports/export.ndjson", headers=headers, params=params
+    )
+    assert summary.status_code == 200
+    lines = [json.loads(line) for line in summary.text.splitlines()]
+    assert lines[0]["project_id"] == project_id
+    assert lines[-1]["total_minutes"] == 90
+
+    invalid = await test_client.get(
+        "/api/reports/export.csv",
+        headers=headers,
+        params={"date_from": "2024-04-07", "date_to": "2024-04-01"},
+    )
+    assert invalid.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_export_requests_are_deduplicated_by_content_key(test_client):
+    headers = await auth_headers(test_client, "dedupe@example.com")
+    project = await test_client.post(
+        "/api/projects/", headers=headers, json={"name": "Dedupe"}
+    )
+    project_id = project.json()["id"]
+    payload = ExportRequest(
+        project_ids=[project_id, project_id],
+        date_from=date(2024, 1, 1),
+        date_to=date(2024, 1, 31),
+    )
+
+    async with SessionLocal() as session:
+        service = ReportService(session)
+        user = await UserRepository(session).get_by_email("dedupe@example.com")
+        content_key = await service.export_content_key(user, payload)
+        export = ReportExport(
+            user_id=user.id,
+            project_ids=[project_id],
+            date_from="2024-01-01",
+            date_to="2024-01-31",
+            format="csv",
+            status="pending",
+            content_key=content_key,
+        )
+        session.add(export)
+        await session.commit()
+        in_flight_id = export.id
+
+    response = await test_client.post(
+        "/api/reports/export",
+        headers=headers,
+        json={
+            "project_ids": [project_id],
+            "date_from": "2024-01-01",
+            "date_to": "2024-01-31",
+            "format": "csv",
+        },
+    )
+    assert response.status_code == 202
+    assert response.json()["id"] == in_flight_id
+
+    # An in-flight export whose worker stopped heartbeating is not reused.
+    async with SessionLocal() as session:
+        await session.execute(
+            update(ReportExport)
+            .where(ReportExport.id == in_flight_id)
+            .values(updated_at=datetime.utcnow() - timedelta(hours=1))
+        )
+        await session.commit()
+        user = await UserRepository(session).get_by_email("dedupe@example.com")
+        assert await ReportService(session).find_reusable(user.id, content_key) is None
+
+    await test_client.post(
+        "/api/time-entries/",
+        headers=headers,
+        json={"project_id": project_id, "started_at": "2024-01-05T09:00:00", "duration_minutes": 5},
+    )
+    async with SessionLocal() as session:
+        user = await UserRepository(session).get_by_email("dedupe@example.com")
+        assert await ReportService(session).export_content_key(user, payload) != content_key
+
+
+@pytest.mark.anyio
+async def test_stored_export_download_supports_ranges_and_etag(
+    test_client, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(exporters, "EXPORT_DIR", tmp_path)
+    headers = await auth_headers(test_client, "download@example.com")
+    lines = [f"line {index}\n" for index in range(2000)]
+    file_path = exporters.export_chunks(lines, "stored.csv", "gzip")
+    raw = (tmp_path / "stored.csv.gz").read_bytes()
+
+    async with SessionLocal() as session:
+        user = await UserRepository(session).get_by_email("download@example.com")
+        export = ReportExport(
+            user_id=user.id,
+            date_from="2024-01-01",
+            date_to="2024-01-31",
+            format="csv",
+            status="completed",
+            file_path=file_path,
+            compression="gzip",
+        )
+        session.add(export)
+        await session.commit()
+        url = f"/api/reports/exports/{export.id}/download"
+
+    async with test_client.stream(
+        "GET", url, headers={**headers, "Accept-Encoding": "gzip"}
+    ) as response:
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert body == raw
+    etag = response.headers["etag"]
+
+    async with test_client.stream(
+        "GET", url, headers={**headers, "Accept-Encoding": "gzip", "Range": "bytes=10-"}
+    ) as response:
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 10-{len(raw) - 1}/{len(raw)}"
+    assert body == raw[10:]
+
+    response = await test_client.get(
+        url, headers={**headers, "Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    response = await test_client.get(
+        url, headers={**headers, "Accept-Encoding": "gzip", "Range": f"bytes={len(raw)}-"}
+    )
+    assert response.status_code == 416
+
+    response = await test_client.get(url, headers={**headers, "Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.text == "".join(lines)
+
+
+@pytest.mark.anyio
+async def test_large_detailed_download_falls_back_to_a_queued_export(
+    test_client, monkeypatch
+):
+    from app.celery.app import celery_app
+
+    headers = await auth_headers(test_client, "fallback@example.com")
+    project = await test_client.post("/api/projects/", headers=headers, json={"name": "Big"})
+    for started_at in ("2024-06-03T09:00:00", "2024-06-03T23:30:00", "2024-06-04T00:30:00"):
+        await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project.json()["id"],
+                "started_at": started_at,
+                "duration_minutes": 15,
+            },
+        )
+    params = {"date_from": "2024-06-03", "date_to": "2024-06-03", "detailed": True}
+    queued = []
+
+    class _Result:
+        id = "task-1"
+
+    def send_task(name, args=None, **options):
+        queued.append((name, args))
+        return _Result()
+
+    monkeypatch.setattr(celery_app, "send_task", send_task)
+    # Only the two entries on 2024-06-03 count towards the limit.
+    monkeypatch.setattr(get_settings(), "sync_export_max_rows", 2)
+    streamed = await test_client.get("/api/reports/export.csv", headers=headers, params=params)
+    assert streamed.status_code == 200
+    assert len(streamed.text.splitlines()) == 3
+    assert queued == []
+
+    monkeypatch.setattr(get_settings(), "sync_export_max_rows", 1)
+    response = await test_client.get("/api/reports/export.csv", headers=headers, params=params)
+    assert response.status_code == 202
+    export = response.json()
+    assert export["status"] == "pending"
+    assert response.headers["Location"] == f"/api/reports/exports/{export['id']}"
+    assert queued == [("app.celery.tasks.generate_report_export", [export["id"]])]
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from app.core.db import SessionLocal
+from app.models import Project, Reminder, TimeEntry
+from app.repositories.base import Repository
+from app.utils.pagination import decode_sync_token, encode_sync_token
+from tests.helpers import auth_headers
+
+
+async def _age_rows(hours: int) -> None:
+    # Pretend everything so far was written long before the next sync.
+    past = datetime.utcnow() - timedelta(hours=hours)
+    async with SessionLocal() as session:
+        for model in (Project, Reminder, TimeEntry):
+            await session.execute(update(model).values(created_at=past, updated_at=past))
+        await session.commit()
+
+
+@pytest.mark.anyio
+async def test_database_now_is_naive_utc():
+    async with SessionLocal() as session:
+        now = await Repository(session, Project).database_now()
+    assert now.tzinfo is None
+    assert abs(now - datetime.utcnow()) < timedelta(minutes=1)
+
+
+@pytest.mark.anyio
+async def test_sync_returns_changes_and_tombstones_since_token(test_client):
+    headers = await auth_headers(test_client, "sync@example.com")
+    project = await test_client.post("/api/projects/", headers=headers, json={"name": "Sync"})
+    project_id = project.json()["id"]
+    entry_ids = []
+    for index in range(3):
+        response = await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project_id,
+                "started_at": f"2024-05-0{index + 1}T09:00:00",
+                "duration_minutes": 30,
+            },
+        )
+        entry_ids.append(response.json()["id"])
+    # Created directly: the reminder endpoint schedules a Celery task.
+    async with SessionLocal() as session:
+        reminder = Reminder(
+            user_id=response.json()["user_id"],
+            label="Log time",
+            cron_expression="0 17 * * 1-5",
+        )
+        session.add(reminder)
+        await session.commit()
+        reminder_id = reminder.id
+
+    snapshot = await test_client.get("/api/sync/changes", headers=headers)
+    assert snapshot.status_code == 200
+    body = snapshot.json()
+    assert body["full"] is True
+    assert sorted(entry["id"] for entry in body["time_entries"]) == entry_ids
+    assert [item["id"] for item in body["projects"]] == [project_id]
+    assert [item["id"] for item in body["reminders"]] == [reminder_id]
+    token = body["token"]
+
+    await _age_rows(hours=1)
+    await test_client.patch(
+        f"/api/time-entries/{entry_ids[0]}", headers=headers, json={"duration_minutes": 45}
+    )
+    await test_client.delete(f"/api/time-entries/{entry_ids[1]}", headers=headers)
+    await test_client.delete(f"/api/reminders/{reminder_id}", headers=headers)
+    bulk = await test_client.post(
+        "/api/time-entries:bulk",
+        headers=headers,
+        json={"operations": [{"op": "delete", "id": entry_ids[2]}]},
+    )
+    assert bulk.json()["results"][0]["status"] == 204
+
+    delta = await test_client.get("/api/sync/changes", headers=headers, params={"since": token})
+    body = delta.json()
+    assert body["full"] is False
+    assert [entry["id"] for entry in body["time_entries"]] == [entry_ids[0]]
+    assert body["time_entries"][0]["duration_minutes"] == 45
+    assert body["projects"] == []
+    assert body["reminders"] == []
+    assert body["deleted"] == {
+        "time_entries": [entry_ids[1], entry_ids[2]],
+        "reminders": [reminder_id],
+    }
+
+    other = await auth_headers(test_client, "sync-other@example.com")
+    foreign = await test_client.get("/api/sync/changes", headers=other, params={"since": token})
+    assert foreign.json()["time_entries"] == []
+    assert foreign.json()["deleted"]["time_entries"] == []
+
+    # Tokens minted from an aware clock (asyncpg) are compared as naive UTC.
+    aware = encode_sync_token(decode_sync_token(token).replace(tzinfo=timezone.utc))
+    delta = await test_client.get("/api/sync/changes", headers=headers, params={"since": aware})
+    assert [entry["id"] for entry in delta.json()["time_entries"]] == [entry_ids[0]]
+
+    invalid = await test_client.get(
+        "/api/sync/changes", headers=headers, params={"since": "not-a-token"}
+    )
+    assert invalid.status_code == 400
@@ -0,0 +1,125 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from app.core.db import SessionLocal
+from app.models import ChangeScope, TimeEntryDailyRollup
+from app.repositories.change_version_repository import ChangeVersionRepository
+from app.repositories.rollup_repository import TimeEntryRollupRepository
+from app.repositories.user_repository import UserRepository
+from tests.helpers import auth_headers
+
+
+async def _rollup_rows() -> set[tuple]:
+    async with SessionLocal() as session:
+        result = await session.execute(select(TimeEntryDailyRollup))
+        return {
+            (
+                row.user_id,
+                row.project_id,
+                row.day,
+                row.total_minutes,
+                row.billable_minutes,
+                round(float(row.billable_amount), 2),
+                row.entry_count,
+            )
+            for row in result.scalars()
+        }
+
+
+@pytest.mark.anyio
+async def test_rollups_follow_writes_and_match_rebuild(test_client):
+    headers = await auth_headers(test_client, "rollups@example.com")
+    project_ids = []
+    for name in ("Rollup A", "Rollup B"):
+        response = await test_client.post(
+            "/api/projects/", headers=headers, json={"name": name}
+        )
+        project_ids.append(response.json()["id"])
+
+    base = datetime(2024, 3, 4, 10, 0)
+    entry_ids = []
+    for offset, minutes, billable in ((0, 60, True), (0, 30, False), (1, 90, True)):
+        response = await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project_ids[0],
+                "started_at": (base + timedelta(days=offset)).isoformat(),
+                "duration_minutes": minutes,
+                "is_billable": billable,
+                "hourly_rate": 40,
+            },
+        )
+        entry_ids.append(response.json()["id"])
+
+    await test_client.patch(
+        f"/api/time-entries/{entry_ids[2]}",
+        headers=headers,
+        json={"project_id": project_ids[1], "started_at": (base + timedelta(days=2)).isoformat()},
+    )
+    await test_client.delete(f"/api/time-entries/{entry_ids[1]}", headers=headers)
+
+    maintained = await _rollup_rows()
+    user_id = next(iter(maintained))[0]
+    assert maintained == {
+        (user_id, project_ids[0], date(2024, 3, 4), 60, 60, 40.0, 1),
+        (user_id, project_ids[1], date(2024, 3, 6), 90, 90, 60.0, 1),
+    }
+
+    async with SessionLocal() as session:
+        versions = ChangeVersionRepository(session)
+        before = await versions.get_version(user_id, ChangeScope.TIME_ENTRIES)
+        await TimeEntryRollupRepository(session).rebuild(user_id)
+        await session.commit()
+        # Cached summaries and export keys built from the old rollups go stale.
+        assert await versions.get_version(user_id, ChangeScope.TIME_ENTRIES) == before + 1
+    assert await _rollup_rows() == maintained
+
+    summary = await test_client.post(
+        "/api/reports/summary",
+        headers=headers,
+        json={"date_from": "2024-03-01", "date_to": "2024-03-31"},
+    )
+    assert summary.json()["total_minutes"] == 150
+    edge_only = await test_client.post(
+        "/api/reports/summary",
+        headers=headers,
+        json={"date_from": "2024-03-06", "date_to": "2024-03-06"},
+    )
+    assert edge_only.json()["total_minutes"] == 90
+
+
+@pytest.mark.anyio
+async def test_rebuild_rounds_amounts_per_entry_like_incremental_updates(test_client):
+    headers = await auth_headers(test_client, "rollup-rounding@example.com")
+    project = await test_client.post("/api/projects/", headers=headers, json={"name": "Cents"})
+    for minute in range(3):
+        await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project.json()["id"],
+                "started_at": f"2024-03-04T10:0{minute}:00",
+                "duration_minutes": 1,
+                "hourly_rate": 10,
+            },
+        )
+
+    async def amounts() -> list[Decimal]:
+        async with SessionLocal() as session:
+            result = await session.scalars(select(TimeEntryDailyRollup.billable_amount))
+            return list(result)
+
+    # Each minute bills 0.1666666..., stored as 0.166667.
+    assert await amounts() == [Decimal("0.500001")]
+    async with SessionLocal() as session:
+        versions = ChangeVersionRepository(session)
+        user = await UserRepository(session).get_by_email("rollup-rounding@example.com")
+        before = await versions.get_version(user.id, ChangeScope.TIME_ENTRIES)
+        await TimeEntryRollupRepository(session).rebuild()
+        await session.commit()
+        assert await versions.get_version(user.id, ChangeScope.TIME_ENTRIES) == before + 1
+    assert await amounts() == [Decimal("0.500001")]
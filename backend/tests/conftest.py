@@ -11,6 +11,7 @@ os.environ.setdefault("SECRET_KEY", "test-secret")
 from app.core.db import engine  # noqa: E402  (env vars must be set first)
 from app.models import Base  # noqa: E402
 from app.main import app  # noqa: E402
+from app.services.report_cache import get_report_cache  # noqa: E402
 
 
 @pytest.fixture()
@@ -18,11 +19,14 @@ def anyio_backend() -> str:
     return "asyncio"
 
 
+# Requesting anyio_backend lets the anyio plugin run this fixture for plain
+# synchronous tests too.
 @pytest.fixture(autouse=True)
-async def reset_db() -> AsyncGenerator[None, None]:
+async def reset_db(anyio_backend) -> AsyncGenerator[None, None]:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+    get_report_cache().clear()
     yield
 
 
@@ -0,0 +1,165 @@
+"""Check that the hot list and sync queries use their intended indexes.
+
+Plans come from SQLite's ``EXPLAIN QUERY PLAN``, the only database the test
+suite runs against. PostgreSQL-only index behaviour is not verified here:
+the covering ``INCLUDE`` columns on ``ix_time_entries_user_project_started``,
+the GiST period index used by overlap checks, and the planner's choice of
+the partial reminder index.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, text, update
+
+from app.core.db import SessionLocal, get_engine
+from app.models import Project, Reminder, TimeEntry, User
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.reminder_repository import ReminderRepository
+from app.repositories.time_entry_repository import TimeEntryRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+
+START = datetime(2024, 1, 1)
+
+
+@contextmanager
+def captured_statements():
+    statements = []
+
+    def _capture(_conn, _cursor, statement, parameters, _context, _executemany):
+        statements.append((statement, parameters))
+
+    engine = get_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+
+async def query_plans(session, statements) -> list[str]:
+    connection = await session.connection()
+    plans = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        plans.append("\n".join(row[-1] for row in result))
+    return plans
+
+
+@pytest.fixture()
+async def seeded():
+    # A few users with a year of entries across many projects, so the planner
+    # has realistic statistics to choose between indexes.
+    async with SessionLocal() as session:
+        users = [
+            User(email=f"plan{index}@example.com", hashed_password="x") for index in range(3)
+        ]
+        session.add_all(users)
+        await session.flush()
+        projects = [
+            Project(owner_id=user.id, name=f"Project {index}", is_archived=index % 5 == 0)
+            for user in users
+            for index in range(20)
+        ]
+        reminders = [
+            Reminder(
+                user_id=user.id,
+                label=f"Reminder {index}",
+                cron_expression="0 17 * * 1-5",
+                is_active=index % 10 == 0,
+            )
+            for user in users
+            for index in range(100)
+        ]
+        session.add_all(projects + reminders)
+        await session.flush()
+        await TimeEntryRepository(session).bulk_insert(
+            [
+                {
+                    "user_id": project.owner_id,
+                    "project_id": project.id,
+                    "description": None,
+                    "started_at": START + timedelta(hours=7 * index + project.id),
+                    "ended_at": None,
+                    "duration_minutes": 30,
+                    "is_billable": True,
+                    "hourly_rate": 50,
+                }
+                for project in projects
+                for index in range(250)
+            ]
+        )
+        await session.commit()
+        await session.execute(text("ANALYZE"))
+        yield users[0], [project.id for project in projects if project.owner_id == users[0].id]
+
+
+@pytest.mark.anyio
+async def test_time_entry_pages_seek_the_user_started_index(seeded):
+    user, _ = seeded
+    async with SessionLocal() as session:
+        with captured_statements() as statements:
+            await TimeEntryRepository(session).list_page(
+                ["id", "started_at"],
+                user_id=user.id,
+                limit=100,
+                after=(START + timedelta(days=30), 0),
+                date_from=START,
+                date_to=START + timedelta(days=60),
+            )
+        (plan,) = await query_plans(session, statements)
+    assert "USING COVERING INDEX ix_time_entries_user_started_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.anyio
+async def test_project_filtered_totals_use_the_user_project_index(seeded):
+    user, project_ids = seeded
+    async with SessionLocal() as session:
+        with captured_statements() as statements:
+            await TimeEntryRepository(session).aggregate_by_project(
+                user_id=user.id,
+                project_ids=project_ids[:2],
+                start=START + timedelta(hours=6),
+                end=START + timedelta(days=1, hours=12),
+            )
+        (plan,) = await query_plans(session, statements)
+    assert "USING INDEX ix_time_entries_user_project_started" in plan
+    assert "SCAN time_entries" not in plan
+
+
+@pytest.mark.anyio
+async def test_project_and_reminder_lists_use_composite_and_partial_indexes(seeded):
+    user, _ = seeded
+    async with SessionLocal() as session:
+        with captured_statements() as statements:
+            await ProjectRepository(session).list_rows_by_owner(user.id, ["id", "name"])
+            await ReminderRepository(session).list_active_rows_by_user(user.id, ["id"])
+            await ReminderRepository(session).list_all_active()
+        projects, reminders, all_reminders = await query_plans(session, statements)
+    assert "USING INDEX ix_projects_owner_archived" in projects
+    assert "ix_reminders_active_user" in reminders
+    assert "ix_reminders_active_user" in all_reminders
+
+
+@pytest.mark.anyio
+async def test_sync_deltas_seek_the_updated_at_indexes(seeded):
+    user, _ = seeded
+    since = datetime.utcnow() - timedelta(minutes=5)
+    async with SessionLocal() as session:
+        # Most of an account is old; a sync only touches what changed lately.
+        for model in (TimeEntry, Project, Reminder):
+            await session.execute(update(model).values(updated_at=START))
+        await session.commit()
+        await session.execute(text("ANALYZE"))
+        with captured_statements() as statements:
+            await TimeEntryRepository(session).list_changed_rows(user.id, ["id"], since)
+            await ProjectRepository(session).list_changed_rows(user.id, ["id"], since)
+            await ReminderRepository(session).list_changed_rows(user.id, ["id"], since)
+            await TombstoneRepository(session).list_since(user.id, since)
+        plans = await query_plans(session, statements)
+    assert "ix_time_entries_user_updated" in plans[0]
+    assert "ix_projects_owner_updated" in plans[1]
+    assert "ix_reminders_user_updated" in plans[2]
+    assert "ix_tombstones_user_created" in plans[3]
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from app.core.db import SessionLocal
+from app.models import ReportExport
+from app.repositories.report_repository import ReportExportRepository
+from app.repositories.user_repository import UserRepository
+from tests.helpers import auth_headers
+
+
+def _export(user_id, date_from, date_to, *, format="csv", detailed=False, status="pending"):
+    return ReportExport(
+        user_id=user_id,
+        date_from=date_from,
+        date_to=date_to,
+        format=format,
+        detailed=detailed,
+        status=status,
+    )
+
+
+@pytest.mark.anyio
+async def test_claim_batch_coalesces_overlapping_summary_exports(test_client):
+    await auth_headers(test_client, "coalesce@example.com")
+    await auth_headers(test_client, "someone@example.com")
+
+    async with SessionLocal() as session:
+        users = UserRepository(session)
+        user_id = (await users.get_by_email("coalesce@example.com")).id
+        other_id = (await users.get_by_email("someone@example.com")).id
+        exports = {
+            "seed_pdf": _export(user_id, "2024-03-01", "2024-03-31", format="pdf"),
+            "same_csv": _export(user_id, "2024-03-01", "2024-03-31"),
+            "overlap": _export(user_id, "2024-03-15", "2024-04-15"),
+            "disjoint": _export(user_id, "2024-05-01", "2024-05-31"),
+            "detailed": _export(user_id, "2024-03-01", "2024-03-31", detailed=True),
+            "running": _export(user_id, "2024-03-01", "2024-03-31", status="processing"),
+            "other_user": _export(other_id, "2024-03-01", "2024-03-31"),
+        }
+        session.add_all(exports.values())
+        await session.commit()
+        ids = {name: export.id for name, export in exports.items()}
+
+    async with SessionLocal() as session:
+        repo = ReportExportRepository(session)
+        claimed = await repo.claim_batch(ids["seed_pdf"], limit=20)
+        await session.commit()
+        assert [export.id for export in claimed] == [
+            ids["seed_pdf"], ids["same_csv"], ids["overlap"]
+        ]
+        assert {export.status for export in claimed} == {"processing"}
+
+        # Exports claimed by the first pass are no-ops for their own tasks.
+        assert await repo.claim_batch(ids["same_csv"], limit=20) == []
+        detailed = await repo.claim_batch(ids["detailed"], limit=20)
+        assert [export.id for export in detailed] == [ids["detailed"]]
+        limited = await repo.claim_batch(ids["disjoint"], limit=1)
+        assert [export.id for export in limited] == [ids["disjoint"]]
+        await session.commit()
+
+        other = await session.get(ReportExport, ids["other_user"])
+        assert other.status == "pending"
+
+
+@pytest.mark.anyio
+async def test_fail_stale_claims_only_fails_silent_processing_exports(test_client):
+    await auth_headers(test_client, "stale@example.com")
+
+    async with SessionLocal() as session:
+        user_id = (await UserRepository(session).get_by_email("stale@example.com")).id
+        exports = {
+            "stale": _export(user_id, "2024-03-01", "2024-03-31", status="processing"),
+            "running": _export(user_id, "2024-03-01", "2024-03-31", status="processing"),
+            "pending": _export(user_id, "2024-03-01", "2024-03-31"),
+        }
+        session.add_all(exports.values())
+        await session.commit()
+        ids = {name: export.id for name, export in exports.items()}
+        an_hour_ago = datetime.utcnow() - timedelta(hours=1)
+        await session.execute(
+            update(ReportExport)
+            .where(ReportExport.id.in_([ids["stale"], ids["pending"]]))
+            .values(updated_at=an_hour_ago)
+        )
+        await session.commit()
+
+    async with SessionLocal() as session:
+        repo = ReportExportRepository(session)
+        failed = await repo.fail_stale_claims(datetime.utcnow() - timedelta(minutes=15))
+        await session.commit()
+        assert failed == [ids["stale"]]
+        statuses = {
+            name: (await session.get(ReportExport, export_id)).status
+            for name, export_id in ids.items()
+        }
+        assert statuses == {"stale": "failed", "running": "processing", "pending": "pending"}
@@ -0,0 +1,62 @@
+import pytest
+
+from app.core.db import SessionLocal
+from app.models import ReportExport
+from app.repositories.user_repository import UserRepository
+from app.schemas.report import ExportRead, ExportRequest
+from app.services import exporters
+from app.services.export_progress import ExportProgress
+from app.services.report_service import ReportService
+from tests.helpers import auth_headers
+
+
+@pytest.mark.anyio
+async def test_export_progress_is_recorded_while_streaming(test_client, tmp_path, monkeypatch):
+    monkeypatch.setattr(exporters, "EXPORT_DIR", tmp_path)
+    headers = await auth_headers(test_client, "progress@example.com")
+    project = await test_client.post("/api/projects/", headers=headers, json={"name": "P"})
+    for hour in range(6):
+        await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project.json()["id"],
+                "started_at": f"2024-02-01T{hour:02d}:00:00",
+                "duration_minutes": 30,
+            },
+        )
+
+    async with SessionLocal() as session:
+        user = await UserRepository(session).get_by_email("progress@example.com")
+        export = ReportExport(
+            user_id=user.id,
+            date_from="2024-02-01",
+            date_to="2024-02-01",
+            format="csv",
+            detailed=True,
+        )
+        session.add(export)
+        await session.commit()
+
+        service = ReportService(session)
+        payload = ExportRequest(date_from="2024-02-01", date_to="2024-02-01", detailed=True)
+        progress = ExportProgress(
+            export.id,
+            exporters.export_file_path("progress.csv"),
+            rows_total=await service.estimate_export_rows(user, payload),
+            interval=0,
+        )
+        await progress.start()
+        seen = []
+        async for batch in progress.track(service.stream_entries(user, payload, batch_size=2)):
+            async with SessionLocal() as probe:
+                seen.append((await probe.get(ReportExport, export.id)).rows_processed)
+        await progress.flush()
+
+    async with SessionLocal() as session:
+        stored = ExportRead.model_validate(await session.get(ReportExport, export.id))
+    assert seen == [0, 2, 4]
+    assert stored.rows_total == 6
+    assert stored.rows_processed == 6
+    assert stored.started_at is not None
+    assert stored.eta_at >= stored.started_at
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.config import get_settings
+from app.core.db import SessionLocal
+from app.models import ReportExport
+from app.repositories.user_repository import UserRepository
+from app.services import exporters
+from app.services.export_retention import ExportRetentionService
+from tests.helpers import auth_headers
+
+
+async def _stored_export(session, user_id, name, size, *, created_at, accessed_at=None):
+    path = exporters.export_chunks(["x" * size], exporters.sharded_filename(name))
+    export = ReportExport(
+        user_id=user_id,
+        date_from="2024-01-01",
+        date_to="2024-01-31",
+        format="csv",
+        status="completed",
+        file_path=path,
+        size_bytes=size,
+        created_at=created_at,
+        last_accessed_at=accessed_at,
+    )
+    session.add(export)
+    return export
+
+
+@pytest.mark.anyio
+async def test_eviction_applies_ttl_then_quotas_least_recently_used_first(
+    test_client, tmp_path, monkeypatch
+):
+    settings = get_settings()
+    monkeypatch.setattr(exporters, "EXPORT_DIR", tmp_path)
+    monkeypatch.setattr(settings, "export_ttl_hours", 24)
+    monkeypatch.setattr(settings, "export_user_quota_bytes", 250)
+    monkeypatch.setattr(settings, "export_total_quota_bytes", 300)
+    await auth_headers(test_client, "first@example.com")
+    await auth_headers(test_client, "second@example.com")
+    now = datetime(2024, 3, 1, 12, 0)
+
+    async with SessionLocal() as session:
+        users = UserRepository(session)
+        first = (await users.get_by_email("first@example.com")).id
+        second = (await users.get_by_email("second@example.com")).id
+        stale = await _stored_export(
+            session, first, "stale.csv", 50, created_at=now - timedelta(days=2)
+        )
+        old_download = await _stored_export(
+            session, first, "a.csv", 100,
+            created_at=now - timedelta(hours=3), accessed_at=now - timedelta(hours=2),
+        )
+        recent_download = await _stored_export(
+            session, first, "b.csv", 100,
+            created_at=now - timedelta(hours=5), accessed_at=now - timedelta(minutes=5),
+        )
+        never_downloaded = await _stored_export(
+            session, first, "c.csv", 100, created_at=now - timedelta(hours=1)
+        )
+        other_user = await _stored_export(
+            session, second, "d.csv", 150, created_at=now - timedelta(hours=4)
+        )
+        await session.commit()
+        stale_path = stale.file_path
+
+        result = await ExportRetentionService(session).evict(now=now)
+
+        statuses = {
+            name: export.status
+            for name, export in {
+                "stale": stale,
+                "old_download": old_download,
+                "recent_download": recent_download,
+                "never_downloaded": never_downloaded,
+                "other_user": other_user,
+            }.items()
+        }
+
+    # TTL drops the stale file, the user quota (250) drops the oldest
+    # last use, and the global quota (300) then evicts the other user's file.
+    assert statuses == {
+        "stale": "expired",
+        "old_download": "expired",
+        "recent_download": "completed",
+        "never_downloaded": "completed",
+        "other_user": "expired",
+    }
+    assert result.expired == 3
+    assert result.freed_bytes == 300
+    assert not (tmp_path / stale_path).exists()
+    assert stale.file_path is None
+    assert len(list(tmp_path.rglob("*.csv"))) == 2
+
+
+@pytest.mark.anyio
+async def test_eviction_keeps_files_when_the_commit_fails(test_client, tmp_path, monkeypatch):
+    monkeypatch.setattr(exporters, "EXPORT_DIR", tmp_path)
+    monkeypatch.setattr(get_settings(), "export_ttl_hours", 24)
+    await auth_headers(test_client, "rollback@example.com")
+    now = datetime(2024, 3, 1, 12, 0)
+
+    async with SessionLocal() as session:
+        user_id = (await UserRepository(session).get_by_email("rollback@example.com")).id
+        stale = await _stored_export(
+            session, user_id, "kept.csv", 50, created_at=now - timedelta(days=2)
+        )
+        await session.commit()
+        stale_path = stale.file_path
+
+        async def failing_commit():
+            raise RuntimeError("database went away")
+
+        monkeypatch.setattr(session, "commit", failing_commit)
+        with pytest.raises(RuntimeError):
+            await ExportRetentionService(session).evict(now=now)
+
+    assert (tmp_path / stale_path).exists()
@@ -0,0 +1,178 @@
+import csv
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.db import SessionLocal
+from app.repositories.user_repository import UserRepository
+from app.schemas.report import ReportFilters, ReportResponse, ReportSummary
+from app.services import exporters
+from app.services.report_service import ReportService
+from tests.helpers import auth_headers
+
+
+@pytest.mark.anyio
+async def test_csv_export_includes_billable_amounts(tmp_path, monkeypatch):
+    monkeypatch.setattr(exporters, "EXPORT_DIR", tmp_path)
+    report = ReportResponse(
+        summary=[
+            ReportSummary(
+                project_id=1,
+                project_name="Alpha",
+                total_minutes=90,
+                total_billable_minutes=60,
+                billable_amount=Decimal("50.00"),
+            )
+        ],
+        total_minutes=90,
+        total_billable_minutes=60,
+        total_billable_amount=Decimal("50.00"),
+    )
+
+    path = exporters.export_to_csv(report, "report.csv")
+
+    lines = (tmp_path / "report.csv").read_text(encoding="utf-8").splitlines()
+    assert path == str(tmp_path / "report.csv")
+    assert lines[0].endswith(",billable_amount")
+    assert lines[1] == "1,Alpha,90,60,50.00"
+    assert lines[-1] == "TOTAL,,90,60,50.00"
+
+
+@pytest.mark.anyio
+async def test_csv_export_quotes_project_names(tmp_path, monkeypatch):
+    monkeypatch.setattr(exporters, "EXPORT_DIR", tmp_path)
+    report = ReportResponse(
+        summary=[
+            ReportSummary(
+                project_id=7,
+                project_name='Acme, Inc. "Platform"',
+                total_minutes=30,
+                total_billable_minutes=30,
+            )
+        ],
+        total_minutes=30,
+        total_billable_minutes=30,
+    )
+
+    exporters.export_to_csv(report, "quoted.csv")
+
+    with (tmp_path / "quoted.csv").open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    assert rows[1][:3] == ["7", 'Acme, Inc. "Platform"', "30"]
+
+
+@pytest.mark.anyio
+async def test_detailed_csv_export_streams_entries(test_client, tmp_path, monkeypatch):
+    monkeypatch.setattr(exporters, "EXPORT_DIR", tmp_path)
+    headers = await auth_headers(test_client, "detailed@example.com")
+    project = await test_client.post(
+        "/api/projects/", headers=headers, json={"name": "Detail, Ltd"}
+    )
+    project_id = project.json()["id"]
+    for hour in range(5):
+        await test_client.post(
+            "/api/time-entries/",
+            headers=headers,
+            json={
+                "project_id": project_id,
+                "description": f"Task {hour}",
+                "started_at": f"2024-02-01T0{hour}:00:00",
+                "duration_minutes": 10 + hour,
+                "hourly_rate": 25,
+            },
+        )
+
+    async with SessionLocal() as session:
+        user = await UserRepository(session).get_by_email("detailed@example.com")
+        filters = ReportFilters(date_from="2024-02-01", date_to="2024-02-01")
+        batches = ReportService(session).stream_entries(user, filters, batch_size=2)
+        await exporters.export_stream(exporters.iter_detailed_csv(batches), "detailed.csv")
+
+    with (tmp_path / "detailed.csv").open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0] == exporters.DETAIL_HEADER
+    assert len(rows) == 6
+    assert rows[1][2:5] == ["Detail, Ltd", "Task 0", "2024-02-01T00:00:00"]
+    assert [row[6] for row in rows[1:]] == ["10", "11", "12", "13", "14"]
+
+
+@pytest.mark.anyio
+async def test_detailed_pdf_export_spans_pages(tmp_path, monkeypatch):
+    monkeypatch.setattr(exporters, "EXPORT_DIR", tmp_path)
+    rows = [
+        {
+            "id": index,
+            "project_id": 1,
+            "project_name": "Alpha",
+            "description": f"Task {index}",
+            "started_at": datetime(2024, 2, 1, 9, 0),
+            "ended_at": None,
+            "duration_minutes": 15,
+            "is_billable": True,
+            "hourly_rate": Decimal("40.00"),
+        }
+        for index in range(120)
+    ]
+
+    async def batches():
+        for start in range(0, len(rows), 50):
+            yield [SimpleNamespace(**row) for row in rows[start : start + 50]]
+
+    path = await exporters.export_detailed_pdf(batches(), "detailed.pdf")
+
+    content = (tmp_path / "detailed.pdf").read_bytes()
+    assert path == str(tmp_path / "detailed.pdf")
+    assert content.startswith(b"%PDF")
+    assert content.count(b"/Type /Page\n") + content.count(b"/Type /Page ") >= 3
+
+
+@pytest.mark.anyio
+async def test_detailed_parquet_export_keeps_column_types(tmp_path, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(exporters, "EXPORT_DIR", tmp_path)
+
+    async def batches():
+        for start in (0, 3):
+            yield [
+                SimpleNamespace(
+                    id=index,
+                    project_id=2,
+                    project_name="Beta",
+                    description=None,
+                    started_at=datetime(2024, 2, 1, 9, index),
+                    ended_at=None,
+                    duration_minutes=30,
+                    is_billable=index % 2 == 0,
+                    hourly_rate=Decimal("42.50") if index else None,
+                )
+                for index in range(start, start + 3)
+            ]
+
+    await exporters.export_detailed_parquet(batches(), "detailed.parquet")
+
+    parquet = pq.ParquetFile(tmp_path / "detailed.parquet")
+    assert parquet.metadata.num_row_groups == 2
+    assert parquet.schema_arrow.names == exporters.DETAIL_HEADER
+    table = parquet.read(columns=["entry_id", "started_at", "hourly_rate"])
+    assert str(table.schema.field("started_at").type) == "timestamp[us, tz=UTC]"
+    rows = table.to_pylist()
+    assert rows[0]["hourly_rate"] is None
+    assert rows[1]["hourly_rate"] == Decimal("42.50")
+    assert rows[5]["started_at"].replace(tzinfo=None) == datetime(2024, 2, 1, 9, 5)
+
+
+@pytest.mark.anyio
+async def test_pdf_cells_wrap_and_mark_truncated_text():
+    from app.services.pdf_renderer import MAX_CELL_LINES, cell_lines
+
+    description = "Refactored the billing export " * 4
+    lines = cell_lines(description, 100)
+    assert len(lines) > 1
+    assert " ".join(lines).split() == description.split()
+    assert cell_lines("x" * 60, 100) == ["x" * 25, "x" * 25, "x" * 10]
+
+    truncated = cell_lines(description * 10, 100)
+    assert len(truncated) == MAX_CELL_LINES
+    assert truncated[-1].endswith(" …")
@@ -0,0 +1,35 @@
+import pytest
+
+from app.schemas.report import ReportFilters
+from app.services.report_cache import ReportCache, report_cache_key
+
+
+@pytest.mark.anyio
+async def test_report_cache_evicts_least_recently_used():
+    cache = ReportCache(max_entries=2, ttl_seconds=60)
+    await cache.set("a", "1")
+    await cache.set("b", "2")
+    assert await cache.get("a") == "1"
+    await cache.set("c", "3")
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == "1"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.anyio
+async def test_report_cache_expires_entries():
+    cache = ReportCache(max_entries=2, ttl_seconds=0)
+    await cache.set("a", "1")
+    assert await cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+@pytest.mark.anyio
+async def test_report_cache_key_normalizes_filters():
+    first = ReportFilters(project_ids=[3, 1, 3], date_from="2024-01-01", date_to="2024-01-31")
+    second = ReportFilters(project_ids=[1, 3], date_from="2024-01-01", date_to="2024-01-31")
+    assert report_cache_key(1, (1, 2), first) == report_cache_key(1, (1, 2), second)
+    assert report_cache_key(1, (2, 2), first) != report_cache_key(1, (1, 2), first)
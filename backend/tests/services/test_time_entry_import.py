@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from app.core.config import get_settings
+from app.core.db import SessionLocal
+from app.models import TimeEntryImport
+from app.repositories.user_repository import UserRepository
+from app.services.import_jobs import import_time_entries
+from tests.helpers import auth_headers
+
+CSV_ROWS = """project_name,description,started_at,duration_minutes,is_billable,hourly_rate
+Legacy,First,2024-01-02T09:00:00,30,true,60
+legacy,Second,2024-01-02T10:00:00+02:00,15,false,
+Support,Third,2024-01-03T09:00:00,-5,true,
+Support,Fourth,not-a-date,10,true,
+Support,Fifth,2024-01-04T09:00:00,45,yes,
+Abandoned,Sixth,2024-01-05T09:00:00,0,true,
+"""
+
+
+async def _create_import(user_id, path, import_format):
+    async with SessionLocal() as session:
+        record = TimeEntryImport(
+            user_id=user_id, format=import_format, file_path=str(path), errors=[]
+        )
+        session.add(record)
+        await session.commit()
+        return record.id
+
+
+@pytest.mark.anyio
+async def test_csv_import_resolves_projects_and_records_errors(
+    test_client, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(get_settings(), "import_batch_size", 2)
+    headers = await auth_headers(test_client, "import@example.com")
+    await test_client.post("/api/projects/", headers=headers, json={"name": "Legacy"})
+    path = tmp_path / "entries.csv"
+    path.write_text(CSV_ROWS, encoding="utf-8")
+
+    async with SessionLocal() as session:
+        user = await UserRepository(session).get_by_email("import@example.com")
+    import_id = await _create_import(user.id, path, "csv")
+
+    await import_time_entries(import_id)
+    assert not path.exists()
+
+    response = await test_client.get(f"/api/time-entries/imports/{import_id}", headers=headers)
+    record = response.json()
+    assert record["status"] == "completed"
+    assert record["rows_processed"] == 6
+    assert record["rows_imported"] == 3
+    assert record["batches_completed"] == 3
+    # "Abandoned" only appears on a rejected row, so it is never created.
+    assert record["projects_created"] == 1
+    assert [error["line"] for error in record["errors"]] == [4, 5, 7]
+    assert "duration_minutes" in record["errors"][0]["error"]
+
+    entries = (await test_client.get("/api/time-entries/", headers=headers)).json()
+    projects = (await test_client.get("/api/projects/", headers=headers)).json()
+    assert sorted(project["name"] for project in projects) == ["Legacy", "Support"]
+    by_description = {entry["description"]: entry for entry in entries}
+    assert by_description["Second"]["started_at"] == "2024-01-02T08:00:00"
+    assert by_description["First"]["project_id"] == by_description["Second"]["project_id"]
+
+    summary = await test_client.post(
+        "/api/reports/summary",
+        headers=headers,
+        json={"date_from": "2024-01-01", "date_to": "2024-01-31"},
+    )
+    assert summary.json()["total_minutes"] == 90
+    assert summary.json()["total_billable_amount"] == "30.00"
+
+
+@pytest.mark.anyio
+async def test_ndjson_import_checks_project_ownership(test_client, tmp_path):
+    headers = await auth_headers(test_client, "ndjson-import@example.com")
+    other = await auth_headers(test_client, "ndjson-other@example.com")
+    own = (await test_client.post("/api/projects/", headers=headers, json={"name": "Own"})).json()
+    foreign = (await test_client.post("/api/projects/", headers=other, json={"name": "X"})).json()
+    lines = [
+        json.dumps(
+            {"project_id": own["id"], "started_at": "2024-02-01T09:00:00", "duration_minutes": 20}
+        ),
+        json.dumps(
+            {
+                "project_id": foreign["id"],
+                "started_at": "2024-02-01T10:00:00",
+                "duration_minutes": 20,
+            }
+        ),
+        "{not json",
+        "",
+    ]
+    path = tmp_path / "entries.ndjson"
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+    async with SessionLocal() as session:
+        user = await UserRepository(session).get_by_email("ndjson-import@example.com")
+    import_id = await _create_import(user.id, path, "ndjson")
+
+    await import_time_entries(import_id)
+
+    record = (
+        await test_client.get(f"/api/time-entries/imports/{import_id}", headers=headers)
+    ).json()
+    assert record["rows_imported"] == 1
+    assert record["errors"] == [
+        {"line": 2, "error": "Project not found"},
+        {"line": 3, "error": "Invalid JSON"},
+    ]
+
+
+@pytest.mark.anyio
+async def test_import_upload_rejects_unknown_formats(test_client):
+    headers = await auth_headers(test_client, "import-format@example.com")
+    response = await test_client.post(
+        "/api/time-entries/imports",
+        headers=headers,
+        files={"file": ("entries.xlsx", b"binary", "application/octet-stream")},
+    )
+    assert response.status_code == 400
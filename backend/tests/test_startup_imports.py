@@ -0,0 +1,35 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ["reportlab", "pyarrow", "asyncpg", "app.services.pdf_renderer"]
+
+
+def _loaded_after_import(module: str, candidates: list[str]) -> list[str]:
+    # A fresh interpreter, so modules already imported by the test run don't count.
+    script = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {candidates!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [name for name in completed.stdout.strip().split(",") if name]
+
+
+@pytest.mark.parametrize(
+    ("module", "deferred"),
+    [
+        ("app.main", HEAVY_MODULES),
+        ("app.celery.tasks", [*HEAVY_MODULES, "app.services.report_service"]),
+    ],
+)
+def test_entry_points_defer_heavy_imports(module, deferred):
+    assert _loaded_after_import(module, deferred) == []
@@ -20,7 +20,12 @@ import {
   useToast,
 } from '@chakra-ui/react'
 import { zodResolver } from '@hookform/resolvers/zod'
-import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
+import {
+  useInfiniteQuery,
+  useMutation,
+  useQuery,
+  useQueryClient,
+} from '@tanstack/react-query'
 import { differenceInMinutes, parseISO } from 'date-fns'
 import { useEffect, useState } from 'react'
 import { useForm, useWatch } from 'react-hook-form'
@@ -47,6 +52,7 @@ const schema = z.object({
 type TimeEntryFormValues = z.infer<typeof schema>
 
 const rangeDefaults = defaultReportRange()
+const PAGE_SIZE = 100
 
 export function TimeEntriesPage() {
   const toast = useToast()
@@ -64,10 +70,10 @@ export function TimeEntriesPage() {
     queryFn: projectsApi.list,
   })
 
-  const entriesQuery = useQuery({
+  const entriesQuery = useInfiniteQuery({
     queryKey: queryKeys.timeEntries(filtersKey),
-    queryFn: () =>
-      timeEntriesApi.list({
+    queryFn: ({ pageParam }) =>
+      timeEntriesApi.listPage({
         project_ids: filters.projectId === 'all' ? undefined : [Number(filters.projectId)],
         date_from: filters.date_from
           ? new Date(`${filters.date_from}T00:00:00`).toISOString()
@@ -75,8 +81,13 @@ export function TimeEntriesPage() {
         date_to: filters.date_to
           ? new Date(`${filters.date_to}T23:59:59`).toISOString()
           : undefined,
+        limit: PAGE_SIZE,
+        cursor: pageParam,
       }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.nextCursor ?? undefined,
   })
+  const entries = entriesQuery.data?.pages.flatMap((page) => page.items) ?? []
 
   const {
     register,
@@ -267,7 +278,7 @@ export function TimeEntriesPage() {
             </Tr>
           </Thead>
           <Tbody>
-            {entriesQuery.data?.map((entry) => (
+            {entries.map((entry) => (
               <Tr key={entry.id}>
                 <Td>
                   {
@@ -283,7 +294,17 @@ export function TimeEntriesPage() {
             ))}
           </Tbody>
         </Table>
-        {!entriesQuery.data?.length && (
+        {entriesQuery.hasNextPage && (
+          <Button
+            mt={4}
+            variant="outline"
+            onClick={() => entriesQuery.fetchNextPage()}
+            isLoading={entriesQuery.isFetchingNextPage}
+          >
+            Load more
+          </Button>
+        )}
+        {!entries.length && (
           <Text mt={4} color="gray.500">
             No entries match your filters yet.
           </Text>
@@ -5,21 +5,48 @@ export interface TimeEntryFilters {
   project_ids?: number[]
   date_from?: string
   date_to?: string
+  limit?: number
+  cursor?: string
+}
+
+export interface TimeEntryPage {
+  items: TimeEntry[]
+  nextCursor: string | null
+}
+
+const buildListUrl = (filters: TimeEntryFilters) => {
+  const params = new URLSearchParams()
+  if (filters.project_ids) {
+    filters.project_ids.forEach((id) => params.append('project_ids', String(id)))
+  }
+  if (filters.date_from) params.set('date_from', filters.date_from)
+  if (filters.date_to) params.set('date_to', filters.date_to)
+  if (filters.limit) params.set('limit', String(filters.limit))
+  if (filters.cursor) params.set('cursor', filters.cursor)
+  const query = params.toString()
+  return query ? `/time-entries?${query}` : '/time-entries'
+}
+
+const MAX_PAGE_SIZE = 1000
+
+const fetchPage = async (filters: TimeEntryFilters): Promise<TimeEntryPage> => {
+  const { data, headers } = await apiClient.get<TimeEntry[]>(buildListUrl(filters))
+  return { items: data, nextCursor: headers['x-next-cursor'] ?? null }
 }
 
 export const timeEntriesApi = {
+  // Follows X-Next-Cursor to the end, so callers get every matching entry.
   list: async (filters: TimeEntryFilters = {}): Promise<TimeEntry[]> => {
-    const params = new URLSearchParams()
-    if (filters.project_ids) {
-      filters.project_ids.forEach((id) => params.append('project_ids', String(id)))
-    }
-    if (filters.date_from) params.set('date_from', filters.date_from)
-    if (filters.date_to) params.set('date_to', filters.date_to)
-    const query = params.toString()
-    const url = query ? `/time-entries?${query}` : '/time-entries'
-    const { data } = await apiClient.get<TimeEntry[]>(url)
-    return data
+    const entries: TimeEntry[] = []
+    let cursor: string | undefined
+    do {
+      const page = await fetchPage({ ...filters, limit: MAX_PAGE_SIZE, cursor })
+      entries.push(...page.items)
+      cursor = page.nextCursor ?? undefined
+    } while (cursor)
+    return entries
   },
+  listPage: fetchPage,
   create: async (payload: TimeEntryPayload): Promise<TimeEntry> => {
     const { data } = await apiClient.post<TimeEntry>('/time-entries', payload)
     return data